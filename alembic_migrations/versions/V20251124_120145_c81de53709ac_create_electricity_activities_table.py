@@ -81,16 +81,9 @@ def upgrade() -> None:
         ["date", "country"],
         unique=False,
     )
-    op.create_index(
-        "ix_electricity_activities_date_desc",
-        "electricity_activities",
-        ["date"],
-        unique=False,
-    )
 
 
 def downgrade() -> None:
-    op.drop_index("ix_electricity_activities_date_desc", table_name="electricity_activities")
     op.drop_index("ix_electricity_activities_date_country", table_name="electricity_activities")
     op.drop_index(op.f("ix_electricity_activities_date"), table_name="electricity_activities")
     op.drop_index(op.f("ix_electricity_activities_country"), table_name="electricity_activities")
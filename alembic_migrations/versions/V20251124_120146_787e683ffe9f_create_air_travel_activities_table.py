@@ -87,12 +87,6 @@ def upgrade() -> None:
         ["flight_range"],
         unique=False,
     )
-    op.create_index(
-        "ix_air_travel_activities_date_desc",
-        "air_travel_activities",
-        ["date"],
-        unique=False,
-    )
     op.create_index(
         "ix_air_travel_activities_date_range",
         "air_travel_activities",
@@ -103,7 +97,6 @@ def upgrade() -> None:
 
 def downgrade() -> None:
     op.drop_index("ix_air_travel_activities_date_range", table_name="air_travel_activities")
-    op.drop_index("ix_air_travel_activities_date_desc", table_name="air_travel_activities")
     op.drop_index(
         op.f("ix_air_travel_activities_flight_range"),
         table_name="air_travel_activities",
@@ -81,12 +81,6 @@ def upgrade() -> None:
         ["supplier_category"],
         unique=False,
     )
-    op.create_index(
-        "ix_goods_services_activities_date_desc",
-        "goods_services_activities",
-        ["date"],
-        unique=False,
-    )
     op.create_index(
         "ix_goods_services_activities_date_category",
         "goods_services_activities",
@@ -100,10 +94,6 @@ def downgrade() -> None:
         "ix_goods_services_activities_date_category",
         table_name="goods_services_activities",
     )
-    op.drop_index(
-        "ix_goods_services_activities_date_desc",
-        table_name="goods_services_activities",
-    )
     op.drop_index(
         op.f("ix_goods_services_activities_supplier_category"),
         table_name="goods_services_activities",
@@ -6,7 +6,6 @@ Create Date: 2025-11-25 01:55:30.000000
 
 """
 
-import sqlalchemy as sa
 from alembic import op
 
 # revision identifiers, used by Alembic.
@@ -17,32 +16,30 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Add index on emission_factors (scope, category) for filtering
-    op.create_index(
-        "ix_emission_factors_scope_category",
-        "emission_factors",
-        ["scope", "category"],
-        unique=False,
-    )
-
-    # Add index on emission_results (co2e_tonnes) for sorting
-    op.create_index(
-        "ix_emission_results_co2e_tonnes",
-        "emission_results",
-        ["co2e_tonnes"],
-        unique=False,
-    )
-
-    # Add index on emission_results (emission_factor_id) for joins
-    op.create_index(
-        "ix_emission_results_emission_factor_id",
-        "emission_results",
-        ["emission_factor_id"],
-        unique=False,
-    )
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so the
+    # builds run in autocommit mode and do not block writes on live tables.
+    with op.get_context().autocommit_block():
+        # Add index on emission_factors (scope, category) for filtering
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emission_factors_scope_category "
+            "ON emission_factors (scope, category)"
+        )
+
+        # Add index on emission_results (co2e_tonnes) for sorting
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emission_results_co2e_tonnes "
+            "ON emission_results (co2e_tonnes)"
+        )
+
+        # Add index on emission_results (emission_factor_id) for joins
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emission_results_emission_factor_id "
+            "ON emission_results (emission_factor_id)"
+        )
 
 
 def downgrade() -> None:
-    op.drop_index("ix_emission_results_emission_factor_id", table_name="emission_results")
-    op.drop_index("ix_emission_results_co2e_tonnes", table_name="emission_results")
-    op.drop_index("ix_emission_factors_scope_category", table_name="emission_factors")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_emission_results_emission_factor_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_emission_results_co2e_tonnes")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_emission_factors_scope_category")
@@ -80,87 +80,9 @@ def upgrade() -> None:
         comment="Pre-aggregated emission summaries for efficient querying",
     )
 
-    # Create indexes for efficient querying
-    op.create_index(
-        "ix_emission_summaries_from_date",
-        "emission_summaries",
-        ["from_date"],
-        unique=False,
-    )
-    op.create_index(
-        "ix_emission_summaries_to_date",
-        "emission_summaries",
-        ["to_date"],
-        unique=False,
-    )
-    op.create_index(
-        "ix_emission_summaries_scope",
-        "emission_summaries",
-        ["scope"],
-        unique=False,
-    )
-    op.create_index(
-        "ix_emission_summaries_category",
-        "emission_summaries",
-        ["category"],
-        unique=False,
-    )
-    op.create_index(
-        "ix_emission_summaries_activity_type",
-        "emission_summaries",
-        ["activity_type"],
-        unique=False,
-    )
-
-    # Composite indexes for common query patterns
-    op.create_index(
-        "ix_emission_summaries_date_scope_category",
-        "emission_summaries",
-        ["from_date", "to_date", "scope", "category"],
-        unique=False,
-    )
-    op.create_index(
-        "ix_emission_summaries_date_activity",
-        "emission_summaries",
-        ["from_date", "to_date", "activity_type"],
-        unique=False,
-    )
-    op.create_index(
-        "ix_emission_summaries_scope_category_activity",
-        "emission_summaries",
-        ["scope", "category", "activity_type"],
-        unique=False,
-    )
-
-    # Unique constraint to prevent duplicate summaries
-    op.create_index(
-        "ix_emission_summaries_unique_period",
-        "emission_summaries",
-        ["from_date", "to_date", "scope", "category", "activity_type"],
-        unique=True,
-        postgresql_where=sa.text("activity_type IS NOT NULL"),
-    )
+    # Indexes are built in the follow-up revision 570abe19ef77 with
+    # CREATE INDEX CONCURRENTLY, outside this DDL transaction.
 
 
 def downgrade() -> None:
-    op.drop_index(
-        "ix_emission_summaries_unique_period", table_name="emission_summaries"
-    )
-    op.drop_index(
-        "ix_emission_summaries_scope_category_activity",
-        table_name="emission_summaries",
-    )
-    op.drop_index(
-        "ix_emission_summaries_date_activity", table_name="emission_summaries"
-    )
-    op.drop_index(
-        "ix_emission_summaries_date_scope_category", table_name="emission_summaries"
-    )
-    op.drop_index(
-        "ix_emission_summaries_activity_type", table_name="emission_summaries"
-    )
-    op.drop_index("ix_emission_summaries_category", table_name="emission_summaries")
-    op.drop_index("ix_emission_summaries_scope", table_name="emission_summaries")
-    op.drop_index("ix_emission_summaries_to_date", table_name="emission_summaries")
-    op.drop_index("ix_emission_summaries_from_date", table_name="emission_summaries")
     op.drop_table("emission_summaries")
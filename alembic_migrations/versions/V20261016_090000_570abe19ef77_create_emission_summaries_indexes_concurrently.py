@@ -0,0 +1,56 @@
+"""create_emission_summaries_indexes_concurrently
+
+Revision ID: 570abe19ef77
+Revises: b7c8d9e0f1a2
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "570abe19ef77"
+down_revision = "b7c8d9e0f1a2"
+branch_labels = None
+depends_on = None
+
+
+# (index name, column list)
+INDEXES = [
+    ("ix_emission_summaries_from_date", "from_date"),
+    ("ix_emission_summaries_to_date", "to_date"),
+    ("ix_emission_summaries_scope", "scope"),
+    ("ix_emission_summaries_category", "category"),
+    ("ix_emission_summaries_activity_type", "activity_type"),
+    # Composite indexes for common query patterns
+    ("ix_emission_summaries_date_scope_category", "from_date, to_date, scope, category"),
+    ("ix_emission_summaries_date_activity", "from_date, to_date, activity_type"),
+    ("ix_emission_summaries_scope_category_activity", "scope, category, activity_type"),
+]
+
+
+def upgrade() -> None:
+    # Deployments that already ran b7c8d9e0f1a2 have these indexes, hence the
+    # IF NOT EXISTS. CONCURRENTLY keeps the summaries table writable while
+    # the indexes are built.
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON emission_summaries ({columns})"
+            )
+
+        # Unique constraint to prevent duplicate summaries
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "
+            "ix_emission_summaries_unique_period "
+            "ON emission_summaries (from_date, to_date, scope, category, activity_type) "
+            "WHERE activity_type IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_emission_summaries_unique_period")
+        for name, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,38 @@
+"""drop_redundant_activity_date_indexes
+
+Revision ID: d3bc816eb561
+Revises: 570abe19ef77
+Create Date: 2026-10-16 09:30:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d3bc816eb561"
+down_revision = "570abe19ef77"
+branch_labels = None
+depends_on = None
+
+# Single-column date indexes that are a prefix of each table's composite
+# (date, <column>) index, which already serves date range scans.
+ACTIVITY_TABLES = [
+    "electricity_activities",
+    "air_travel_activities",
+    "goods_services_activities",
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in ACTIVITY_TABLES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_date_desc")
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_date")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in ACTIVITY_TABLES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_date ON {table} (date)"
+            )
@@ -0,0 +1,52 @@
+"""convert_json_columns_to_jsonb
+
+Revision ID: 49f88cf3b46e
+Revises: d3bc816eb561
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "49f88cf3b46e"
+down_revision = "d3bc816eb561"
+branch_labels = None
+depends_on = None
+
+# (table, column)
+JSON_COLUMNS = [
+    ("electricity_activities", "raw_data"),
+    ("air_travel_activities", "raw_data"),
+    ("goods_services_activities", "raw_data"),
+    ("emission_results", "calculation_metadata"),
+]
+
+
+def upgrade() -> None:
+    # ALTER COLUMN ... TYPE rewrites the table under an ACCESS EXCLUSIVE lock
+    # and has no CONCURRENTLY form; each column is converted in its own short
+    # transaction so a large table does not hold locks on the others.
+    with op.get_context().autocommit_block():
+        for table, column in JSON_COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSONB(astext_type=sa.Text()),
+                existing_nullable=True,
+                postgresql_using=f"{column}::jsonb",
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, column in JSON_COLUMNS:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.JSON(),
+                existing_nullable=True,
+                postgresql_using=f"{column}::json",
+            )
@@ -0,0 +1,142 @@
+"""maintain_emission_summaries_on_write
+
+Revision ID: 8fb67e02c1ae
+Revises: 49f88cf3b46e
+Create Date: 2026-10-16 10:30:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8fb67e02c1ae"
+down_revision = "49f88cf3b46e"
+branch_labels = None
+depends_on = None
+
+# NULL dimensions mean "all", so they are coalesced to compare equal. The
+# summary_type is part of the key so daily, monthly and custom summaries
+# over the same period can coexist.
+SUMMARY_PERIOD_KEY = (
+    "from_date, to_date, COALESCE(scope, 0), COALESCE(category, 0), "
+    "COALESCE(activity_type, ''), summary_type"
+)
+
+# Adds (or, with negative values, removes) one emission result to every daily
+# and monthly bucket it belongs to, mirroring the breakdowns written by
+# EmissionAggregator.
+APPLY_RESULT_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION emission_summaries_apply_result(
+    p_emission_factor_id uuid,
+    p_activity_type varchar,
+    p_day date,
+    p_co2e_tonnes numeric,
+    p_activity_count integer
+) RETURNS void AS $$
+DECLARE
+    v_scope integer;
+    v_category integer;
+    v_month_start date := date_trunc('month', p_day)::date;
+    v_month_end date := (date_trunc('month', p_day) + interval '1 month - 1 day')::date;
+BEGIN
+    SELECT scope, category INTO v_scope, v_category
+    FROM emission_factors
+    WHERE id = p_emission_factor_id;
+
+    INSERT INTO emission_summaries AS s (
+        id, from_date, to_date, scope, category, activity_type,
+        total_co2e_tonnes, activity_count, summary_type, created_at, updated_at
+    )
+    SELECT
+        gen_random_uuid(), b.from_date, b.to_date, b.scope, b.category, b.activity_type,
+        p_co2e_tonnes, p_activity_count, b.summary_type,
+        now() AT TIME ZONE 'utc', now() AT TIME ZONE 'utc'
+    FROM (
+        SELECT DISTINCT * FROM (VALUES
+            (p_day, p_day, NULL::integer, NULL::integer, NULL::varchar, 'daily'),
+            (p_day, p_day, v_scope, NULL, NULL, 'daily'),
+            (p_day, p_day, v_scope, v_category, NULL, 'daily'),
+            (p_day, p_day, NULL, NULL, p_activity_type, 'daily'),
+            (p_day, p_day, v_scope, NULL, p_activity_type, 'daily'),
+            (v_month_start, v_month_end, NULL, NULL, NULL, 'monthly'),
+            (v_month_start, v_month_end, v_scope, NULL, NULL, 'monthly'),
+            (v_month_start, v_month_end, v_scope, v_category, NULL, 'monthly'),
+            (v_month_start, v_month_end, NULL, NULL, p_activity_type, 'monthly')
+        ) AS v(from_date, to_date, scope, category, activity_type, summary_type)
+    ) AS b
+    ON CONFLICT ({SUMMARY_PERIOD_KEY}) DO UPDATE SET
+        total_co2e_tonnes = s.total_co2e_tonnes + EXCLUDED.total_co2e_tonnes,
+        activity_count = s.activity_count + EXCLUDED.activity_count,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+RESULT_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION emission_results_maintain_summaries() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM emission_summaries_apply_result(
+            OLD.emission_factor_id, OLD.activity_type, OLD.calculation_date,
+            -OLD.co2e_tonnes, -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM emission_summaries_apply_result(
+            NEW.emission_factor_id, NEW.activity_type, NEW.calculation_date,
+            NEW.co2e_tonnes, 1
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    # Replace the partial unique index (activity_type IS NOT NULL) with one
+    # covering every row so it can serve as the ON CONFLICT target.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "
+            "ix_emission_summaries_unique_period_key "
+            f"ON emission_summaries ({SUMMARY_PERIOD_KEY})"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_emission_summaries_unique_period")
+        op.execute(
+            "ALTER INDEX ix_emission_summaries_unique_period_key "
+            "RENAME TO ix_emission_summaries_unique_period"
+        )
+
+    op.execute(APPLY_RESULT_FUNCTION)
+    op.execute(RESULT_TRIGGER_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER emission_results_maintain_summaries "
+        "AFTER INSERT OR DELETE OR UPDATE OF co2e_tonnes, emission_factor_id, "
+        "activity_type, calculation_date ON emission_results "
+        "FOR EACH ROW EXECUTE FUNCTION emission_results_maintain_summaries()"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS emission_results_maintain_summaries ON emission_results"
+    )
+    op.execute("DROP FUNCTION IF EXISTS emission_results_maintain_summaries()")
+    op.execute(
+        "DROP FUNCTION IF EXISTS "
+        "emission_summaries_apply_result(uuid, varchar, date, numeric, integer)"
+    )
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "
+            "ix_emission_summaries_unique_period_partial "
+            "ON emission_summaries (from_date, to_date, scope, category, activity_type) "
+            "WHERE activity_type IS NOT NULL"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_emission_summaries_unique_period")
+        op.execute(
+            "ALTER INDEX ix_emission_summaries_unique_period_partial "
+            "RENAME TO ix_emission_summaries_unique_period"
+        )
@@ -0,0 +1,38 @@
+"""use_brin_for_emission_result_dates
+
+Revision ID: 3fd902536d30
+Revises: 8fb67e02c1ae
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3fd902536d30"
+down_revision = "8fb67e02c1ae"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emission_results_calculation_date_brin "
+            "ON emission_results USING brin (calculation_date) WITH (pages_per_range = 32)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emission_results_created_brin "
+            "ON emission_results USING brin (created_at) WITH (pages_per_range = 32)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_emission_results_calculation_date")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_emission_results_calculation_date "
+            "ON emission_results (calculation_date)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_emission_results_created_brin")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_emission_results_calculation_date_brin")
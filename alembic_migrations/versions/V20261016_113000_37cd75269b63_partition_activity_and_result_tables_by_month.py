@@ -0,0 +1,145 @@
+"""partition_activity_and_result_tables_by_month
+
+Revision ID: 37cd75269b63
+Revises: 3fd902536d30
+Create Date: 2026-10-16 11:30:00.000000
+
+"""
+
+from datetime import date
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "37cd75269b63"
+down_revision = "3fd902536d30"
+branch_labels = None
+depends_on = None
+
+# table -> partition key column
+PARTITIONED_TABLES = {
+    "electricity_activities": "date",
+    "air_travel_activities": "date",
+    "goods_services_activities": "date",
+    "emission_results": "calculation_date",
+}
+
+# Months of partitions created ahead of the current month
+MONTHS_AHEAD = 12
+
+# Creates monthly partitions <table>_pYYYYMM covering [from_month, from_month + months).
+# Call periodically (e.g. from cron) to keep partitions ahead of incoming data,
+# otherwise new rows land in the DEFAULT partition.
+CREATE_MONTHLY_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_monthly_partitions(
+    p_table text,
+    p_from_month date,
+    p_months integer
+) RETURNS void AS $$
+DECLARE
+    v_start date := date_trunc('month', p_from_month)::date;
+    v_end date;
+BEGIN
+    FOR i IN 1..p_months LOOP
+        v_end := (v_start + interval '1 month')::date;
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            p_table || '_p' || to_char(v_start, 'YYYYMM'), p_table, v_start, v_end
+        );
+        v_start := v_end;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+SUMMARIES_TRIGGER = (
+    "CREATE TRIGGER emission_results_maintain_summaries "
+    "AFTER INSERT OR DELETE OR UPDATE OF co2e_tonnes, emission_factor_id, "
+    "activity_type, calculation_date ON emission_results "
+    "FOR EACH ROW EXECUTE FUNCTION emission_results_maintain_summaries()"
+)
+
+
+def _swap_table(table: str, partition_key: str | None) -> None:
+    """
+    Rebuild a table as partitioned (partition_key given) or plain (None).
+
+    Copies the rows into a new table with the same columns, drops the old one
+    and recreates its secondary indexes on the new table. Holds an exclusive
+    lock on the table for the duration of the copy.
+    """
+    conn = op.get_bind()
+    index_defs = conn.execute(
+        sa.text(
+            "SELECT indexdef FROM pg_indexes "
+            "WHERE schemaname = current_schema() AND tablename = :table "
+            "AND indexname <> :pkey"
+        ),
+        {"table": table, "pkey": f"{table}_pkey"},
+    ).scalars().all()
+    table_comment = conn.execute(
+        sa.text("SELECT obj_description(CAST(:table AS regclass), 'pg_class')"),
+        {"table": table},
+    ).scalar()
+
+    old_table = f"{table}_old"
+    op.execute(f"ALTER TABLE {table} RENAME TO {old_table}")
+    op.execute(f"ALTER INDEX {table}_pkey RENAME TO {old_table}_pkey")
+
+    like = f"LIKE {old_table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS"
+    if partition_key is None:
+        op.execute(f"CREATE TABLE {table} ({like})")
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id)")
+    else:
+        op.execute(f"CREATE TABLE {table} ({like}) PARTITION BY RANGE ({partition_key})")
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, {partition_key})")
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+        # Partitions for the existing data plus MONTHS_AHEAD months
+        today = date.today()
+        first = conn.execute(sa.text(f"SELECT min({partition_key}) FROM {old_table}")).scalar()
+        first = first or today
+        months = (today.year - first.year) * 12 + today.month - first.month + 1
+        op.execute(
+            f"SELECT create_monthly_partitions('{table}', '{first.isoformat()}', "
+            f"{months + MONTHS_AHEAD})"
+        )
+
+    if table_comment:
+        quoted = table_comment.replace("'", "''")
+        op.execute(f"COMMENT ON TABLE {table} IS '{quoted}'")
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old_table}")
+    op.execute(f"DROP TABLE {old_table}")
+
+    # Secondary indexes are created on the parent and cascade to every
+    # partition as local indexes.
+    for index_def in index_defs:
+        op.execute(index_def)
+
+
+def _restore_result_dependencies() -> None:
+    op.create_foreign_key(
+        "emission_results_emission_factor_id_fkey",
+        "emission_results",
+        "emission_factors",
+        ["emission_factor_id"],
+        ["id"],
+        ondelete="RESTRICT",
+    )
+    op.execute(SUMMARIES_TRIGGER)
+
+
+def upgrade() -> None:
+    op.execute(CREATE_MONTHLY_PARTITIONS_FUNCTION)
+    for table, partition_key in PARTITIONED_TABLES.items():
+        _swap_table(table, partition_key)
+    _restore_result_dependencies()
+
+
+def downgrade() -> None:
+    for table in PARTITIONED_TABLES:
+        _swap_table(table, None)
+    _restore_result_dependencies()
+    op.execute("DROP FUNCTION IF EXISTS create_monthly_partitions(text, date, integer)")
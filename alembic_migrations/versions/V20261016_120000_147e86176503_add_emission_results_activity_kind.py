@@ -0,0 +1,70 @@
+"""add_emission_results_activity_kind
+
+Revision ID: 147e86176503
+Revises: 37cd75269b63
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.database.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+    paginated_backfill,
+)
+
+# revision identifiers, used by Alembic.
+revision = "147e86176503"
+down_revision = "37cd75269b63"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "emission_results",
+        sa.Column(
+            "activity_kind",
+            sa.SmallInteger(),
+            nullable=True,
+            comment="Activity type code (see ActivityKind), set from activity_type",
+        ),
+    )
+
+    paginated_backfill(
+        "emission_results",
+        set_clause=(
+            "activity_kind = CASE activity_type "
+            "WHEN 'Electricity' THEN 1 "
+            "WHEN 'Air Travel' THEN 2 "
+            "WHEN 'Purchased Goods and Services' THEN 3 END"
+        ),
+        where_clause="activity_kind IS NULL",
+    )
+
+    op.alter_column("emission_results", "activity_kind", nullable=False)
+    op.create_check_constraint(
+        "ck_emission_results_activity_kind",
+        "emission_results",
+        "activity_kind BETWEEN 1 AND 3",
+    )
+
+    create_index_concurrently(
+        "ix_emission_results_activity_kind",
+        "emission_results",
+        "(activity_kind, activity_id) INCLUDE (co2e_tonnes, emission_factor_id)",
+    )
+    drop_index_concurrently("ix_emission_results_activity")
+
+
+def downgrade() -> None:
+    create_index_concurrently(
+        "ix_emission_results_activity",
+        "emission_results",
+        "(activity_type, activity_id)",
+    )
+    drop_index_concurrently("ix_emission_results_activity_kind")
+    op.drop_constraint("ck_emission_results_activity_kind", "emission_results")
+    op.drop_column("emission_results", "activity_kind")
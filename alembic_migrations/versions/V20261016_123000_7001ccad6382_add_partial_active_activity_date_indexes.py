@@ -0,0 +1,38 @@
+"""add_partial_active_activity_date_indexes
+
+Revision ID: 7001ccad6382
+Revises: 147e86176503
+Create Date: 2026-10-16 12:30:00.000000
+
+"""
+
+from app.database.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision = "7001ccad6382"
+down_revision = "147e86176503"
+branch_labels = None
+depends_on = None
+
+ACTIVITY_TABLES = [
+    "electricity_activities",
+    "air_travel_activities",
+    "goods_services_activities",
+]
+
+
+def upgrade() -> None:
+    for table in ACTIVITY_TABLES:
+        create_index_concurrently(
+            f"ix_{table}_active_date",
+            table,
+            "(date DESC, id DESC) WHERE is_deleted = false",
+        )
+
+
+def downgrade() -> None:
+    for table in ACTIVITY_TABLES:
+        drop_index_concurrently(f"ix_{table}_active_date")
@@ -0,0 +1,167 @@
+"""store_activity_and_summary_types_as_enums
+
+Revision ID: 3aca7ac27397
+Revises: 7001ccad6382
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3aca7ac27397"
+down_revision = "7001ccad6382"
+branch_labels = None
+depends_on = None
+
+ACTIVITY_TYPES = ("Electricity", "Air Travel", "Purchased Goods and Services")
+SUMMARY_TYPES = ("daily", "weekly", "monthly", "yearly", "custom")
+
+# Tables whose activity_type is always set. emission_summaries.activity_type
+# stays text: NULL means "all" there and is coalesced to '' in the unique
+# period key, and enum-to-text casts are not immutable, so cannot be indexed.
+ACTIVITY_TYPE_TABLES = [
+    "electricity_activities",
+    "air_travel_activities",
+    "goods_services_activities",
+    "emission_results",
+    "emission_factors",
+]
+
+SUMMARY_PERIOD_KEY = (
+    "from_date, to_date, COALESCE(scope, 0), COALESCE(category, 0), "
+    "COALESCE(activity_type, ''), summary_type"
+)
+
+# Same as in 8fb67e02c1ae, except that the bucket labels are text and need an
+# explicit cast once summary_type is an enum.
+APPLY_RESULT_FUNCTION = """
+CREATE OR REPLACE FUNCTION emission_summaries_apply_result(
+    p_emission_factor_id uuid,
+    p_activity_type varchar,
+    p_day date,
+    p_co2e_tonnes numeric,
+    p_activity_count integer
+) RETURNS void AS $$
+DECLARE
+    v_scope integer;
+    v_category integer;
+    v_month_start date := date_trunc('month', p_day)::date;
+    v_month_end date := (date_trunc('month', p_day) + interval '1 month - 1 day')::date;
+BEGIN
+    SELECT scope, category INTO v_scope, v_category
+    FROM emission_factors
+    WHERE id = p_emission_factor_id;
+
+    INSERT INTO emission_summaries AS s (
+        id, from_date, to_date, scope, category, activity_type,
+        total_co2e_tonnes, activity_count, summary_type, created_at, updated_at
+    )
+    SELECT
+        gen_random_uuid(), b.from_date, b.to_date, b.scope, b.category, b.activity_type,
+        p_co2e_tonnes, p_activity_count, b.summary_type{summary_type_cast},
+        now() AT TIME ZONE 'utc', now() AT TIME ZONE 'utc'
+    FROM (
+        SELECT DISTINCT * FROM (VALUES
+            (p_day, p_day, NULL::integer, NULL::integer, NULL::varchar, 'daily'),
+            (p_day, p_day, v_scope, NULL, NULL, 'daily'),
+            (p_day, p_day, v_scope, v_category, NULL, 'daily'),
+            (p_day, p_day, NULL, NULL, p_activity_type, 'daily'),
+            (p_day, p_day, v_scope, NULL, p_activity_type, 'daily'),
+            (v_month_start, v_month_end, NULL, NULL, NULL, 'monthly'),
+            (v_month_start, v_month_end, v_scope, NULL, NULL, 'monthly'),
+            (v_month_start, v_month_end, v_scope, v_category, NULL, 'monthly'),
+            (v_month_start, v_month_end, NULL, NULL, p_activity_type, 'monthly')
+        ) AS v(from_date, to_date, scope, category, activity_type, summary_type)
+    ) AS b
+    ON CONFLICT ({summary_period_key}) DO UPDATE SET
+        total_co2e_tonnes = s.total_co2e_tonnes + EXCLUDED.total_co2e_tonnes,
+        activity_count = s.activity_count + EXCLUDED.activity_count,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# emission_summaries_apply_result takes a varchar activity type; enums only
+# cast to text on assignment, so the trigger must cast explicitly.
+RESULT_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION emission_results_maintain_summaries() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM emission_summaries_apply_result(
+            OLD.emission_factor_id, OLD.activity_type::varchar, OLD.calculation_date,
+            -OLD.co2e_tonnes, -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM emission_summaries_apply_result(
+            NEW.emission_factor_id, NEW.activity_type::varchar, NEW.calculation_date,
+            NEW.co2e_tonnes, 1
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+RESULT_TRIGGER = (
+    "CREATE TRIGGER emission_results_maintain_summaries "
+    "AFTER INSERT OR DELETE OR UPDATE OF co2e_tonnes, emission_factor_id, "
+    "activity_type, calculation_date ON emission_results "
+    "FOR EACH ROW EXECUTE FUNCTION emission_results_maintain_summaries()"
+)
+
+
+def _labels(values: tuple[str, ...]) -> str:
+    return ", ".join(f"'{value}'" for value in values)
+
+
+def _alter_activity_type(column_type: str, using: str) -> None:
+    # A column named in a trigger's UPDATE OF list cannot change type, so the
+    # summaries trigger is dropped around the change.
+    op.execute(
+        "DROP TRIGGER IF EXISTS emission_results_maintain_summaries ON emission_results"
+    )
+    # Altering the parent of a partitioned table rewrites every partition
+    for table in ACTIVITY_TYPE_TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN activity_type "
+            f"TYPE {column_type} USING {using}"
+        )
+    op.execute(RESULT_TRIGGER)
+
+
+def upgrade() -> None:
+    op.execute(f"CREATE TYPE activity_type AS ENUM ({_labels(ACTIVITY_TYPES)})")
+    op.execute(f"CREATE TYPE summary_type AS ENUM ({_labels(SUMMARY_TYPES)})")
+
+    op.execute(RESULT_TRIGGER_FUNCTION)
+    _alter_activity_type("activity_type", "activity_type::activity_type")
+    op.execute(
+        "ALTER TABLE emission_summaries ALTER COLUMN summary_type "
+        "TYPE summary_type USING summary_type::summary_type"
+    )
+    op.execute(
+        APPLY_RESULT_FUNCTION.format(
+            summary_type_cast="::summary_type", summary_period_key=SUMMARY_PERIOD_KEY
+        )
+    )
+
+
+def downgrade() -> None:
+    # The casting trigger function works for varchar columns too, so it is
+    # left in place.
+    op.execute(
+        APPLY_RESULT_FUNCTION.format(
+            summary_type_cast="", summary_period_key=SUMMARY_PERIOD_KEY
+        )
+    )
+    op.execute(
+        "ALTER TABLE emission_summaries ALTER COLUMN summary_type "
+        "TYPE varchar(50) USING summary_type::text"
+    )
+    _alter_activity_type("varchar(100)", "activity_type::text")
+
+    op.execute("DROP TYPE summary_type")
+    op.execute("DROP TYPE activity_type")
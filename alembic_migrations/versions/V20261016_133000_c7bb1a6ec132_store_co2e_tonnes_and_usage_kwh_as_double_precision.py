@@ -0,0 +1,76 @@
+"""store_co2e_tonnes_and_usage_kwh_as_double_precision
+
+Revision ID: c7bb1a6ec132
+Revises: 3aca7ac27397
+Create Date: 2026-10-16 13:30:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c7bb1a6ec132"
+down_revision = "3aca7ac27397"
+branch_labels = None
+depends_on = None
+
+# emission_summaries_apply_result takes numeric amounts and float8 only casts
+# to numeric on assignment, so the trigger must cast explicitly.
+RESULT_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION emission_results_maintain_summaries() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM emission_summaries_apply_result(
+            OLD.emission_factor_id, OLD.activity_type::varchar, OLD.calculation_date,
+            -OLD.co2e_tonnes::numeric, -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM emission_summaries_apply_result(
+            NEW.emission_factor_id, NEW.activity_type::varchar, NEW.calculation_date,
+            NEW.co2e_tonnes::numeric, 1
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+RESULT_TRIGGER = (
+    "CREATE TRIGGER emission_results_maintain_summaries "
+    "AFTER INSERT OR DELETE OR UPDATE OF co2e_tonnes, emission_factor_id, "
+    "activity_type, calculation_date ON emission_results "
+    "FOR EACH ROW EXECUTE FUNCTION emission_results_maintain_summaries()"
+)
+
+
+def _alter_co2e_tonnes(column_type: str) -> None:
+    # A column named in a trigger's UPDATE OF list cannot change type, so the
+    # summaries trigger is dropped around the change.
+    op.execute(
+        "DROP TRIGGER IF EXISTS emission_results_maintain_summaries ON emission_results"
+    )
+    op.execute(
+        "ALTER TABLE emission_results ALTER COLUMN co2e_tonnes "
+        f"TYPE {column_type} USING co2e_tonnes::{column_type}"
+    )
+    op.execute(RESULT_TRIGGER)
+
+
+def upgrade() -> None:
+    op.execute(RESULT_TRIGGER_FUNCTION)
+    _alter_co2e_tonnes("double precision")
+    op.execute(
+        "ALTER TABLE electricity_activities ALTER COLUMN usage_kwh "
+        "TYPE double precision USING usage_kwh::double precision"
+    )
+
+
+def downgrade() -> None:
+    # The casting trigger function works for numeric columns too, so it is
+    # left in place.
+    op.execute(
+        "ALTER TABLE electricity_activities ALTER COLUMN usage_kwh "
+        "TYPE numeric(12, 4) USING usage_kwh::numeric(12, 4)"
+    )
+    _alter_co2e_tonnes("numeric(15, 7)")
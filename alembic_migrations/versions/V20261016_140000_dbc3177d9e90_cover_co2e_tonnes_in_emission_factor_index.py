@@ -0,0 +1,42 @@
+"""cover_co2e_tonnes_in_emission_factor_index
+
+Revision ID: dbc3177d9e90
+Revises: c7bb1a6ec132
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+
+from alembic import op
+
+from app.database.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision = "dbc3177d9e90"
+down_revision = "c7bb1a6ec132"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        "ix_emission_results_ef_include_co2e",
+        "emission_results",
+        "(emission_factor_id) INCLUDE (co2e_tonnes)",
+    )
+    drop_index_concurrently("ix_emission_results_emission_factor_id")
+
+    # Index-only scans skip the heap only for pages marked all-visible
+    with op.get_context().autocommit_block():
+        op.execute("VACUUM (ANALYZE) emission_results")
+
+
+def downgrade() -> None:
+    create_index_concurrently(
+        "ix_emission_results_emission_factor_id",
+        "emission_results",
+        "(emission_factor_id)",
+    )
+    drop_index_concurrently("ix_emission_results_ef_include_co2e")
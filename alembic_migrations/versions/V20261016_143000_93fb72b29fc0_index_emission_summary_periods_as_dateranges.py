@@ -0,0 +1,38 @@
+"""index_emission_summary_periods_as_dateranges
+
+Revision ID: 93fb72b29fc0
+Revises: dbc3177d9e90
+Create Date: 2026-10-16 14:30:00.000000
+
+"""
+
+from app.database.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision = "93fb72b29fc0"
+down_revision = "dbc3177d9e90"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        "ix_emission_summaries_range",
+        "emission_summaries",
+        "USING gist (daterange(from_date, to_date, '[]'))",
+    )
+    drop_index_concurrently("ix_emission_summaries_from_date")
+    drop_index_concurrently("ix_emission_summaries_to_date")
+
+
+def downgrade() -> None:
+    create_index_concurrently(
+        "ix_emission_summaries_from_date", "emission_summaries", "(from_date)"
+    )
+    create_index_concurrently(
+        "ix_emission_summaries_to_date", "emission_summaries", "(to_date)"
+    )
+    drop_index_concurrently("ix_emission_summaries_range")
@@ -0,0 +1,123 @@
+"""maintain_emission_rollups_on_write
+
+Revision ID: ce49fc70d3de
+Revises: 93fb72b29fc0
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "ce49fc70d3de"
+down_revision = "93fb72b29fc0"
+branch_labels = None
+depends_on = None
+
+# Adds (or, with negative values, removes) one emission result to its
+# (scope, category, activity type) group.
+APPLY_ROLLUP_FUNCTION = """
+CREATE OR REPLACE FUNCTION emission_rollups_apply_result(
+    p_emission_factor_id uuid,
+    p_activity_type varchar,
+    p_co2e_tonnes double precision,
+    p_activity_count integer
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO emission_rollups AS r (
+        id, scope, category, activity_type,
+        total_co2e_tonnes, activity_count, updated_at
+    )
+    SELECT
+        gen_random_uuid(), f.scope, f.category, p_activity_type::activity_type,
+        p_co2e_tonnes, p_activity_count, now() AT TIME ZONE 'utc'
+    FROM emission_factors f
+    WHERE f.id = p_emission_factor_id
+    ON CONFLICT (scope, COALESCE(category, 0), activity_type) DO UPDATE SET
+        total_co2e_tonnes = r.total_co2e_tonnes + EXCLUDED.total_co2e_tonnes,
+        activity_count = r.activity_count + EXCLUDED.activity_count,
+        updated_at = EXCLUDED.updated_at;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+ROLLUP_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION emission_results_maintain_rollups() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM emission_rollups_apply_result(
+            OLD.emission_factor_id, OLD.activity_type::varchar, -OLD.co2e_tonnes, -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM emission_rollups_apply_result(
+            NEW.emission_factor_id, NEW.activity_type::varchar, NEW.co2e_tonnes, 1
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "emission_rollups",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("scope", sa.Integer(), nullable=False),
+        sa.Column("category", sa.Integer(), nullable=True),
+        sa.Column(
+            "activity_type",
+            postgresql.ENUM(name="activity_type", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("total_co2e_tonnes", sa.Float(precision=53), nullable=False),
+        sa.Column("activity_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        comment="Running emission totals per scope, category and activity type",
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_emission_rollups_key "
+        "ON emission_rollups (scope, COALESCE(category, 0), activity_type)"
+    )
+
+    op.execute(APPLY_ROLLUP_FUNCTION)
+    op.execute(ROLLUP_TRIGGER_FUNCTION)
+    op.execute(
+        "CREATE TRIGGER emission_results_maintain_rollups "
+        "AFTER INSERT OR DELETE OR UPDATE OF co2e_tonnes, emission_factor_id, "
+        "activity_type ON emission_results "
+        "FOR EACH ROW EXECUTE FUNCTION emission_results_maintain_rollups()"
+    )
+
+    # Creating the trigger locks emission_results against writes until this
+    # transaction commits, so the backfill neither misses nor double counts.
+    op.execute(
+        """
+        INSERT INTO emission_rollups (
+            id, scope, category, activity_type,
+            total_co2e_tonnes, activity_count, updated_at
+        )
+        SELECT
+            gen_random_uuid(), f.scope, f.category, r.activity_type,
+            sum(r.co2e_tonnes), count(*), now() AT TIME ZONE 'utc'
+        FROM emission_results r
+        JOIN emission_factors f ON f.id = r.emission_factor_id
+        GROUP BY f.scope, f.category, r.activity_type
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS emission_results_maintain_rollups ON emission_results"
+    )
+    op.execute("DROP FUNCTION IF EXISTS emission_results_maintain_rollups()")
+    op.execute(
+        "DROP FUNCTION IF EXISTS "
+        "emission_rollups_apply_result(uuid, varchar, double precision, integer)"
+    )
+    op.drop_table("emission_rollups")
@@ -0,0 +1,61 @@
+"""cover_report_join_columns_in_indexes
+
+Revision ID: 71dfa524e094
+Revises: ce49fc70d3de
+Create Date: 2026-10-16 15:30:00.000000
+
+"""
+
+from alembic import op
+
+from app.database.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision = "71dfa524e094"
+down_revision = "ce49fc70d3de"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Result filters on factor scope/category read the matching factor ids
+    # (and what the summaries group by) from the index alone.
+    create_index_concurrently(
+        "ix_emission_factors_scope_category_include_id",
+        "emission_factors",
+        "(scope, category) INCLUDE (id, activity_type)",
+    )
+    drop_index_concurrently("ix_emission_factors_scope_category")
+
+    # Per-factor, per-type totals (rollup backfill, report joins) without
+    # heap visits
+    create_index_concurrently(
+        "ix_emission_results_ef_include_co2e_type",
+        "emission_results",
+        "(emission_factor_id) INCLUDE (co2e_tonnes, activity_type)",
+    )
+    drop_index_concurrently("ix_emission_results_ef_include_co2e")
+
+    # Index-only scans skip the heap only for pages marked all-visible
+    with op.get_context().autocommit_block():
+        op.execute("VACUUM (ANALYZE) emission_factors")
+        op.execute("VACUUM (ANALYZE) emission_results")
+
+
+def downgrade() -> None:
+    create_index_concurrently(
+        "ix_emission_results_ef_include_co2e",
+        "emission_results",
+        "(emission_factor_id) INCLUDE (co2e_tonnes)",
+    )
+    drop_index_concurrently("ix_emission_results_ef_include_co2e_type")
+
+    create_index_concurrently(
+        "ix_emission_factors_scope_category",
+        "emission_factors",
+        "(scope, category)",
+    )
+    drop_index_concurrently("ix_emission_factors_scope_category_include_id")
@@ -0,0 +1,38 @@
+"""create_aggregation_jobs
+
+Revision ID: 9342f53bb193
+Revises: 71dfa524e094
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "9342f53bb193"
+down_revision = "71dfa524e094"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "aggregation_jobs",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("aggregation_type", sa.String(length=20), nullable=False),
+        sa.Column("from_date", sa.Date(), nullable=False),
+        sa.Column("to_date", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("summaries_created", sa.Integer(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        comment="Background aggregation jobs and their outcome",
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("aggregation_jobs")
@@ -0,0 +1,30 @@
+"""index_results_by_activity_kind_and_co2e
+
+Revision ID: 071abe51c260
+Revises: 9342f53bb193
+Create Date: 2026-10-16 16:30:00.000000
+
+"""
+
+from app.database.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision = "071abe51c260"
+down_revision = "9342f53bb193"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        "ix_emission_results_kind_co2e",
+        "emission_results",
+        "(activity_kind, co2e_tonnes, id)",
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_emission_results_kind_co2e")
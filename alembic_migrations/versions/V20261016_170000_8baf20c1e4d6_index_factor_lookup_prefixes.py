@@ -0,0 +1,30 @@
+"""index_factor_lookup_prefixes
+
+Revision ID: 8baf20c1e4d6
+Revises: 071abe51c260
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+
+from app.database.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision = "8baf20c1e4d6"
+down_revision = "071abe51c260"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        "ix_emission_factors_lookup_lower_pattern",
+        "emission_factors",
+        "(lower(lookup_identifier) text_pattern_ops)",
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_emission_factors_lookup_lower_pattern")
@@ -0,0 +1,38 @@
+"""order_results_by_created_at_and_id
+
+Revision ID: 809a868a7af6
+Revises: 8baf20c1e4d6
+Create Date: 2026-10-16 17:30:00.000000
+
+"""
+
+from app.database.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision = "809a868a7af6"
+down_revision = "8baf20c1e4d6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Date-range pages order by (created_at DESC, id DESC); one backward
+    # scan of this index yields them in order.
+    create_index_concurrently(
+        "ix_emission_results_created_id",
+        "emission_results",
+        "(created_at, id)",
+    )
+    drop_index_concurrently("ix_emission_results_created_desc")
+
+
+def downgrade() -> None:
+    create_index_concurrently(
+        "ix_emission_results_created_desc",
+        "emission_results",
+        "(created_at)",
+    )
+    drop_index_concurrently("ix_emission_results_created_id")
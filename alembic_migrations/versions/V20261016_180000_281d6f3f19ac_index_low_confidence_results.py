@@ -0,0 +1,32 @@
+"""index_low_confidence_results
+
+Revision ID: 281d6f3f19ac
+Revises: 809a868a7af6
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+
+from app.database.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision = "281d6f3f19ac"
+down_revision = "809a868a7af6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Only results below full confidence go to review, so only they are
+    # indexed; the review queue reads them in order straight off the index.
+    create_index_concurrently(
+        "ix_emission_results_low_confidence",
+        "emission_results",
+        "(confidence_score, id) WHERE confidence_score < 1.0",
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_emission_results_low_confidence")
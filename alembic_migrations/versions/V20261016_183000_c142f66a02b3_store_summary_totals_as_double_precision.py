@@ -0,0 +1,31 @@
+"""store_summary_totals_as_double_precision
+
+Revision ID: c142f66a02b3
+Revises: 281d6f3f19ac
+Create Date: 2026-10-16 18:30:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c142f66a02b3"
+down_revision = "281d6f3f19ac"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # emission_summaries_apply_result still passes numeric amounts; they are
+    # assigned to the column, where numeric casts to double precision.
+    op.execute(
+        "ALTER TABLE emission_summaries ALTER COLUMN total_co2e_tonnes "
+        "TYPE double precision USING total_co2e_tonnes::double precision"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE emission_summaries ALTER COLUMN total_co2e_tonnes "
+        "TYPE numeric(15, 7) USING total_co2e_tonnes::numeric(15, 7)"
+    )
@@ -0,0 +1,32 @@
+"""index_results_by_activity_and_created_at
+
+Revision ID: 881d5c86713e
+Revises: c142f66a02b3
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+
+from app.database.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision = "881d5c86713e"
+down_revision = "c142f66a02b3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Per-activity lookups filter on activity_id alone, which is not the
+    # leading column of ix_emission_results_activity_kind.
+    create_index_concurrently(
+        "ix_emission_results_activity_id_created",
+        "emission_results",
+        "(activity_id, created_at DESC)",
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_emission_results_activity_id_created")
@@ -0,0 +1,183 @@
+"""store_timestamps_as_timestamptz_set_by_database
+
+Revision ID: b49a6c7d5e43
+Revises: 881d5c86713e
+Create Date: 2026-10-16 19:30:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b49a6c7d5e43"
+down_revision = "881d5c86713e"
+branch_labels = None
+depends_on = None
+
+# Timestamp columns per table. Existing values are naive UTC.
+TIMESTAMP_COLUMNS = {
+    "electricity_activities": ("created_at", "updated_at", "deleted_at"),
+    "air_travel_activities": ("created_at", "updated_at", "deleted_at"),
+    "goods_services_activities": ("created_at", "updated_at", "deleted_at"),
+    "emission_factors": ("created_at", "updated_at"),
+    "emission_results": ("created_at", "updated_at"),
+    "emission_summaries": ("created_at", "updated_at"),
+    "emission_rollups": ("updated_at",),
+    "aggregation_jobs": ("created_at", "updated_at"),
+}
+
+SET_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+SUMMARY_PERIOD_KEY = (
+    "from_date, to_date, COALESCE(scope, 0), COALESCE(category, 0), "
+    "COALESCE(activity_type, ''), summary_type"
+)
+
+# Same as in 3aca7ac27397, with the timestamps made optional: from this
+# revision on they come from the column defaults and set_updated_at.
+APPLY_SUMMARY_FUNCTION = """
+CREATE OR REPLACE FUNCTION emission_summaries_apply_result(
+    p_emission_factor_id uuid,
+    p_activity_type varchar,
+    p_day date,
+    p_co2e_tonnes numeric,
+    p_activity_count integer
+) RETURNS void AS $$
+DECLARE
+    v_scope integer;
+    v_category integer;
+    v_month_start date := date_trunc('month', p_day)::date;
+    v_month_end date := (date_trunc('month', p_day) + interval '1 month - 1 day')::date;
+BEGIN
+    SELECT scope, category INTO v_scope, v_category
+    FROM emission_factors
+    WHERE id = p_emission_factor_id;
+
+    INSERT INTO emission_summaries AS s (
+        id, from_date, to_date, scope, category, activity_type,
+        total_co2e_tonnes, activity_count, summary_type{timestamp_columns}
+    )
+    SELECT
+        gen_random_uuid(), b.from_date, b.to_date, b.scope, b.category, b.activity_type,
+        p_co2e_tonnes, p_activity_count, b.summary_type::summary_type{timestamp_values}
+    FROM (
+        SELECT DISTINCT * FROM (VALUES
+            (p_day, p_day, NULL::integer, NULL::integer, NULL::varchar, 'daily'),
+            (p_day, p_day, v_scope, NULL, NULL, 'daily'),
+            (p_day, p_day, v_scope, v_category, NULL, 'daily'),
+            (p_day, p_day, NULL, NULL, p_activity_type, 'daily'),
+            (p_day, p_day, v_scope, NULL, p_activity_type, 'daily'),
+            (v_month_start, v_month_end, NULL, NULL, NULL, 'monthly'),
+            (v_month_start, v_month_end, v_scope, NULL, NULL, 'monthly'),
+            (v_month_start, v_month_end, v_scope, v_category, NULL, 'monthly'),
+            (v_month_start, v_month_end, NULL, NULL, p_activity_type, 'monthly')
+        ) AS v(from_date, to_date, scope, category, activity_type, summary_type)
+    ) AS b
+    ON CONFLICT ({summary_period_key}) DO UPDATE SET
+        total_co2e_tonnes = s.total_co2e_tonnes + EXCLUDED.total_co2e_tonnes,
+        activity_count = s.activity_count + EXCLUDED.activity_count{timestamp_update};
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# Same as in ce49fc70d3de, with updated_at made optional
+APPLY_ROLLUP_FUNCTION = """
+CREATE OR REPLACE FUNCTION emission_rollups_apply_result(
+    p_emission_factor_id uuid,
+    p_activity_type varchar,
+    p_co2e_tonnes double precision,
+    p_activity_count integer
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO emission_rollups AS r (
+        id, scope, category, activity_type,
+        total_co2e_tonnes, activity_count{updated_at_column}
+    )
+    SELECT
+        gen_random_uuid(), f.scope, f.category, p_activity_type::activity_type,
+        p_co2e_tonnes, p_activity_count{updated_at_value}
+    FROM emission_factors f
+    WHERE f.id = p_emission_factor_id
+    ON CONFLICT (scope, COALESCE(category, 0), activity_type) DO UPDATE SET
+        total_co2e_tonnes = r.total_co2e_tonnes + EXCLUDED.total_co2e_tonnes,
+        activity_count = r.activity_count + EXCLUDED.activity_count{timestamp_update};
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+UTC_NOW = "now() AT TIME ZONE 'utc'"
+UPDATE_FROM_EXCLUDED = ",\n        updated_at = EXCLUDED.updated_at"
+
+
+def _alter_timestamps(column_type: str, default: str) -> None:
+    # One ALTER per table, so each table (and each partition of the
+    # partitioned ones) is rewritten once. deleted_at has no default.
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        clauses = []
+        for column in columns:
+            clauses.append(
+                f"ALTER COLUMN {column} TYPE {column_type} "
+                f"USING {column} AT TIME ZONE 'UTC'"
+            )
+            if column != "deleted_at":
+                clauses.append(f"ALTER COLUMN {column} {default}")
+        op.execute(f"ALTER TABLE {table} " + ", ".join(clauses))
+
+
+def upgrade() -> None:
+    op.execute(SET_UPDATED_AT_FUNCTION)
+
+    _alter_timestamps("timestamptz", "SET DEFAULT now()")
+
+    # On partitioned tables the trigger is cloned to every partition
+    for table in TIMESTAMP_COLUMNS:
+        op.execute(
+            f"CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+    op.execute(
+        APPLY_SUMMARY_FUNCTION.format(
+            summary_period_key=SUMMARY_PERIOD_KEY,
+            timestamp_columns="",
+            timestamp_values="",
+            timestamp_update="",
+        )
+    )
+    op.execute(
+        APPLY_ROLLUP_FUNCTION.format(
+            updated_at_column="", updated_at_value="", timestamp_update=""
+        )
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        APPLY_ROLLUP_FUNCTION.format(
+            updated_at_column=", updated_at",
+            updated_at_value=f", {UTC_NOW}",
+            timestamp_update=UPDATE_FROM_EXCLUDED,
+        )
+    )
+    op.execute(
+        APPLY_SUMMARY_FUNCTION.format(
+            summary_period_key=SUMMARY_PERIOD_KEY,
+            timestamp_columns=", created_at, updated_at",
+            timestamp_values=f",\n        {UTC_NOW}, {UTC_NOW}",
+            timestamp_update=UPDATE_FROM_EXCLUDED,
+        )
+    )
+
+    for table in TIMESTAMP_COLUMNS:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table}")
+
+    _alter_timestamps("timestamp", "DROP DEFAULT")
+
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
@@ -0,0 +1,56 @@
+"""index_only_live_activities_by_date
+
+Revision ID: 5d2e8f1a9c37
+Revises: b49a6c7d5e43
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+
+from app.database.migration_helpers import (
+    create_index_concurrently,
+    drop_index_concurrently,
+)
+
+# revision identifiers, used by Alembic.
+revision = "5d2e8f1a9c37"
+down_revision = "b49a6c7d5e43"
+branch_labels = None
+depends_on = None
+
+# (table, old index, new index, second column)
+DATE_INDEXES = [
+    (
+        "electricity_activities",
+        "ix_electricity_activities_date_country",
+        "ix_electricity_activities_date_country_live",
+        "country",
+    ),
+    (
+        "goods_services_activities",
+        "ix_goods_services_activities_date_category",
+        "ix_goods_services_activities_date_category_live",
+        "supplier_category",
+    ),
+    (
+        "air_travel_activities",
+        "ix_air_travel_activities_date_range",
+        "ix_air_travel_activities_date_range_live",
+        "flight_range",
+    ),
+]
+
+
+def upgrade() -> None:
+    # Queries never read soft-deleted activities, so the date range indexes
+    # leave them out. The replacement is built before the old one is dropped.
+    for table, old_name, new_name, column in DATE_INDEXES:
+        create_index_concurrently(
+            new_name, table, f"(date, {column}) WHERE is_deleted = false"
+        )
+        drop_index_concurrently(old_name)
+
+
+def downgrade() -> None:
+    for table, old_name, new_name, column in DATE_INDEXES:
+        create_index_concurrently(old_name, table, f"(date, {column})")
+        drop_index_concurrently(new_name)
@@ -8,7 +8,18 @@ from app.api.factors import router as factors_router
 from app.api.reports import router as reports_router
 from app.api.summaries import router as summaries_router
 
+# Registration order of the routers on the application
+ROUTERS = (
+    factors_router,
+    activities_router,
+    calculations_router,
+    reports_router,
+    aggregations_router,
+    summaries_router,
+)
+
 __all__ = [
+    "ROUTERS",
     "activities_router",
     "aggregations_router",
     "calculations_router",
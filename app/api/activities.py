@@ -1,47 +1,155 @@
 """
 Activity Data API router.
 
-Read-only operations for activity data (Electricity, Air Travel, Goods & Services).
+List and create activity data (Electricity, Air Travel, Goods & Services).
 """
 
 import logging
+from collections.abc import AsyncIterator
+from datetime import date
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.dependencies import get_db_session
 from app.database.repositories import (
+    ActivityRepository,
     AirTravelActivityRepository,
     ElectricityActivityRepository,
     GoodsServicesActivityRepository,
 )
+from app.database.session_manager.db_session import Database
 from app.pydantic_models.activity import (
+    AirTravelActivityCreate,
     AirTravelActivityPydModel,
+    BulkCreateResponse,
+    ElectricityActivityCreate,
     ElectricityActivityPydModel,
+    GoodsServicesActivityCreate,
     GoodsServicesActivityPydModel,
 )
+from app.utils.responses import ORJSONResponse, ndjson_lines, rows_to_dicts
 
 router = APIRouter(
     prefix="/api/v1/activities",
     tags=["Activity Data"],
+    default_response_class=ORJSONResponse,
 )
 
 logger = logging.getLogger(__name__)
 
+# Activities read per round trip by the export endpoints
+EXPORT_CHUNK_SIZE = 1000
+
+
+async def _stream_activities(
+    repo_class: type[ActivityRepository], model: type[BaseModel]
+) -> AsyncIterator[bytes]:
+    """
+    Yield every active activity as NDJSON, a chunk at a time.
+
+    The response body outlives the request's dependencies, so this opens its
+    own session.
+    """
+    async with Database() as session:
+        async for chunk in repo_class(session).iter_all_active(EXPORT_CHUNK_SIZE):
+            yield ndjson_lines(chunk, model)
+
+
+def _export_response(
+    repo_class: type[ActivityRepository], model: type[BaseModel]
+) -> StreamingResponse:
+    """Stream all active activities of one type as newline-delimited JSON."""
+    return StreamingResponse(
+        _stream_activities(repo_class, model), media_type="application/x-ndjson"
+    )
+
 
 # Electricity Activities
 @router.get("/electricity", response_model=list[ElectricityActivityPydModel])
 async def list_electricity_activities(
     skip: int = 0,
     limit: int = 100,
+    before_date: date | None = None,
+    before_id: UUID | None = None,
+    session: AsyncSession = Depends(get_db_session),
+):
+    """
+    List electricity activities, newest first.
+
+    For large tables page with before_date/before_id (the date and id of the
+    last activity of the previous page) instead of skip.
+    """
+    repo = ElectricityActivityRepository(session)
+    activities = await repo.get_all_active(
+        skip=skip, limit=limit, before_date=before_date, before_id=before_id
+    )
+    return ORJSONResponse(content=rows_to_dicts(activities, ElectricityActivityPydModel))
+
+
+@router.get("/electricity/export")
+async def export_electricity_activities():
+    """
+    Export all active electricity activities, newest first.
+
+    Streamed as newline-delimited JSON (one activity per line) while they are
+    read, so exports of any size use constant memory.
+    """
+    return _export_response(ElectricityActivityRepository, ElectricityActivityPydModel)
+
+
+@router.post(
+    "/electricity",
+    response_model=ElectricityActivityPydModel,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_electricity_activity(
+    activity: ElectricityActivityCreate,
+    session: AsyncSession = Depends(get_db_session),
+):
+    """Create an electricity activity."""
+    repo = ElectricityActivityRepository(session)
+    return await repo.create(**activity.model_dump())
+
+
+@router.post(
+    "/electricity/bulk",
+    response_model=BulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def bulk_create_electricity_activities(
+    activities: list[ElectricityActivityCreate],
+    session: AsyncSession = Depends(get_db_session),
+):
+    """
+    Create many electricity activities in one COPY.
+
+    Returns only the count and ids of the created rows.
+    """
+    repo = ElectricityActivityRepository(session)
+    ids = await repo.copy_create([activity.model_dump() for activity in activities])
+    return BulkCreateResponse(created=len(ids), ids=ids)
+
+
+@router.get("/electricity/{activity_id}", response_model=ElectricityActivityPydModel)
+async def get_electricity_activity(
+    activity_id: UUID,
     session: AsyncSession = Depends(get_db_session),
 ):
-    """List electricity activities."""
+    """Get an electricity activity by ID."""
     repo = ElectricityActivityRepository(session)
-    activities = await repo.get_all_active(skip=skip, limit=limit)
-    return activities
+    activity = await repo.get_by_id_active(activity_id)
+
+    if not activity:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Electricity activity {activity_id} not found",
+        )
 
+    return activity
 
 
 # Air Travel Activities
@@ -49,24 +157,167 @@ async def list_electricity_activities(
 async def list_air_travel_activities(
     skip: int = 0,
     limit: int = 100,
+    before_date: date | None = None,
+    before_id: UUID | None = None,
+    session: AsyncSession = Depends(get_db_session),
+):
+    """
+    List air travel activities, newest first.
+
+    For large tables page with before_date/before_id (the date and id of the
+    last activity of the previous page) instead of skip.
+    """
+    repo = AirTravelActivityRepository(session)
+    activities = await repo.get_all_active(
+        skip=skip, limit=limit, before_date=before_date, before_id=before_id
+    )
+    return ORJSONResponse(content=rows_to_dicts(activities, AirTravelActivityPydModel))
+
+
+@router.get("/air-travel/export")
+async def export_air_travel_activities():
+    """
+    Export all active air travel activities, newest first.
+
+    Streamed as newline-delimited JSON (one activity per line) while they are
+    read, so exports of any size use constant memory.
+    """
+    return _export_response(AirTravelActivityRepository, AirTravelActivityPydModel)
+
+
+@router.post(
+    "/air-travel",
+    response_model=AirTravelActivityPydModel,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_air_travel_activity(
+    activity: AirTravelActivityCreate,
     session: AsyncSession = Depends(get_db_session),
 ):
-    """List air travel activities."""
+    """Create an air travel activity (distance_km is derived from distance_miles)."""
     repo = AirTravelActivityRepository(session)
-    activities = await repo.get_all_active(skip=skip, limit=limit)
-    return activities
+    return await repo.create(**activity.model_dump())
+
+
+@router.post(
+    "/air-travel/bulk",
+    response_model=BulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def bulk_create_air_travel_activities(
+    activities: list[AirTravelActivityCreate],
+    session: AsyncSession = Depends(get_db_session),
+):
+    """
+    Create many air travel activities in one COPY.
 
+    Returns only the count and ids of the created rows.
+    """
+    repo = AirTravelActivityRepository(session)
+    ids = await repo.copy_create([activity.model_dump() for activity in activities])
+    return BulkCreateResponse(created=len(ids), ids=ids)
 
 
 
+@router.get("/air-travel/{activity_id}", response_model=AirTravelActivityPydModel)
+async def get_air_travel_activity(
+    activity_id: UUID,
+    session: AsyncSession = Depends(get_db_session),
+):
+    """Get an air travel activity by ID."""
+    repo = AirTravelActivityRepository(session)
+    activity = await repo.get_by_id_active(activity_id)
+
+    if not activity:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Air travel activity {activity_id} not found",
+        )
+
+    return activity
+
+
 # Goods & Services Activities
 @router.get("/goods-services", response_model=list[GoodsServicesActivityPydModel])
 async def list_goods_services_activities(
     skip: int = 0,
     limit: int = 100,
+    before_date: date | None = None,
+    before_id: UUID | None = None,
+    session: AsyncSession = Depends(get_db_session),
+):
+    """
+    List goods & services activities, newest first.
+
+    For large tables page with before_date/before_id (the date and id of the
+    last activity of the previous page) instead of skip.
+    """
+    repo = GoodsServicesActivityRepository(session)
+    activities = await repo.get_all_active(
+        skip=skip, limit=limit, before_date=before_date, before_id=before_id
+    )
+    return ORJSONResponse(content=rows_to_dicts(activities, GoodsServicesActivityPydModel))
+
+
+@router.get("/goods-services/export")
+async def export_goods_services_activities():
+    """
+    Export all active goods & services activities, newest first.
+
+    Streamed as newline-delimited JSON (one activity per line) while they are
+    read, so exports of any size use constant memory.
+    """
+    return _export_response(
+        GoodsServicesActivityRepository, GoodsServicesActivityPydModel
+    )
+
+
+@router.post(
+    "/goods-services",
+    response_model=GoodsServicesActivityPydModel,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_goods_services_activity(
+    activity: GoodsServicesActivityCreate,
     session: AsyncSession = Depends(get_db_session),
 ):
-    """List goods & services activities."""
+    """Create a goods & services activity."""
     repo = GoodsServicesActivityRepository(session)
-    activities = await repo.get_all_active(skip=skip, limit=limit)
-    return activities
+    return await repo.create(**activity.model_dump())
+
+
+@router.post(
+    "/goods-services/bulk",
+    response_model=BulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def bulk_create_goods_services_activities(
+    activities: list[GoodsServicesActivityCreate],
+    session: AsyncSession = Depends(get_db_session),
+):
+    """
+    Create many goods & services activities in one COPY.
+
+    Returns only the count and ids of the created rows.
+    """
+    repo = GoodsServicesActivityRepository(session)
+    ids = await repo.copy_create([activity.model_dump() for activity in activities])
+    return BulkCreateResponse(created=len(ids), ids=ids)
+
+
+@router.get("/goods-services/{activity_id}", response_model=GoodsServicesActivityPydModel)
+async def get_goods_services_activity(
+    activity_id: UUID,
+    session: AsyncSession = Depends(get_db_session),
+):
+    """Get a goods & services activity by ID."""
+    repo = GoodsServicesActivityRepository(session)
+    activity = await repo.get_by_id_active(activity_id)
+
+    if not activity:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Goods & services activity {activity_id} not found",
+        )
+
+    return activity
@@ -5,31 +5,73 @@ Endpoints for triggering emission summary aggregations.
 Pre-computes summaries for efficient querying.
 """
 
+import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 from datetime import date, timedelta
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_db_session
+from app.api.summaries import LATEST_SUMMARY_CACHE
+from app.core.dependencies import get_aggregator, get_db_session
+from app.database.repositories import BaseRepository
+from app.database.schemas import AggregationJobDBModel
+from app.database.session_manager.db_session import Database
 from app.pydantic_models.emission_summary import (
+    AggregationJobPydModel,
     AggregationRequest,
     AggregationResponse,
     EmissionSummaryPydModel,
 )
 from app.services.aggregators import EmissionAggregator
+from app.utils.constants import JobStatus
+from app.utils.responses import ORJSONResponse
 
 router = APIRouter(
     prefix="/api/v1/aggregations",
     tags=["Aggregations"],
+    default_response_class=ORJSONResponse,
 )
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole list of ORM summaries in one pydantic-core call
+SUMMARY_LIST_ADAPTER = TypeAdapter(list[EmissionSummaryPydModel])
+
+# Periods aggregated at once during a backfill. Each holds its own pooled
+# connection, so keep this below the engine's pool_size + max_overflow.
+BACKFILL_CONCURRENCY = 4
+
+
+async def _aggregate_periods(
+    periods: list, aggregate: Callable[[EmissionAggregator, object], Awaitable[list]]
+) -> list:
+    """
+    Run aggregate for every period concurrently, BACKFILL_CONCURRENCY at a time.
+
+    AsyncSession is not safe for concurrent use, so each period gets its own
+    session, committed when its aggregation finishes.
+
+    Returns:
+        Summaries of all periods, in period order
+    """
+    semaphore = asyncio.Semaphore(BACKFILL_CONCURRENCY)
+
+    async def run(period):
+        async with semaphore, Database() as session:
+            return await aggregate(EmissionAggregator(session), period)
+
+    results = await asyncio.gather(*(run(period) for period in periods))
+    return [summary for summaries in results for summary in summaries]
+
 
 @router.post("/daily", response_model=AggregationResponse)
 async def aggregate_daily(
     target_date: date | None = None,
+    aggregator: EmissionAggregator = Depends(get_aggregator),
     session: AsyncSession = Depends(get_db_session),
 ):
     """
@@ -60,17 +102,17 @@ async def aggregate_daily(
     logger.info(f"Triggering daily aggregation for {target_date}")
 
     try:
-        aggregator = EmissionAggregator(session)
         summaries = await aggregator.aggregate_daily_summaries(target_date)
         await session.commit()
+        LATEST_SUMMARY_CACHE.clear()
 
         return AggregationResponse(
             success=True,
             message=f"Successfully aggregated emissions for {target_date}",
             summaries_created=len(summaries),
-            summaries=[
-                EmissionSummaryPydModel.model_validate(s) for s in summaries
-            ],
+            summaries=SUMMARY_LIST_ADAPTER.validate_python(
+                summaries, from_attributes=True
+            ),
         )
     except Exception as e:
         logger.error(f"Error during daily aggregation: {e}")
@@ -85,6 +127,7 @@ async def aggregate_daily(
 async def aggregate_monthly(
     year: int | None = None,
     month: int | None = None,
+    aggregator: EmissionAggregator = Depends(get_aggregator),
     session: AsyncSession = Depends(get_db_session),
 ):
     """
@@ -121,17 +164,17 @@ async def aggregate_monthly(
     logger.info(f"Triggering monthly aggregation for {year}-{month:02d}")
 
     try:
-        aggregator = EmissionAggregator(session)
         summaries = await aggregator.aggregate_monthly_summaries(year, month)
         await session.commit()
+        LATEST_SUMMARY_CACHE.clear()
 
         return AggregationResponse(
             success=True,
             message=f"Successfully aggregated emissions for {year}-{month:02d}",
             summaries_created=len(summaries),
-            summaries=[
-                EmissionSummaryPydModel.model_validate(s) for s in summaries
-            ],
+            summaries=SUMMARY_LIST_ADAPTER.validate_python(
+                summaries, from_attributes=True
+            ),
         )
     except Exception as e:
         logger.error(f"Error during monthly aggregation: {e}")
@@ -145,6 +188,7 @@ async def aggregate_monthly(
 @router.post("/custom", response_model=EmissionSummaryPydModel)
 async def aggregate_custom_range(
     request: AggregationRequest,
+    aggregator: EmissionAggregator = Depends(get_aggregator),
     session: AsyncSession = Depends(get_db_session),
 ):
     """
@@ -192,14 +236,14 @@ async def aggregate_custom_range(
     )
 
     try:
-        aggregator = EmissionAggregator(session)
         summary = await aggregator.aggregate_custom_range(
             from_date=request.from_date,
             to_date=request.to_date,
-            scope=request.scope if hasattr(request, 'scope') else None,
-            category=request.category if hasattr(request, 'category') else None,
-            activity_type=request.activity_type if hasattr(request, 'activity_type') else None,
+            scope=request.scope,
+            category=request.category,
+            activity_type=request.activity_type,
         )
+        LATEST_SUMMARY_CACHE.clear()
 
         return EmissionSummaryPydModel.model_validate(summary)
     except Exception as e:
@@ -211,18 +255,77 @@ async def aggregate_custom_range(
         )
 
 
-@router.post("/backfill", response_model=AggregationResponse)
+async def _backfill(from_date: date, to_date: date, aggregation_type: str) -> list:
+    """
+    Aggregate every day or month of a date range.
+
+    Daily backfills aggregate each day, several days at a time, each in its
+    own transaction. Monthly backfills aggregate every month with a single
+    statement.
+
+    Returns:
+        Summaries created or updated
+    """
+    if aggregation_type == "daily":
+        periods = [
+            from_date + timedelta(days=offset)
+            for offset in range((to_date - from_date).days + 1)
+        ]
+
+        async def aggregate(aggregator, target_date):
+            return await aggregator.aggregate_daily_summaries(target_date)
+
+        return await _aggregate_periods(periods, aggregate)
+
+    async with Database() as session:
+        summaries = await EmissionAggregator(session).backfill_monthly_set_based(
+            from_date, to_date
+        )
+        await session.commit()
+    return summaries
+
+
+async def _run_backfill_job(
+    job_id: UUID, from_date: date, to_date: date, aggregation_type: str
+) -> None:
+    """Run a backfill after its request has returned, recording the outcome on the job."""
+    async with Database() as session:
+        jobs = BaseRepository(AggregationJobDBModel, session)
+        await jobs.update(job_id, status=JobStatus.RUNNING)
+        await session.commit()
+
+        try:
+            summaries = await _backfill(from_date, to_date, aggregation_type)
+        except Exception as e:
+            logger.exception("Backfill job %s failed", job_id)
+            await jobs.update(job_id, status=JobStatus.FAILED, error=str(e))
+        else:
+            LATEST_SUMMARY_CACHE.clear()
+            logger.info("Backfill job %s created %d summaries", job_id, len(summaries))
+            await jobs.update(
+                job_id, status=JobStatus.SUCCEEDED, summaries_created=len(summaries)
+            )
+        await session.commit()
+
+
+@router.post(
+    "/backfill",
+    response_model=AggregationJobPydModel,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def backfill_summaries(
     from_date: date,
     to_date: date,
+    background_tasks: BackgroundTasks,
     aggregation_type: str = "daily",
     session: AsyncSession = Depends(get_db_session),
 ):
     """
     Backfill aggregations for a historical date range.
 
-    Useful for populating summaries for existing historical data.
-    Runs daily or monthly aggregations for each period in the range.
+    Useful for populating summaries for existing historical data. A backfill
+    can take a while, so it runs in the background: the request returns a
+    pending job straight away, which can be polled at /jobs/{job_id}.
 
     Args:
         from_date: Start date for backfill
@@ -230,7 +333,7 @@ async def backfill_summaries(
         aggregation_type: Type of aggregation (daily or monthly)
 
     Returns:
-        AggregationResponse with total summaries created
+        The accepted AggregationJobPydModel
 
     Example:
         ```
@@ -243,58 +346,51 @@ async def backfill_summaries(
             detail="from_date must be before or equal to to_date",
         )
 
+    if aggregation_type not in ("daily", "monthly"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="aggregation_type must be 'daily' or 'monthly'",
+        )
+
+    job = await BaseRepository(AggregationJobDBModel, session).create(
+        aggregation_type=aggregation_type,
+        from_date=from_date,
+        to_date=to_date,
+        status=JobStatus.PENDING,
+        summaries_created=0,
+    )
+    await session.commit()
+
     logger.info(
-        f"Triggering backfill: {from_date} to {to_date}, type={aggregation_type}"
+        f"Accepted backfill job {job.id}: {from_date} to {to_date}, type={aggregation_type}"
     )
+    background_tasks.add_task(
+        _run_backfill_job, job.id, from_date, to_date, aggregation_type
+    )
+    return job
 
-    try:
-        aggregator = EmissionAggregator(session)
-        all_summaries = []
-
-        if aggregation_type == "daily":
-            # Backfill daily summaries
-            current_date = from_date
-            while current_date <= to_date:
-                summaries = await aggregator.aggregate_daily_summaries(current_date)
-                all_summaries.extend(summaries)
-                current_date += timedelta(days=1)
-
-        elif aggregation_type == "monthly":
-            # Backfill monthly summaries
-            current_date = from_date.replace(day=1)
-            end_date = to_date.replace(day=1)
-
-            while current_date <= end_date:
-                summaries = await aggregator.aggregate_monthly_summaries(
-                    current_date.year, current_date.month
-                )
-                all_summaries.extend(summaries)
-
-                # Move to next month
-                if current_date.month == 12:
-                    current_date = current_date.replace(year=current_date.year + 1, month=1)
-                else:
-                    current_date = current_date.replace(month=current_date.month + 1)
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="aggregation_type must be 'daily' or 'monthly'",
-            )
 
-        await session.commit()
+@router.get("/jobs/{job_id}", response_model=AggregationJobPydModel)
+async def get_aggregation_job(
+    job_id: UUID,
+    session: AsyncSession = Depends(get_db_session),
+):
+    """
+    Get the status of a background aggregation job.
 
-        return AggregationResponse(
-            success=True,
-            message=f"Successfully backfilled {aggregation_type} summaries from {from_date} to {to_date}",
-            summaries_created=len(all_summaries),
-            summaries=[
-                EmissionSummaryPydModel.model_validate(s) for s in all_summaries[:100]  # Limit response size
-            ],
-        )
-    except Exception as e:
-        logger.error(f"Error during backfill: {e}")
-        await session.rollback()
+    Args:
+        job_id: Job UUID returned by /backfill
+
+    Returns:
+        AggregationJobPydModel
+
+    Raises:
+        HTTPException: 404 if the job does not exist
+    """
+    job = await BaseRepository(AggregationJobDBModel, session).get_by_id(job_id)
+    if job is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to backfill summaries: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Aggregation job {job_id} not found",
         )
+    return job
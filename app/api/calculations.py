@@ -9,10 +9,13 @@ import logging
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.reports import REPORT_CACHE
+from app.api.summaries import LATEST_SUMMARY_CACHE
 from app.core.dependencies import get_db_session
 from app.database.repositories import (
     AirTravelActivityRepository,
     ElectricityActivityRepository,
+    EmissionResultRepository,
     GoodsServicesActivityRepository,
 )
 from app.pydantic_models.calculation import (
@@ -20,10 +23,12 @@ from app.pydantic_models.calculation import (
     EmissionResultPydModel,
 )
 from app.services.calculators.emission_calculator import EmissionCalculationService
+from app.utils.responses import ORJSONResponse
 
 router = APIRouter(
     prefix="/api/v1/calculations",
     tags=["Calculations"],
+    default_response_class=ORJSONResponse,
 )
 
 logger = logging.getLogger(__name__)
@@ -59,53 +64,48 @@ async def calculate_emissions(
         }
         ```
     """
-    logger.info(f"Calculating emissions for {len(request.activity_ids)} activities")
+    logger.info("Calculating emissions for %s activities", len(request.activity_ids))
 
     service = EmissionCalculationService(session)
-    results = []
 
-    # Initialize repositories
-    electricity_repo = ElectricityActivityRepository(session)
-    air_travel_repo = AirTravelActivityRepository(session)
-    goods_services_repo = GoodsServicesActivityRepository(session)
-
-    # Process each activity ID
+    # Fetch all requested activities with one IN query per activity table
+    # (three round trips regardless of how many IDs were requested). The
+    # queries share the session's connection, so they run one after another.
+    activities_by_id = {}
+    for repo_class in (
+        ElectricityActivityRepository,
+        AirTravelActivityRepository,
+        GoodsServicesActivityRepository,
+    ):
+        repo = repo_class(session)
+        for activity in await repo.get_by_ids_active(request.activity_ids):
+            activities_by_id[activity.id] = activity
+
+    activities = []
     for activity_id in request.activity_ids:
-        # Try to find activity in each repository
-        activity = None
-
-        # Check electricity activities
-        activity = await electricity_repo.get_by_id_active(activity_id)
-
-        # Check air travel activities if not found
-        if not activity:
-            activity = await air_travel_repo.get_by_id_active(activity_id)
-
-        # Check goods/services activities if not found
+        activity = activities_by_id.get(activity_id)
         if not activity:
-            activity = await goods_services_repo.get_by_id_active(activity_id)
-
-        if not activity:
-            logger.warning(f"Activity not found: {activity_id}")
+            logger.warning("Activity not found: %s", activity_id)
             continue
+        activities.append(activity)
 
-        try:
-            # Calculate or recalculate
-            if request.recalculate:
-                emission_result = await service.recalculate_activity(activity)
-            else:
-                emission_result = await service.calculate_single(activity)
-
-            if emission_result:
-                results.append(emission_result)
-        except Exception as e:
-            logger.error(
-                f"Failed to calculate emissions for activity {activity_id}: {e}"
-            )
-            continue
+    # Recalculation replaces existing results, removed here in one statement
+    if request.recalculate and activities:
+        result_repo = EmissionResultRepository(session)
+        await result_repo.delete_by_activity_ids([activity.id for activity in activities])
+
+    # Calculated as one batch: factors are loaded once per activity type and
+    # all new results are inserted together
+    results = await service.calculate_many(
+        activities, skip_duplicate_check=request.recalculate
+    )
 
     await session.commit()
+    # Cached reports and summaries (kept by trigger) no longer reflect the
+    # stored results
+    REPORT_CACHE.clear()
+    LATEST_SUMMARY_CACHE.clear()
 
-    logger.info(f"Successfully calculated emissions for {len(results)} activities")
+    logger.info("Successfully calculated emissions for %s activities", len(results))
 
     return results
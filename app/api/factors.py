@@ -12,20 +12,29 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.dependencies import get_db_session
 from app.database.repositories import EmissionFactorRepository
 from app.pydantic_models.emission_factor import EmissionFactorPydModel
+from app.utils.cache import TTLCache
+from app.utils.constants import ActivityTypeEnum
+from app.utils.responses import ORJSONResponse, rows_to_dicts
 
 router = APIRouter(
     prefix="/api/v1/factors",
     tags=["Emission Factors"],
+    default_response_class=ORJSONResponse,
 )
 
 logger = logging.getLogger(__name__)
 
+# Factors are reference data that only change when a new factor set is
+# seeded, so responses are cached per worker. A reseed shows up once the
+# TTL has passed; clear the cache to pick it up sooner.
+FACTOR_CACHE = TTLCache(ttl=300, maxsize=256)
+
 
 @router.get("/", response_model=list[EmissionFactorPydModel])
 async def list_emission_factors(
     skip: int = 0,
     limit: int = 100,
-    activity_type: str | None = None,
+    activity_type: ActivityTypeEnum | None = None,
     scope: int | None = None,
     session: AsyncSession = Depends(get_db_session),
 ):
@@ -38,6 +47,11 @@ async def list_emission_factors(
         activity_type: Filter by activity type (optional)
         scope: Filter by GHG scope (optional)
     """
+    cache_key = ("list", skip, limit, activity_type, scope)
+    content = FACTOR_CACHE.get(cache_key)
+    if content is not None:
+        return ORJSONResponse(content=content)
+
     repo = EmissionFactorRepository(session)
 
     # Apply filters if provided
@@ -48,7 +62,9 @@ async def list_emission_factors(
     else:
         factors = await repo.get_all(skip=skip, limit=limit)
 
-    return factors
+    content = rows_to_dicts(factors, EmissionFactorPydModel)
+    FACTOR_CACHE.set(cache_key, content)
+    return ORJSONResponse(content=content)
 
 
 @router.get("/{factor_id}", response_model=EmissionFactorPydModel)
@@ -59,6 +75,11 @@ async def get_emission_factor(
     """
     Get emission factor by ID.
     """
+    cache_key = ("get", factor_id)
+    content = FACTOR_CACHE.get(cache_key)
+    if content is not None:
+        return ORJSONResponse(content=content)
+
     repo = EmissionFactorRepository(session)
     factor = await repo.get_by_id(factor_id)
 
@@ -68,4 +89,6 @@ async def get_emission_factor(
             detail=f"Emission factor {factor_id} not found",
         )
 
-    return factor
+    content = rows_to_dicts([factor], EmissionFactorPydModel)[0]
+    FACTOR_CACHE.set(cache_key, content)
+    return ORJSONResponse(content=content)
@@ -4,32 +4,277 @@ Emissions Reports API router.
 Generate comprehensive emission reports.
 """
 
+import asyncio
 import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator
 from datetime import date as today_date
 from decimal import Decimal
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import and_, desc, select
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Row, Select, desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.dependencies import get_db_session
+from app.database.repositories import EmissionRollupRepository
 from app.database.schemas import EmissionFactorDBModel, EmissionResultDBModel
-from app.pydantic_models.calculation import EmissionReportResponse, EmissionSummary
+from app.database.session_manager.db_session import Database
+from app.pydantic_models.calculation import (
+    EmissionReportResponse,
+    EmissionResultPydModel,
+    EmissionSummary,
+)
 from app.utils.constants import (
+    ACTIVITY_KIND_BY_TYPE,
+    ActivityType,
     ActivityTypeEnum,
     CategoryEnum,
     Scope,
     ScopeEnum,
     SortOrderEnum,
 )
+from app.utils.cache import TTLCache
+from app.utils.responses import ORJSONResponse, ndjson_lines, rows_to_dicts
 
 router = APIRouter(
     prefix="/api/v1/reports",
     tags=["Reports"],
+    default_response_class=ORJSONResponse,
 )
 
 logger = logging.getLogger(__name__)
 
+# Keys of breakdown_by_activity_type for each stored activity type
+ACTIVITY_TYPE_KEYS = {
+    ActivityType.ELECTRICITY: "electricity",
+    ActivityType.AIR_TRAVEL: "air_travel",
+    ActivityType.GOODS_SERVICES: "goods_services",
+}
+
+# Reports are re-requested with the same filters while a dashboard refreshes;
+# let the client reuse a render for a short while.
+REPORT_HEADERS = {"Cache-Control": "private, max-age=30"}
+
+# Dashboards poll the report with the same filters; repeat requests within a
+# few seconds are served from memory. Cleared when calculations are written.
+REPORT_CACHE = TTLCache(ttl=5, maxsize=256)
+
+# Results fetched per round trip when exporting
+EXPORT_BATCH_SIZE = 10_000
+
+# Only the columns the results list renders: plain rows skip ORM hydration
+# and the identity map.
+RESULT_COLUMNS = tuple(
+    getattr(EmissionResultDBModel, field) for field in EmissionResultPydModel.model_fields
+)
+
+
+_ZERO = Decimal("0")
+
+# (scope, category) filters no result can match: Scope 3 categories do not
+# apply to scope 2 factors. Reports for these are answered without a query.
+IMPOSSIBLE_FILTERS = frozenset(
+    (Scope.SCOPE_2, category.value) for category in CategoryEnum
+)
+
+
+def _empty_summary() -> EmissionSummary:
+    """Summary of a report without results."""
+    return EmissionSummary(
+        total_co2e_tonnes=_ZERO,
+        scope_2_tonnes=_ZERO,
+        scope_3_tonnes=_ZERO,
+        scope_3_category_1_tonnes=_ZERO,
+        scope_3_category_6_tonnes=_ZERO,
+        total_activities=0,
+        calculation_date=today_date.today(),
+    )
+
+
+def _empty_report() -> dict:
+    """Content of a report without results."""
+    return EmissionReportResponse(
+        summary=_empty_summary(),
+        results=[],
+        breakdown_by_activity_type={},
+    ).model_dump()
+
+
+def _report_filters(
+    scope: ScopeEnum | None,
+    category: CategoryEnum | None,
+    activity: ActivityTypeEnum | None,
+) -> list:
+    """Build the WHERE clauses shared by the report queries."""
+    filters = []
+    if scope is not None:
+        filters.append(EmissionFactorDBModel.scope == scope.value)
+    if category is not None:
+        filters.append(EmissionFactorDBModel.category == category.value)
+    if activity is not None:
+        filters.append(
+            EmissionResultDBModel.activity_kind == ACTIVITY_KIND_BY_TYPE[activity.value]
+        )
+    return filters
+
+
+def _results_stmt(filters: list, sort_by_co2e: SortOrderEnum | None) -> Select:
+    """Build the ordered query for the individual results matching the report filters."""
+    stmt = (
+        select(*RESULT_COLUMNS)
+        .join(
+            EmissionFactorDBModel,
+            EmissionResultDBModel.emission_factor_id == EmissionFactorDBModel.id,
+        )
+        .where(*filters)
+    )
+
+    # Apply sorting; id breaks ties so pages do not overlap. It runs in the
+    # same direction as co2e_tonnes so ix_emission_results_kind_co2e can be
+    # scanned in either direction without a sort.
+    if sort_by_co2e == SortOrderEnum.DESC:
+        return stmt.order_by(
+            desc(EmissionResultDBModel.co2e_tonnes), desc(EmissionResultDBModel.id)
+        )
+    if sort_by_co2e == SortOrderEnum.ASC:
+        return stmt.order_by(EmissionResultDBModel.co2e_tonnes, EmissionResultDBModel.id)
+    return stmt.order_by(EmissionResultDBModel.id)
+
+
+async def _fetch_results_page(
+    session: AsyncSession,
+    filters: list,
+    sort_by_co2e: SortOrderEnum | None,
+    skip: int,
+    limit: int,
+) -> list[Row]:
+    """Fetch one page of the individual results matching the report filters."""
+    stmt = _results_stmt(filters, sort_by_co2e).offset(skip).limit(limit)
+    result = await session.execute(stmt)
+    return result.all()
+
+
+async def _stream_results(
+    filters: list, sort_by_co2e: SortOrderEnum | None
+) -> AsyncIterator[bytes]:
+    """
+    Yield every result matching the report filters as NDJSON, a batch at a time.
+
+    Rows are fetched through a server-side cursor EXPORT_BATCH_SIZE at a time,
+    so memory stays at one batch however many results match. The response
+    body outlives the request's dependencies, so this opens its own session.
+    """
+    stmt = _results_stmt(filters, sort_by_co2e).execution_options(
+        yield_per=EXPORT_BATCH_SIZE
+    )
+    async with Database() as session:
+        result = await session.stream(stmt)
+        async for rows in result.partitions():
+            yield ndjson_lines(rows, EmissionResultPydModel)
+
+
+async def _fetch_rollups(
+    scope: ScopeEnum | None,
+    category: CategoryEnum | None,
+    activity: ActivityTypeEnum | None,
+) -> list[Row]:
+    """
+    Fetch the running totals matching the report filters.
+
+    Totals come from the rollups the emission_results trigger keeps current:
+    one row per (scope, category, activity type) group, however many results
+    there are. Uses its own session so it can run alongside other queries.
+    """
+    async with Database() as session:
+        return await EmissionRollupRepository(session).get_totals(
+            scope=scope.value if scope else None,
+            category=category.value if category else None,
+            activity_type=activity.value if activity else None,
+        )
+
+
+async def _build_report(
+    session: AsyncSession,
+    scope: ScopeEnum | None,
+    category: CategoryEnum | None,
+    activity: ActivityTypeEnum | None,
+    sort_by_co2e: SortOrderEnum | None,
+    skip: int,
+    limit: int,
+) -> dict:
+    """Build the content of an emissions report."""
+    if (
+        scope is not None
+        and category is not None
+        and (scope.value, category.value) in IMPOSSIBLE_FILTERS
+    ):
+        return _empty_report()
+
+    filters = _report_filters(scope, category, activity)
+
+    # The totals and the page of results are independent, so they run
+    # concurrently, the totals on a session (and connection) of their own.
+    rows, emission_results = await asyncio.gather(
+        _fetch_rollups(scope, category, activity),
+        _fetch_results_page(session, filters, sort_by_co2e, skip, limit),
+    )
+
+    if not rows:
+        return _empty_report()
+
+    total_co2e = _ZERO
+    total_activities = 0
+    scope_2_total = _ZERO
+    scope_3_total = _ZERO
+    scope_3_category_1 = _ZERO
+    scope_3_category_6 = _ZERO
+    breakdown_by_type = defaultdict(Decimal)
+
+    for row in rows:
+        co2e = row.co2e_tonnes
+        total_co2e += co2e
+        total_activities += row.activity_count
+
+        # Aggregate by scope
+        if row.scope == Scope.SCOPE_2:
+            scope_2_total += co2e
+        elif row.scope == Scope.SCOPE_3:
+            scope_3_total += co2e
+
+            # Aggregate by Scope 3 category
+            if row.category == 1:
+                scope_3_category_1 += co2e
+            elif row.category == 6:
+                scope_3_category_6 += co2e
+
+        # Aggregate by activity type (snake_case keys for consistency)
+        breakdown_by_type[ACTIVITY_TYPE_KEYS[row.activity_type]] += co2e
+
+    # Create summary (convert Decimal to float for clean JSON serialization)
+    summary = EmissionSummary(
+        total_co2e_tonnes=total_co2e,
+        scope_2_tonnes=scope_2_total,
+        scope_3_tonnes=scope_3_total,
+        scope_3_category_1_tonnes=scope_3_category_1,
+        scope_3_category_6_tonnes=scope_3_category_6,
+        total_activities=total_activities,
+        calculation_date=today_date.today(),
+    )
+
+    logger.info(
+        f"Report generated: {total_activities} activities, "
+        f"{total_co2e} tonnes CO2e total"
+    )
+
+    # The results list dominates the payload, so it is rendered straight from
+    # the rows instead of validating every result through Pydantic.
+    return {
+        "summary": summary.model_dump(),
+        "results": rows_to_dicts(emission_results, EmissionResultPydModel),
+        "breakdown_by_activity_type": breakdown_by_type,
+    }
+
 
 @router.get("/emissions", response_model=EmissionReportResponse)
 async def generate_emissions_report(
@@ -47,6 +292,10 @@ async def generate_emissions_report(
     sort_by_co2e: SortOrderEnum | None = Query(
         None, description="Sort by CO2e emissions (asc or desc)", example="desc"
     ),
+    skip: int = Query(0, ge=0, description="Number of results to skip"),
+    limit: int = Query(
+        100, ge=1, le=1000, description="Maximum number of results to return"
+    ),
     session: AsyncSession = Depends(get_db_session),
 ):
     """
@@ -57,11 +306,13 @@ async def generate_emissions_report(
     - category: Filter by Scope 3 category (1 or 6)
     - activity: Filter by activity type
     - sort_by_co2e: Sort by CO2e emissions ('asc' or 'desc')
+    - skip, limit: Page of individual results to include
 
     Includes:
     - Total emissions by scope and category
     - Breakdown by activity type
-    - Individual calculation results
+    - One page of individual calculation results (see /emissions/results
+      to page through the rest)
 
     Returns:
         EmissionReportResponse with summary and detailed breakdown
@@ -78,108 +329,94 @@ async def generate_emissions_report(
         f"Generating emissions report with filters: scope={scope}, category={category}, activity={activity}, sort={sort_by_co2e}"
     )
 
-    # Build query with filters
-    stmt = select(EmissionResultDBModel, EmissionFactorDBModel).join(
-        EmissionFactorDBModel,
-        EmissionResultDBModel.emission_factor_id == EmissionFactorDBModel.id,
-    )
-
-    # Apply filters
-    filters = []
-    if scope is not None:
-        filters.append(EmissionFactorDBModel.scope == scope.value)
-    if category is not None:
-        filters.append(EmissionFactorDBModel.category == category.value)
-    if activity is not None:
-        filters.append(EmissionResultDBModel.activity_type == activity.value)
-
-    if filters:
-        stmt = stmt.where(and_(*filters))
+    cache_key = (scope, category, activity, sort_by_co2e, skip, limit)
+    content = REPORT_CACHE.get(cache_key)
+    if content is None:
+        content = await _build_report(
+            session, scope, category, activity, sort_by_co2e, skip, limit
+        )
+        REPORT_CACHE.set(cache_key, content)
+    return ORJSONResponse(content=content, headers=REPORT_HEADERS)
 
-    # Apply sorting
-    if sort_by_co2e == SortOrderEnum.DESC:
-        stmt = stmt.order_by(desc(EmissionResultDBModel.co2e_tonnes))
-    elif sort_by_co2e == SortOrderEnum.ASC:
-        stmt = stmt.order_by(EmissionResultDBModel.co2e_tonnes)
 
-    result = await session.execute(stmt)
-    rows = result.all()
+@router.get("/emissions/results", response_model=list[EmissionResultPydModel])
+async def list_emission_report_results(
+    scope: ScopeEnum | None = Query(
+        None, description="Filter by GHG Protocol scope (2 or 3)", example=2
+    ),
+    category: CategoryEnum | None = Query(
+        None,
+        description="Filter by Scope 3 category (1=Purchased Goods, 6=Business Travel)",
+        example=1,
+    ),
+    activity: ActivityTypeEnum | None = Query(
+        None, description="Filter by activity type", example="Electricity"
+    ),
+    sort_by_co2e: SortOrderEnum | None = Query(
+        None, description="Sort by CO2e emissions (asc or desc)", example="desc"
+    ),
+    skip: int = Query(0, ge=0, description="Number of results to skip"),
+    limit: int = Query(
+        100, ge=1, le=1000, description="Maximum number of results to return"
+    ),
+    session: AsyncSession = Depends(get_db_session),
+):
+    """
+    Page through the individual calculation results behind the emissions report.
 
-    if not rows:
-        # Return empty report if no data
-        empty_summary = EmissionSummary(
-            total_co2e_tonnes=Decimal("0"),
-            scope_2_tonnes=Decimal("0"),
-            scope_3_tonnes=Decimal("0"),
-            scope_3_category_1_tonnes=Decimal("0"),
-            scope_3_category_6_tonnes=Decimal("0"),
-            total_activities=0,
-            calculation_date=today_date.today(),
-        )
-        return EmissionReportResponse(
-            summary=empty_summary,
-            results=[],
-            breakdown_by_activity_type={},
-        )
+    Accepts the same filters and sorting as /emissions.
 
-    # Extract results and factors
-    emission_results = []
-    total_co2e = Decimal("0")
-    scope_2_total = Decimal("0")
-    scope_3_total = Decimal("0")
-    scope_3_category_1 = Decimal("0")
-    scope_3_category_6 = Decimal("0")
-    breakdown_by_type = {}
-
-    for emission_result, emission_factor in rows:
-        emission_results.append(emission_result)
-        co2e = emission_result.co2e_tonnes
-        total_co2e += co2e
+    Returns:
+        List of emission results
 
-        # Aggregate by scope
-        if emission_factor.scope == Scope.SCOPE_2:
-            scope_2_total += co2e
-        elif emission_factor.scope == Scope.SCOPE_3:
-            scope_3_total += co2e
+    Example:
+        ```
+        GET /api/v1/reports/emissions/results?scope=2&skip=100&limit=100
+        ```
+    """
+    filters = _report_filters(scope, category, activity)
+    emission_results = await _fetch_results_page(
+        session, filters, sort_by_co2e, skip, limit
+    )
+    return ORJSONResponse(
+        content=rows_to_dicts(emission_results, EmissionResultPydModel),
+        headers=REPORT_HEADERS,
+    )
 
-            # Aggregate by Scope 3 category
-            if emission_factor.category == 1:
-                scope_3_category_1 += co2e
-            elif emission_factor.category == 6:
-                scope_3_category_6 += co2e
 
-        # Aggregate by activity type (convert to snake_case for consistency)
-        activity_type = emission_result.activity_type
-        # Convert "Electricity" -> "electricity", "Purchased Goods and Services" -> "goods_services"
-        activity_type_key = (
-            activity_type.lower()
-            .replace(" ", "_")
-            .replace("purchased_", "")
-            .replace("and_", "")
-        )
-        if activity_type_key not in breakdown_by_type:
-            breakdown_by_type[activity_type_key] = Decimal("0")
-        breakdown_by_type[activity_type_key] += co2e
+@router.get("/emissions/results/export")
+async def export_emission_report_results(
+    scope: ScopeEnum | None = Query(
+        None, description="Filter by GHG Protocol scope (2 or 3)", example=2
+    ),
+    category: CategoryEnum | None = Query(
+        None,
+        description="Filter by Scope 3 category (1=Purchased Goods, 6=Business Travel)",
+        example=1,
+    ),
+    activity: ActivityTypeEnum | None = Query(
+        None, description="Filter by activity type", example="Electricity"
+    ),
+    sort_by_co2e: SortOrderEnum | None = Query(
+        None, description="Sort by CO2e emissions (asc or desc)", example="desc"
+    ),
+):
+    """
+    Export every individual calculation result behind the emissions report.
 
-    # Create summary (convert Decimal to float for clean JSON serialization)
-    summary = EmissionSummary(
-        total_co2e_tonnes=total_co2e,
-        scope_2_tonnes=scope_2_total,
-        scope_3_tonnes=scope_3_total,
-        scope_3_category_1_tonnes=scope_3_category_1,
-        scope_3_category_6_tonnes=scope_3_category_6,
-        total_activities=len(emission_results),
-        calculation_date=today_date.today(),
-    )
+    Accepts the same filters and sorting as /emissions. The results are
+    streamed as newline-delimited JSON (one result per line) while they are
+    read, so exports of any size use constant memory.
 
-    logger.info(
-        f"Report generated: {len(emission_results)} activities, "
-        f"{total_co2e} tonnes CO2e total"
-    )
+    Returns:
+        application/x-ndjson stream of emission results
 
-    return EmissionReportResponse(
-        summary=summary,
-        results=emission_results,
-        breakdown_by_activity_type=breakdown_by_type,
+    Example:
+        ```
+        GET /api/v1/reports/emissions/results/export?scope=3&sort_by_co2e=desc
+        ```
+    """
+    filters = _report_filters(scope, category, activity)
+    return StreamingResponse(
+        _stream_results(filters, sort_by_co2e), media_type="application/x-ndjson"
     )
-
@@ -6,30 +6,42 @@ Designed to handle millions of activities efficiently.
 """
 
 import logging
-from datetime import date
-from decimal import Decimal
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_db_session
+from app.core.dependencies import DateRange, get_date_range, get_db_session
 from app.database.repositories import EmissionSummaryRepository
 from app.pydantic_models.emission_summary import EmissionSummaryPydModel
 from app.utils.constants import ActivityTypeEnum, CategoryEnum, ScopeEnum
+from app.utils.cache import TTLCache
+from app.utils.responses import ORJSONResponse
 
 router = APIRouter(
     prefix="/api/v1/summaries",
     tags=["Emission Summaries"],
+    default_response_class=ORJSONResponse,
 )
 
 logger = logging.getLogger(__name__)
 
+# Validates a whole list of ORM summaries in one pydantic-core call
+SUMMARY_LIST_ADAPTER = TypeAdapter(list[EmissionSummaryPydModel])
+
+# Dashboards poll the latest summary for a handful of filter combinations;
+# repeat requests within a few seconds are served from memory. Cleared when
+# calculations or aggregations write summaries.
+LATEST_SUMMARY_CACHE = TTLCache(ttl=5, maxsize=256)
+
+# Marks a cache miss, as None is a valid cached answer
+_MISSING = object()
+
 
 @router.get("/", response_model=list[EmissionSummaryPydModel])
 async def get_summaries(
-    from_date: date = Query(..., description="Start date (inclusive)"),
-    to_date: date = Query(..., description="End date (inclusive)"),
+    date_range: DateRange = Depends(get_date_range),
     scope: Optional[ScopeEnum] = Query(None, description="Filter by GHG Protocol scope"),
     category: Optional[CategoryEnum] = Query(None, description="Filter by Scope 3 category"),
     activity: Optional[ActivityTypeEnum] = Query(None, description="Filter by activity type"),
@@ -63,21 +75,15 @@ async def get_summaries(
         - Uses indexed lookups on pre-computed summaries
         - No real-time joins or aggregations
     """
-    if from_date > to_date:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="from_date must be before or equal to to_date",
-        )
-
     logger.info(
-        f"Querying summaries: {from_date} to {to_date}, "
+        f"Querying summaries: {date_range.from_date} to {date_range.to_date}, "
         f"scope={scope}, category={category}, activity={activity}"
     )
 
     repo = EmissionSummaryRepository(session)
     summaries = await repo.get_by_date_range(
-        from_date=from_date,
-        to_date=to_date,
+        from_date=date_range.from_date,
+        to_date=date_range.to_date,
         scope=scope.value if scope else None,
         category=category.value if category else None,
         activity_type=activity.value if activity else None,
@@ -85,17 +91,16 @@ async def get_summaries(
 
     if not summaries:
         logger.warning(
-            f"No summaries found for {from_date} to {to_date}. "
+            f"No summaries found for {date_range.from_date} to {date_range.to_date}. "
             "You may need to run aggregation first."
         )
 
-    return [EmissionSummaryPydModel.model_validate(s) for s in summaries]
+    return SUMMARY_LIST_ADAPTER.validate_python(summaries, from_attributes=True)
 
 
 @router.get("/total", response_model=dict)
 async def get_total_emissions(
-    from_date: date = Query(..., description="Start date (inclusive)"),
-    to_date: date = Query(..., description="End date (inclusive)"),
+    date_range: DateRange = Depends(get_date_range),
     scope: Optional[ScopeEnum] = Query(None, description="Filter by GHG Protocol scope"),
     category: Optional[CategoryEnum] = Query(None, description="Filter by Scope 3 category"),
     activity: Optional[ActivityTypeEnum] = Query(None, description="Filter by activity type"),
@@ -121,38 +126,24 @@ async def get_total_emissions(
         GET /api/v1/summaries/total?from_date=2025-01-01&to_date=2025-12-31&scope=2
         ```
     """
-    if from_date > to_date:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="from_date must be before or equal to to_date",
-        )
-
     repo = EmissionSummaryRepository(session)
-    summaries = await repo.get_by_date_range(
-        from_date=from_date,
-        to_date=to_date,
+    totals = await repo.sum_by_date_range(
+        from_date=date_range.from_date,
+        to_date=date_range.to_date,
         scope=scope.value if scope else None,
         category=category.value if category else None,
         activity_type=activity.value if activity else None,
     )
 
-    # Calculate totals
-    total_co2e = Decimal("0")
-    total_activities = 0
-
-    for summary in summaries:
-        total_co2e += summary.total_co2e_tonnes
-        total_activities += summary.activity_count
-
     return {
-        "from_date": from_date,
-        "to_date": to_date,
+        "from_date": date_range.from_date,
+        "to_date": date_range.to_date,
         "scope": scope.value if scope else None,
         "category": category.value if category else None,
         "activity_type": activity.value if activity else None,
-        "total_co2e_tonnes": total_co2e,
-        "total_activities": total_activities,
-        "summaries_aggregated": len(summaries),
+        "total_co2e_tonnes": totals.total_co2e_tonnes,
+        "total_activities": totals.activity_count,
+        "summaries_aggregated": totals.summary_count,
     }
 
 
@@ -211,7 +202,7 @@ async def get_monthly_summary(
             "You may need to run monthly aggregation first."
         )
 
-    return [EmissionSummaryPydModel.model_validate(s) for s in summaries]
+    return SUMMARY_LIST_ADAPTER.validate_python(summaries, from_attributes=True)
 
 
 @router.get("/latest", response_model=EmissionSummaryPydModel | None)
@@ -241,22 +232,23 @@ async def get_latest_summary(
         GET /api/v1/summaries/latest?activity=Electricity
         ```
     """
-    repo = EmissionSummaryRepository(session)
-    summary = await repo.get_latest_summary(
-        scope=scope.value if scope else None,
-        category=category.value if category else None,
-        activity_type=activity.value if activity else None,
-    )
-
-    if summary:
-        return EmissionSummaryPydModel.model_validate(summary)
-    return None
+    cache_key = (scope, category, activity)
+    latest = LATEST_SUMMARY_CACHE.get(cache_key, _MISSING)
+    if latest is _MISSING:
+        repo = EmissionSummaryRepository(session)
+        summary = await repo.get_latest_summary(
+            scope=scope.value if scope else None,
+            category=category.value if category else None,
+            activity_type=activity.value if activity else None,
+        )
+        latest = EmissionSummaryPydModel.model_validate(summary) if summary else None
+        LATEST_SUMMARY_CACHE.set(cache_key, latest)
+    return latest
 
 
 @router.get("/breakdown", response_model=dict)
 async def get_emissions_breakdown(
-    from_date: date = Query(..., description="Start date (inclusive)"),
-    to_date: date = Query(..., description="End date (inclusive)"),
+    date_range: DateRange = Depends(get_date_range),
     breakdown_by: str = Query(
         ...,
         description="Breakdown dimension: scope, category, or activity",
@@ -283,40 +275,35 @@ async def get_emissions_breakdown(
         GET /api/v1/summaries/breakdown?from_date=2025-11-01&to_date=2025-11-30&breakdown_by=activity
         ```
     """
-    if from_date > to_date:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="from_date must be before or equal to to_date",
-        )
-
+    # Totals per dimension value are summed in the database
     repo = EmissionSummaryRepository(session)
-    summaries = await repo.get_by_date_range(from_date=from_date, to_date=to_date)
+    rows = await repo.sum_by_dimension(
+        date_range.from_date, date_range.to_date, breakdown_by
+    )
 
     breakdown = {}
 
-    for summary in summaries:
+    for row in rows:
         # Determine the key based on breakdown dimension
         if breakdown_by == "scope":
-            key = f"Scope {summary.scope}" if summary.scope else "All Scopes"
+            key = f"Scope {row.value}" if row.value else "All Scopes"
         elif breakdown_by == "category":
-            if summary.category:
+            if row.value:
                 category_names = {1: "Purchased Goods and Services", 6: "Business Travel"}
-                key = f"Category {summary.category}: {category_names.get(summary.category, 'Unknown')}"
+                key = f"Category {row.value}: {category_names.get(row.value, 'Unknown')}"
             else:
                 key = "All Categories"
         else:  # activity
-            key = summary.activity_type if summary.activity_type else "All Activities"
-
-        # Aggregate emissions for this key
-        if key not in breakdown:
-            breakdown[key] = {"total_co2e_tonnes": Decimal("0"), "activity_count": 0}
+            key = row.value if row.value else "All Activities"
 
-        breakdown[key]["total_co2e_tonnes"] += summary.total_co2e_tonnes
-        breakdown[key]["activity_count"] += summary.activity_count
+        breakdown[key] = {
+            "total_co2e_tonnes": row.total_co2e_tonnes,
+            "activity_count": row.activity_count,
+        }
 
     return {
-        "from_date": from_date,
-        "to_date": to_date,
+        "from_date": date_range.from_date,
+        "to_date": date_range.to_date,
         "breakdown_by": breakdown_by,
         "breakdown": breakdown,
     }
@@ -2,10 +2,14 @@
 FastAPI dependency injection functions following kkb_fastapi pattern.
 """
 from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from datetime import date
 
+from fastapi import Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.session_manager.db_session import Database
+from app.services.aggregators import EmissionAggregator
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -20,3 +24,41 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
     async with Database() as session:
         yield session
+
+
+def get_aggregator(
+    session: AsyncSession = Depends(get_db_session),
+) -> EmissionAggregator:
+    """
+    Dependency for an EmissionAggregator bound to the request's session.
+
+    FastAPI resolves get_db_session once per request, so a route that also
+    depends on it receives the same session.
+    """
+    return EmissionAggregator(session)
+
+
+@dataclass(frozen=True)
+class DateRange:
+    """Inclusive date range taken from from_date/to_date query parameters."""
+
+    from_date: date
+    to_date: date
+
+
+def get_date_range(
+    from_date: date = Query(..., description="Start date (inclusive)"),
+    to_date: date = Query(..., description="End date (inclusive)"),
+) -> DateRange:
+    """
+    Dependency for a validated from_date/to_date range.
+
+    Raises:
+        HTTPException: 400 if from_date is after to_date
+    """
+    if from_date > to_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="from_date must be before or equal to to_date",
+        )
+    return DateRange(from_date, to_date)
@@ -9,32 +9,27 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
-from app.api import (
-    activities_router,
-    aggregations_router,
-    calculations_router,
-    factors_router,
-    reports_router,
-    summaries_router,
-)
+from app.api import ROUTERS
 from app.core.config import get_config
-from app.database.base import engine_kw, get_db_url
+from app.database.base import get_db_url, get_engine_kw
 from app.database.session_manager.db_session import Database
+from app.utils.responses import ORJSONResponse
 
 logging.basicConfig(
     level=logging.DEBUG, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
+# Pooled connections opened at startup, so the first requests do not pay for
+# connecting
+POOL_WARM_CONNECTIONS = 5
+
 
 def register_routers(app: FastAPI):
     """Register all API routers."""
-    app.include_router(factors_router)
-    app.include_router(activities_router)
-    app.include_router(calculations_router)
-    app.include_router(reports_router)
-    app.include_router(aggregations_router)
-    app.include_router(summaries_router)
+    for router in ROUTERS:
+        app.include_router(router)
 
 
 @asynccontextmanager
@@ -47,13 +42,15 @@ async def lifespan(app: FastAPI):
     logging.info("Application startup")
     async_db_url = get_db_url(app.state.config)
 
-    Database.init(async_db_url, engine_kw=engine_kw)
+    Database.init(async_db_url, engine_kw=get_engine_kw(app.state.config))
+    await Database.warm_up(POOL_WARM_CONNECTIONS)
     logging.info("Initialized database")
 
     try:
         yield
     finally:
         logging.info("Application shutdown")
+        await Database.dispose()
 
 
 def get_app(config_file: str) -> FastAPI:
@@ -78,6 +75,8 @@ def get_app(config_file: str) -> FastAPI:
         version=config.data.get("api", {}).get("version", "1.0.0"),
         debug=config.data.get("api", {}).get("debug", False),
         lifespan=lifespan,
+        # Routers set this too; the app-wide default covers any added later
+        default_response_class=ORJSONResponse,
         # Generate better OpenAPI schema for enums
         generate_unique_id_function=lambda route: (
             f"{route.tags[0]}-{route.name}" if route.tags else route.name
@@ -104,4 +103,8 @@ def get_app(config_file: str) -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Report and list payloads repeat the same keys on every row and compress
+    # well; small responses are not worth the CPU.
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
     return app
@@ -5,35 +5,68 @@ Handles PostgreSQL async engine creation and session management.
 """
 
 import asyncio
-import contextlib
 import functools
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import asyncpg
 from alembic import command
 from alembic.config import Config as alembic_config
-from sqlalchemy import Engine, text
+from sqlalchemy import Engine
 from sqlalchemy.engine.url import URL
-from sqlalchemy.exc import DBAPIError
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import Config
 
-engine_kw = {
-    "pool_pre_ping": True,
-    # feature will normally emit SQL equivalent to "SELECT 1" each time
-    # a connection is checked out from the pool
-    "pool_size": 2,  # number of connections to keep open at a time
-    "max_overflow": 4,  # number of connections to allow to be opened above pool_size
-    "connect_args": {
-        "prepared_statement_cache_size": 0,  # disable prepared statement cache
-        "statement_cache_size": 0,  # disable statement cache
-    },
+# pgbouncer in transaction pooling mode hands each transaction a different
+# server connection, so statements prepared on one are missing on the next.
+# Set PGBOUNCER_TRANSACTION_POOLING=1 to turn the statement caches off.
+STATEMENT_CACHE_SIZES = (
+    {"prepared_statement_cache_size": 0, "statement_cache_size": 0}
+    if os.getenv("PGBOUNCER_TRANSACTION_POOLING", "").lower() in ("1", "true")
+    else {
+        "prepared_statement_cache_size": 256,  # SQLAlchemy-side prepared statements
+        "statement_cache_size": 1024,  # asyncpg's own statement cache
+    }
+)
+
+# Pool settings used when the config has no [pool] table, or leaves a key
+# out. Each can be overridden per environment, e.g. POOL_SIZE=40.
+POOL_DEFAULTS = {
+    "size": 20,  # number of connections to keep open at a time
+    "overflow": 30,  # number of connections to allow to be opened above size
+    "timeout": 30,  # seconds to wait for a connection before giving up
+    "recycle": 3600,  # replace connections older than this many seconds
 }
 
 
+def get_engine_kw(config: Config) -> dict:
+    """
+    Build engine keyword arguments from the [pool] config table.
+    """
+    pool = {**POOL_DEFAULTS, **config.data.get("pool", {})}
+    return {
+        # QueuePool blocks the event loop on checkout; this is its asyncio form
+        "poolclass": AsyncAdaptedQueuePool,
+        # Rather than a "SELECT 1" on every checkout, Database.init pings
+        # only connections that sat idle (see ping_idle_connections)
+        "pool_pre_ping": False,
+        "pool_size": pool["size"],
+        "max_overflow": pool["overflow"],
+        "pool_timeout": pool["timeout"],
+        "pool_recycle": pool["recycle"],
+        # Cache prepared statements per connection so repeated queries skip
+        # the server-side parse/plan
+        "connect_args": STATEMENT_CACHE_SIZES,
+        # Compiled SQL per statement shape; room above the default 500 for
+        # every per-model and optional-filter variant the repositories build
+        "query_cache_size": 1200,
+    }
+
+
 def get_db_url(config: Config) -> URL:
     """
     Construct database URL from config.
@@ -42,29 +75,30 @@ def get_db_url(config: Config) -> URL:
     return URL.create(drivername="postgresql+asyncpg", **config_db)
 
 
-def get_async_engine(async_db_url: URL) -> Engine:
+def get_async_engine(async_db_url: URL, **engine_kw) -> Engine:
     """
     Create async database engine with connection pooling.
+
+    Args:
+        async_db_url: Database URL
+        **engine_kw: Engine keyword arguments, usually from get_engine_kw()
     """
-    async_engine = create_async_engine(
-        async_db_url,
-        poolclass=QueuePool,
-        pool_recycle=3600,
-        pool_pre_ping=True,
-        pool_size=60,
-        max_overflow=80,
-        pool_timeout=30,
-    )
+    async_engine = create_async_engine(async_db_url, **engine_kw)
     return async_engine
 
 
-def get_async_session_maker(async_db_url: URL) -> sessionmaker:
+def get_async_session_maker(
+    async_db_url: URL, **engine_kw
+) -> async_sessionmaker[AsyncSession]:
     """
     Create async session maker.
+
+    Sessions do not autoflush: repositories write with explicit statements
+    and flush() where they add instances.
     """
-    async_engine = get_async_engine(async_db_url)
-    async_session_maker = sessionmaker(
-        bind=async_engine, expire_on_commit=False, class_=AsyncSession
+    async_engine = get_async_engine(async_db_url, **engine_kw)
+    async_session_maker = async_sessionmaker(
+        bind=async_engine, expire_on_commit=False, autoflush=False
     )
     return async_session_maker
 
@@ -96,54 +130,36 @@ async def create_database(config: Config) -> bool:
         raise ValueError("Database name missing in configuration for creation.")
 
     # Prepare connection parameters for the maintenance database
-    # Handle 'user' vs 'username' for URL creation, ensuring 'username' is used by URL.create
-    if "user" in original_db_params_copy and "username" not in original_db_params_copy:
-        original_db_params_copy["username"] = original_db_params_copy.pop("user")
-
-    # Connect to the default 'postgres' maintenance database
-    maintenance_db_connect_params = {**original_db_params_copy, "database": "postgres"}
-
-    maintenance_url = URL.create(
-        drivername="postgresql+asyncpg", **maintenance_db_connect_params
-    )
-    maintenance_engine = None
+    # asyncpg takes 'user', while the config may use 'username' (URL style)
+    if "username" in original_db_params_copy and "user" not in original_db_params_copy:
+        original_db_params_copy["user"] = original_db_params_copy.pop("username")
+    if "port" in original_db_params_copy:
+        original_db_params_copy["port"] = int(original_db_params_copy["port"])
+
+    # One statement on one connection: asyncpg directly, without building a
+    # SQLAlchemy engine. asyncpg runs statements outside a transaction block
+    # unless asked for one, as CREATE DATABASE requires.
+    connection = None
     try:
-        maintenance_engine = get_async_engine(maintenance_url)
+        # Connect to the default 'postgres' maintenance database
+        connection = await asyncpg.connect(
+            **original_db_params_copy,
+            database="postgres",
+            server_settings={"application_name": "bootstrap"},
+        )
         logging.info(
             f"Attempting to create database '{target_database_name}' in "
             f"{original_db_params_copy['host']} if it does not exist."
         )
-        async with maintenance_engine.connect() as connection:
-            # For PostgreSQL, CREATE DATABASE cannot run inside a transaction block.
-            # We get a version of the connection configured for AUTOCOMMIT.
-            autocommit_connection = await connection.execution_options(
-                isolation_level="AUTOCOMMIT"
-            )
-            await autocommit_connection.execute(
-                text(f'CREATE DATABASE "{target_database_name}"')
-            )
+        await connection.execute(f'CREATE DATABASE "{target_database_name}"')
         logging.info(f"Database '{target_database_name}' created successfully.")
         return True  # Database was newly created
-    except DBAPIError as e:
-        # Check for PostgreSQL specific error code '42P04' (duplicate_database)
-        with contextlib.suppress(AttributeError):
-            if (
-                hasattr(e, "orig")
-                and e.orig is not None
-                and hasattr(e.orig, "pgcode")
-                and e.orig.pgcode == "42P04"
-            ):
-                logging.warning(
-                    f"Database '{target_database_name}' already exists "
-                    f"(detected by pgcode '42P04'). No action taken."
-                )
-                return False  # Database already existed
-
-        # If it's a DBAPIError but not the specific one we're handling, re-raise it.
-        logging.error(
-            f"A DBAPIError occurred while trying to create database '{target_database_name}': {e}"
+    except asyncpg.DuplicateDatabaseError:
+        logging.warning(
+            f"Database '{target_database_name}' already exists "
+            f"(detected by pgcode '42P04'). No action taken."
         )
-        raise
+        return False  # Database already existed
     except Exception as e:
         logging.error(
             f"An unexpected error occurred while trying to create "
@@ -151,11 +167,8 @@ async def create_database(config: Config) -> bool:
         )
         raise
     finally:
-        if maintenance_engine:
-            await maintenance_engine.dispose()
-
-    # This should never be reached due to the try/except structure above
-    return False
+        if connection is not None:
+            await connection.close()
 
 
 async def apply_db_migration(config: Config):
@@ -184,11 +197,12 @@ async def apply_db_migration(config: Config):
     sync_url = str(async_url).replace("postgresql+asyncpg", "postgresql")
     alembic_cfg.set_main_option("sqlalchemy.url", sync_url)
 
-    # Run Alembic migrations synchronously in a thread pool to avoid blocking the event loop
-    # This effectively makes the migration process synchronous from the application's perspective
+    # Run Alembic in a thread of its own so its blocking I/O neither blocks
+    # the event loop nor occupies the loop's shared default executor
     logging.info("Starting database migrations...")
     loop = asyncio.get_running_loop()
-    await loop.run_in_executor(
-        None, functools.partial(command.upgrade, alembic_cfg, "head")
-    )
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="alembic") as executor:
+        await loop.run_in_executor(
+            executor, functools.partial(command.upgrade, alembic_cfg, "head")
+        )
     logging.info("Database migration completed successfully")
@@ -0,0 +1,152 @@
+"""
+Helpers for Alembic data migrations.
+
+Backfills on large tables should not run as one statement inside the
+migration transaction: that holds row locks and bloats the table for the
+whole run, and a failure rolls everything back. The helpers here update rows
+in small batches, each committed on its own, and build or drop indexes
+without blocking writes (including on partitioned tables).
+"""
+
+import logging
+
+from alembic import op
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+
+def paginated_backfill(
+    table: str,
+    set_clause: str,
+    where_clause: str,
+    pk: str = "id",
+    batch_size: int = 1000,
+) -> int:
+    """
+    Update all rows matching where_clause in batches of batch_size.
+
+    Each batch is a single UPDATE ... WHERE pk IN (SELECT ... LIMIT n FOR
+    UPDATE SKIP LOCKED) committed in autocommit mode, so memory stays at one
+    batch and concurrent writers are never blocked for long.
+
+    where_clause must stop matching a row once set_clause has been applied
+    to it (e.g. "raw_data IS NULL" with "raw_data = '{}'"), otherwise the
+    loop never terminates. Rows locked by concurrent transactions are skipped
+    and picked up by a later batch.
+
+    Usage inside a migration's upgrade():
+        paginated_backfill(
+            "emission_results",
+            set_clause="calculation_metadata = '{}'::jsonb",
+            where_clause="calculation_metadata IS NULL",
+        )
+
+    Args:
+        table: Table to update
+        set_clause: SQL for the SET clause (without the SET keyword)
+        where_clause: SQL predicate selecting rows that still need the update
+        pk: Primary key column used to address batches
+        batch_size: Maximum number of rows updated per transaction
+
+    Returns:
+        Total number of rows updated
+    """
+    stmt = text(
+        f"UPDATE {table} SET {set_clause} "
+        f"WHERE {pk} IN ("
+        f"SELECT {pk} FROM {table} WHERE {where_clause} "
+        f"LIMIT :batch_size FOR UPDATE SKIP LOCKED"
+        f") RETURNING {pk}"
+    )
+
+    total = 0
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        while True:
+            updated = len(conn.execute(stmt, {"batch_size": batch_size}).fetchall())
+            if not updated:
+                break
+            total += updated
+            logger.info(f"Backfilled {total} rows in {table}")
+
+    return total
+
+
+def _partitions(table: str) -> list[str]:
+    """Return the names of the partitions of table (empty if not partitioned)."""
+    return list(
+        op.get_bind()
+        .execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = CAST(:table AS regclass) "
+                "ORDER BY c.relname"
+            ),
+            {"table": table},
+        )
+        .scalars()
+    )
+
+
+def create_index_concurrently(
+    name: str, table: str, definition: str, unique: bool = False
+) -> None:
+    """
+    Build an index without blocking writes, on plain or partitioned tables.
+
+    Postgres cannot run CREATE INDEX CONCURRENTLY on a partitioned table, so
+    for those the index is created on the parent only (ON ONLY, invalid until
+    complete), built concurrently on each partition and attached. Partitions
+    created later inherit the index automatically.
+
+    Usage:
+        create_index_concurrently(
+            "ix_emission_results_co2e_tonnes", "emission_results", "(co2e_tonnes)"
+        )
+
+    Args:
+        name: Index name
+        table: Table to index
+        definition: Everything after "ON <table>", e.g. "USING brin (created_at)"
+            or "(activity_id) INCLUDE (co2e_tonnes) WHERE ..."
+        unique: Create a unique index
+    """
+    create = "CREATE UNIQUE INDEX" if unique else "CREATE INDEX"
+
+    with op.get_context().autocommit_block():
+        partitions = _partitions(table)
+        if not partitions:
+            op.execute(f"{create} CONCURRENTLY IF NOT EXISTS {name} ON {table} {definition}")
+            return
+
+        op.execute(f"{create} IF NOT EXISTS {name} ON ONLY {table} {definition}")
+        for partition in partitions:
+            partition_index = f"{name}_{partition[len(table) + 1 :]}"
+            op.execute(
+                f"{create} CONCURRENTLY IF NOT EXISTS {partition_index} "
+                f"ON {partition} {definition}"
+            )
+            op.execute(f"ALTER INDEX {name} ATTACH PARTITION {partition_index}")
+
+
+def drop_index_concurrently(name: str) -> None:
+    """
+    Drop an index without blocking writes where Postgres allows it.
+
+    Indexes on partitioned tables cannot be dropped concurrently; dropping
+    the parent index also drops the attached partition indexes.
+
+    Args:
+        name: Index name
+    """
+    with op.get_context().autocommit_block():
+        is_partitioned = op.get_bind().execute(
+            text("SELECT relkind = 'I' FROM pg_class WHERE relname = :name"),
+            {"name": name},
+        ).scalar()
+        if is_partitioned:
+            op.execute(f"DROP INDEX IF EXISTS {name}")
+        else:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
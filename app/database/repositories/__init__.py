@@ -12,6 +12,7 @@ from app.database.repositories.activity import (
 from app.database.repositories.base import BaseRepository
 from app.database.repositories.emission_factor import EmissionFactorRepository
 from app.database.repositories.emission_result import EmissionResultRepository
+from app.database.repositories.emission_rollup import EmissionRollupRepository
 from app.database.repositories.emission_summary import EmissionSummaryRepository
 
 __all__ = [
@@ -21,6 +22,7 @@ __all__ = [
     "ElectricityActivityRepository",
     "EmissionFactorRepository",
     "EmissionResultRepository",
+    "EmissionRollupRepository",
     "EmissionSummaryRepository",
     "GoodsServicesActivityRepository",
 ]
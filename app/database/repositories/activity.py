@@ -3,19 +3,26 @@ Repository for Activity database operations.
 
 Handles all database interactions for all activity types (Electricity, Air Travel, Goods & Services).
 """
+import json
+from collections.abc import AsyncIterator
 from datetime import date
-from typing import Union
+from typing import Any, Union
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, exists, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
 from app.database.repositories.base import BaseRepository
 from app.database.schemas import (
     AirTravelActivityDBModel,
     ElectricityActivityDBModel,
+    EmissionResultDBModel,
     GoodsServicesActivityDBModel,
 )
+from app.services.calculators.unit_converter import UnitConverter
+from app.utils.constants import ACTIVITY_KIND_BY_TYPE, ActivityType
+from app.utils.uuid7 import uuid7
 
 ActivityModelType = Union[
     ElectricityActivityDBModel,
@@ -23,6 +30,32 @@ ActivityModelType = Union[
     GoodsServicesActivityDBModel,
 ]
 
+# Base listing statement per model, built once at import. Requests only add
+# their cursor and paging clauses, and the unchanged core keeps hitting
+# SQLAlchemy's compiled statement cache.
+#
+# `is_deleted == False` is deliberate: it renders `is_deleted = false`, which
+# matches the partial ix_*_active_date indexes. `.is_(False)` renders
+# `IS false`, which the planner does not match to those indexes.
+_ACTIVITY_MODELS = (
+    ElectricityActivityDBModel,
+    AirTravelActivityDBModel,
+    GoodsServicesActivityDBModel,
+)
+
+_LIST_ACTIVE = {
+    model: select(model)
+    .where(model.is_deleted == False)
+    .order_by(model.date.desc(), model.id.desc())
+    for model in _ACTIVITY_MODELS
+}
+
+# Single-row lookup per model, executed with {"id": ...}
+_GET_ACTIVE_BY_ID = {
+    model: select(model).where(model.id == bindparam("id"), model.is_deleted == False)
+    for model in _ACTIVITY_MODELS
+}
+
 
 class ActivityRepository(BaseRepository[ActivityModelType]):
     """
@@ -38,6 +71,13 @@ class ActivityRepository(BaseRepository[ActivityModelType]):
         "goods_services": GoodsServicesActivityDBModel,
     }
 
+    # Stored activity_type label for each repository type
+    ACTIVITY_TYPE_MAP: dict[str, str] = {
+        "electricity": ActivityType.ELECTRICITY,
+        "air_travel": ActivityType.AIR_TRAVEL,
+        "goods_services": ActivityType.GOODS_SERVICES,
+    }
+
     def __init__(
         self,
         session: AsyncSession,
@@ -63,27 +103,116 @@ class ActivityRepository(BaseRepository[ActivityModelType]):
         super().__init__(model, session)
         self.activity_type = activity_type
 
+    async def create(self, **data: Any) -> ActivityModelType:
+        """
+        Create a new activity, filling in its activity_type label.
+
+        Args:
+            **data: Field values for the new activity
+
+        Returns:
+            Created activity
+        """
+        data.setdefault("activity_type", self.ACTIVITY_TYPE_MAP[self.activity_type])
+        return await super().create(**data)
+
+    async def copy_create(self, items: list[dict[str, Any]]) -> list[UUID]:
+        """
+        Insert many activities with a single COPY.
+
+        Client-side defaults (id, activity_type) are filled in here because
+        COPY bypasses the ORM; columns with server defaults (timestamps) are
+        left out for the database to fill. Rows are streamed over the
+        session's connection, so they commit or roll back with the session.
+
+        Args:
+            items: List of dicts containing field values
+
+        Returns:
+            Ids of the created activities, in input order
+        """
+        columns = [
+            column.name
+            for column in self.model.__table__.columns
+            if column.server_default is None
+        ]
+        defaults = {
+            "activity_type": self.ACTIVITY_TYPE_MAP[self.activity_type],
+            "is_deleted": False,
+        }
+
+        ids = []
+        records = []
+        for item in items:
+            row = {**defaults, **item, "id": item.get("id") or uuid7()}
+            row["raw_data"] = json.dumps(row.get("raw_data") or {})
+            ids.append(row["id"])
+            records.append(tuple(row.get(column) for column in columns))
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            self.model.__tablename__, records=records, columns=columns
+        )
+        return ids
+
     async def get_all_active(
-        self, skip: int = 0, limit: int = 100
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        before_date: date | None = None,
+        before_id: UUID | None = None,
     ) -> list[ActivityModelType]:
         """
-        Get all active (non-deleted) activities.
+        Get all active (non-deleted) activities, newest first.
+
+        Supports keyset pagination: pass the date and id of the last row of
+        the previous page as before_date/before_id to continue after it. This
+        seeks directly into the partial (date DESC, id DESC) index instead of
+        scanning and discarding `skip` rows.
 
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
+            before_date: Return only activities before this date (keyset cursor)
+            before_id: Id of the last row seen, breaks ties within before_date
 
         Returns:
             List of active activities
         """
-        stmt = (
-            select(self.model)
-            .where(self.model.is_deleted == False)
-            .offset(skip)
-            .limit(limit)
-        )
+        stmt = _LIST_ACTIVE[self.model]
+
+        if before_date is not None and before_id is not None:
+            stmt = stmt.where(
+                tuple_(self.model.date, self.model.id) < tuple_(before_date, before_id)
+            )
+        elif before_date is not None:
+            stmt = stmt.where(self.model.date < before_date)
+
+        stmt = stmt.offset(skip).limit(limit)
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
+
+    async def iter_all_active(
+        self, chunk_size: int = 500
+    ) -> AsyncIterator[list[ActivityModelType]]:
+        """
+        Iterate over all active activities, newest first, a chunk at a time.
+
+        Rows come from a server-side cursor chunk_size at a time, so memory
+        stays at one chunk however many activities exist. The session must
+        stay open while iterating.
+
+        Args:
+            chunk_size: Number of activities fetched per round trip
+
+        Yields:
+            Lists of up to chunk_size active activities
+        """
+        stmt = _LIST_ACTIVE[self.model].execution_options(yield_per=chunk_size)
+        result = await self.session.stream_scalars(stmt)
+        async for chunk in result.partitions():
+            yield chunk
 
     async def get_by_id_active(self, id: UUID) -> ActivityModelType | None:
         """
@@ -95,11 +224,52 @@ class ActivityRepository(BaseRepository[ActivityModelType]):
         Returns:
             Activity if found and not deleted, None otherwise
         """
+        result = await self.session.execute(_GET_ACTIVE_BY_ID[self.model], {"id": id})
+        return result.scalars().first()
+
+    async def get_by_ids_active(self, ids: list[UUID]) -> list[ActivityModelType]:
+        """
+        Get active (non-deleted) activities by IDs in one query.
+
+        Args:
+            ids: Activity UUIDs
+
+        Returns:
+            Active activities found among the IDs (in no particular order)
+        """
         stmt = select(self.model).where(
-            self.model.id == id, self.model.is_deleted == False
+            self.model.id.in_(ids), self.model.is_deleted == False
         )
         result = await self.session.execute(stmt)
-        return result.scalars().first()
+        return result.scalars().all()
+
+    async def get_by_column(
+        self,
+        column: InstrumentedAttribute,
+        value: Any,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[ActivityModelType]:
+        """
+        Get active activities whose column equals a value.
+
+        Args:
+            column: Column of this repository's model to filter on
+            value: Value to match
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of matching active activities
+        """
+        stmt = (
+            select(self.model)
+            .where(column == value, self.model.is_deleted == False)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
 
     async def get_by_date_range(
         self, start_date: date, end_date: date, skip: int = 0, limit: int = 100
@@ -127,7 +297,7 @@ class ActivityRepository(BaseRepository[ActivityModelType]):
             .limit(limit)
         )
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_pending_calculation(
         self, skip: int = 0, limit: int = 100
@@ -135,16 +305,24 @@ class ActivityRepository(BaseRepository[ActivityModelType]):
         """
         Get activities that don't have emission calculations yet.
 
+        The anti-join runs in SQL, probing the (activity_kind, activity_id)
+        index on emission_results once per candidate.
+
         Args:
             skip: Number of records to skip
             limit: Maximum number of records to return
 
         Returns:
-            List of activities without emission results
+            List of active activities without emission results, newest first
         """
-        # This requires a join with EmissionResult to find activities without results
-        # For now, return all active activities (filtering can be done in service layer)
-        return await self.get_all_active(skip=skip, limit=limit)
+        activity_kind = ACTIVITY_KIND_BY_TYPE[self.ACTIVITY_TYPE_MAP[self.activity_type]]
+        has_result = exists().where(
+            EmissionResultDBModel.activity_kind == activity_kind,
+            EmissionResultDBModel.activity_id == self.model.id,
+        )
+        stmt = _LIST_ACTIVE[self.model].where(~has_result).offset(skip).limit(limit)
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
 
     async def soft_delete(self, id: UUID) -> ActivityModelType | None:
         """
@@ -201,17 +379,7 @@ class ElectricityActivityRepository(ActivityRepository):
         Returns:
             List of activities for the specified country
         """
-        stmt = (
-            select(self.model)
-            .where(
-                self.model.country == country,
-                self.model.is_deleted == False,
-            )
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return await self.get_by_column(self.model.country, country, skip, limit)
 
 
 class AirTravelActivityRepository(ActivityRepository):
@@ -221,6 +389,39 @@ class AirTravelActivityRepository(ActivityRepository):
         """Initialize air travel activity repository."""
         super().__init__(session, activity_type="air_travel")
 
+    async def create(self, **data: Any) -> AirTravelActivityDBModel:
+        """
+        Create a new air travel activity.
+
+        distance_km is derived from distance_miles when not given.
+
+        Args:
+            **data: Field values for the new activity
+
+        Returns:
+            Created activity
+        """
+        if data.get("distance_km") is None:
+            data["distance_km"] = UnitConverter.miles_to_km(data["distance_miles"])
+        return await super().create(**data)
+
+    async def copy_create(self, items: list[dict[str, Any]]) -> list[UUID]:
+        """
+        Insert many air travel activities with a single COPY.
+
+        distance_km is derived from distance_miles when not given.
+
+        Args:
+            items: List of dicts containing field values
+
+        Returns:
+            Ids of the created activities, in input order
+        """
+        for item in items:
+            if item.get("distance_km") is None:
+                item["distance_km"] = UnitConverter.miles_to_km(item["distance_miles"])
+        return await super().copy_create(items)
+
     async def get_by_flight_range(
         self, flight_range: str, skip: int = 0, limit: int = 100
     ) -> list[AirTravelActivityDBModel]:
@@ -235,17 +436,9 @@ class AirTravelActivityRepository(ActivityRepository):
         Returns:
             List of activities for the specified flight range
         """
-        stmt = (
-            select(self.model)
-            .where(
-                self.model.flight_range == flight_range,
-                self.model.is_deleted == False,
-            )
-            .offset(skip)
-            .limit(limit)
+        return await self.get_by_column(
+            self.model.flight_range, flight_range, skip, limit
         )
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
 
 
 class GoodsServicesActivityRepository(ActivityRepository):
@@ -269,14 +462,6 @@ class GoodsServicesActivityRepository(ActivityRepository):
         Returns:
             List of activities for the specified category
         """
-        stmt = (
-            select(self.model)
-            .where(
-                self.model.supplier_category == supplier_category,
-                self.model.is_deleted == False,
-            )
-            .offset(skip)
-            .limit(limit)
+        return await self.get_by_column(
+            self.model.supplier_category, supplier_category, skip, limit
         )
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
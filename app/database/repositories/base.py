@@ -3,10 +3,11 @@ Base repository with common CRUD operations.
 
 Provides generic database operations that can be inherited by specific repositories.
 """
+from collections.abc import AsyncIterator
 from typing import Any, Generic, TypeVar
 from uuid import UUID
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import Select, delete, func, insert, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 ModelType = TypeVar("ModelType")
@@ -40,11 +41,19 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Created model instance
         """
-        instance = self.model(**data)
-        self.session.add(instance)
-        await self.session.flush()
-        await self.session.refresh(instance)
-        return instance
+        # INSERT ... RETURNING hands back server-side values in the same round
+        # trip, so no follow-up refresh is needed.
+        stmt = insert(self.model).values(**data).returning(self.model)
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    def _apply_filters(self, stmt: Select, filters: dict | None) -> Select:
+        """Add a WHERE clause per field:value filter naming a model field."""
+        if filters:
+            for field, value in filters.items():
+                if hasattr(self.model, field):
+                    stmt = stmt.where(getattr(self.model, field) == value)
+        return stmt
 
     async def get_by_id(self, id: UUID) -> ModelType | None:
         """
@@ -74,17 +83,34 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             List of model instances
         """
-        stmt = select(self.model)
-
-        # Apply filters if provided
-        if filters:
-            for field, value in filters.items():
-                if hasattr(self.model, field):
-                    stmt = stmt.where(getattr(self.model, field) == value)
-
+        stmt = self._apply_filters(select(self.model), filters)
         stmt = stmt.offset(skip).limit(limit)
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
+
+    async def stream(
+        self, filters: dict | None = None, batch_size: int = 1000
+    ) -> AsyncIterator[ModelType]:
+        """
+        Iterate over all matching records without loading them all at once.
+
+        Rows are fetched from a server-side cursor batch_size at a time, so
+        memory stays flat however many records match. For background jobs
+        scanning whole tables; the session must stay open while iterating.
+
+        Args:
+            filters: Optional dict of field:value filters
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            Model instances
+        """
+        stmt = self._apply_filters(select(self.model), filters)
+        result = await self.session.stream_scalars(
+            stmt.execution_options(yield_per=batch_size)
+        )
+        async for instance in result:
+            yield instance
 
     async def update(self, id: UUID, **data: Any) -> ModelType | None:
         """
@@ -97,12 +123,16 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Updated model instance if found, None otherwise
         """
-        stmt = update(self.model).where(self.model.id == id).values(**data)
-        await self.session.execute(stmt)
-        await self.session.flush()
-
-        # Fetch and return updated instance
-        return await self.get_by_id(id)
+        # UPDATE ... RETURNING hands back the updated row in the same round
+        # trip instead of selecting it again.
+        stmt = (
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**data)
+            .returning(self.model)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def delete(self, id: UUID) -> bool:
         """
@@ -114,10 +144,9 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             True if deleted, False if not found
         """
-        stmt = delete(self.model).where(self.model.id == id)
+        stmt = delete(self.model).where(self.model.id == id).returning(self.model.id)
         result = await self.session.execute(stmt)
-        await self.session.flush()
-        return result.rowcount > 0
+        return result.scalar_one_or_none() is not None
 
     async def soft_delete(self, id: UUID) -> ModelType | None:
         """
@@ -146,16 +175,10 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             Number of matching records
         """
-        stmt = select(self.model)
-
-        # Apply filters if provided
-        if filters:
-            for field, value in filters.items():
-                if hasattr(self.model, field):
-                    stmt = stmt.where(getattr(self.model, field) == value)
-
+        stmt = select(func.count()).select_from(self.model)
+        stmt = self._apply_filters(stmt, filters)
         result = await self.session.execute(stmt)
-        return len(result.scalars().all())
+        return result.scalar_one()
 
     async def exists(self, id: UUID) -> bool:
         """
@@ -167,8 +190,9 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             True if exists, False otherwise
         """
-        instance = await self.get_by_id(id)
-        return instance is not None
+        stmt = select(literal(1)).where(self.model.id == id).limit(1)
+        result = await self.session.execute(stmt)
+        return result.scalar() is not None
 
     async def bulk_create(self, items: list[dict[str, Any]]) -> list[ModelType]:
         """
@@ -180,12 +204,12 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             List of created model instances
         """
-        instances = [self.model(**item) for item in items]
-        self.session.add_all(instances)
-        await self.session.flush()
-
-        # Refresh all instances
-        for instance in instances:
-            await self.session.refresh(instance)
+        if not items:
+            return []
 
-        return instances
+        # One ORM bulk INSERT ... RETURNING instead of a refresh per row.
+        # SQLAlchemy splits large inputs into batches below Postgres' bind
+        # parameter limit; rows come back in the order of items.
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await self.session.scalars(stmt, items)
+        return result.all()
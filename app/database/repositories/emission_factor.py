@@ -4,11 +4,29 @@ Repository for EmissionFactor database operations.
 Handles all database interactions for emission factors.
 """
 
-from sqlalchemy import select
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import bindparam, func, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.database.repositories.base import BaseRepository
 from app.database.schemas import EmissionFactorDBModel
+from app.utils.cache import TTLCache
+
+# Factors only change when a factor set is seeded, so lookups by identifier
+# are cached per worker. Column values are cached rather than instances,
+# which belong to the session that loaded them. Writes through this
+# repository clear the cache.
+LOOKUP_CACHE = TTLCache(ttl=600, maxsize=2048)
+
+_COLUMN_KEYS = tuple(attr.key for attr in inspect(EmissionFactorDBModel).column_attrs)
+
+# Built once at import, executed with {"lookup_identifier": ...}
+_GET_BY_LOOKUP = select(EmissionFactorDBModel).where(
+    EmissionFactorDBModel.lookup_identifier == bindparam("lookup_identifier")
+)
 
 
 class EmissionFactorRepository(BaseRepository[EmissionFactorDBModel]):
@@ -23,8 +41,30 @@ class EmissionFactorRepository(BaseRepository[EmissionFactorDBModel]):
         """
         super().__init__(EmissionFactorDBModel, session)
 
+    async def create(self, **data: Any) -> EmissionFactorDBModel:
+        """Create a factor and clear the lookup cache."""
+        LOOKUP_CACHE.clear()
+        return await super().create(**data)
+
+    async def bulk_create(
+        self, items: list[dict[str, Any]]
+    ) -> list[EmissionFactorDBModel]:
+        """Create factors in bulk and clear the lookup cache."""
+        LOOKUP_CACHE.clear()
+        return await super().bulk_create(items)
+
+    async def update(self, id: UUID, **data: Any) -> EmissionFactorDBModel | None:
+        """Update a factor and clear the lookup cache."""
+        LOOKUP_CACHE.clear()
+        return await super().update(id, **data)
+
+    async def delete(self, id: UUID) -> bool:
+        """Delete a factor and clear the lookup cache."""
+        LOOKUP_CACHE.clear()
+        return await super().delete(id)
+
     async def get_by_activity_type(
-        self, activity_type: str, skip: int = 0, limit: int = 100
+        self, activity_type: str, skip: int = 0, limit: int | None = 100
     ) -> list[EmissionFactorDBModel]:
         """
         Get emission factors by activity type.
@@ -32,7 +72,7 @@ class EmissionFactorRepository(BaseRepository[EmissionFactorDBModel]):
         Args:
             activity_type: Type of activity (e.g., 'Electricity', 'Air Travel')
             skip: Number of records to skip
-            limit: Maximum number of records to return
+            limit: Maximum number of records to return (None for all)
 
         Returns:
             List of emission factors matching the activity type
@@ -44,7 +84,7 @@ class EmissionFactorRepository(BaseRepository[EmissionFactorDBModel]):
             .limit(limit)
         )
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_by_scope(
         self, scope: int, skip: int = 0, limit: int = 100
@@ -67,7 +107,7 @@ class EmissionFactorRepository(BaseRepository[EmissionFactorDBModel]):
             .limit(limit)
         )
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_by_lookup_identifier(
         self, lookup_identifier: str
@@ -81,34 +121,59 @@ class EmissionFactorRepository(BaseRepository[EmissionFactorDBModel]):
         Returns:
             Emission factor if found, None otherwise
         """
-        stmt = select(self.model).where(
-            self.model.lookup_identifier == lookup_identifier
+        values = LOOKUP_CACHE.get(lookup_identifier)
+        if values is not None:
+            # Attach a copy to this session without loading it again
+            factor = self.model(**values)
+            make_transient_to_detached(factor)
+            return await self.session.merge(factor, load=False)
+
+        result = await self.session.execute(
+            _GET_BY_LOOKUP, {"lookup_identifier": lookup_identifier}
         )
-        result = await self.session.execute(stmt)
-        return result.scalars().first()
+        factor = result.scalars().first()
+        if factor is not None:
+            LOOKUP_CACHE.set(
+                lookup_identifier, {key: getattr(factor, key) for key in _COLUMN_KEYS}
+            )
+        return factor
 
     async def search_by_identifier(
-        self, identifier: str, activity_type: str | None = None
+        self,
+        identifier: str,
+        activity_type: str | None = None,
+        prefix: bool = False,
     ) -> list[EmissionFactorDBModel]:
         """
-        Search emission factors by partial identifier match.
+        Search emission factors by partial identifier match (case-insensitive).
+
+        A prefix search can use the lower(lookup_identifier) pattern index;
+        a substring search has a leading wildcard and scans the table.
 
         Args:
             identifier: Partial identifier to search for
             activity_type: Optional activity type filter
+            prefix: Match only identifiers starting with identifier
 
         Returns:
             List of matching emission factors
         """
-        stmt = select(self.model).where(
-            self.model.lookup_identifier.ilike(f"%{identifier}%")
-        )
+        if prefix:
+            stmt = select(self.model).where(
+                func.lower(self.model.lookup_identifier).startswith(
+                    identifier.lower(), autoescape=True
+                )
+            )
+        else:
+            stmt = select(self.model).where(
+                self.model.lookup_identifier.ilike(f"%{identifier}%")
+            )
 
         if activity_type:
             stmt = stmt.where(self.model.activity_type == activity_type)
 
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_by_activity_type_and_category(
         self, activity_type: str, category: int | None = None
@@ -131,7 +196,7 @@ class EmissionFactorRepository(BaseRepository[EmissionFactorDBModel]):
             stmt = stmt.where(self.model.category.is_(None))
 
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_all_active(
         self, skip: int = 0, limit: int = 100
@@ -6,11 +6,36 @@ Handles all database interactions for emission calculation results.
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, bindparam, delete, exists, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.repositories.base import BaseRepository
-from app.database.schemas import EmissionResultDBModel
+from app.database.schemas import EmissionResultDBModel, EmissionRollupDBModel
+from app.database.schemas.emission_result import LOW_CONFIDENCE
+
+# Per-activity lookups, built once at import and executed with
+# {"activity_id": ...}
+_FOR_ACTIVITY = EmissionResultDBModel.activity_id == bindparam("activity_id")
+_ALL_BY_ACTIVITY = (
+    select(EmissionResultDBModel)
+    .where(_FOR_ACTIVITY)
+    .order_by(EmissionResultDBModel.created_at.desc())
+)
+_LATEST_BY_ACTIVITY = _ALL_BY_ACTIVITY.limit(1)
+_COUNT_BY_ACTIVITY = (
+    select(func.count()).select_from(EmissionResultDBModel).where(_FOR_ACTIVITY)
+)
+_ANY_BY_ACTIVITY = select(exists().where(_FOR_ACTIVITY))
+
+# Columns bulk readers need. Selected as plain rows they skip building
+# EmissionResultDBModel instances: no identity map entries, attribute
+# instrumentation or calculation_metadata decoding per row.
+_RESULT_ROWS = select(
+    EmissionResultDBModel.id,
+    EmissionResultDBModel.activity_id,
+    EmissionResultDBModel.co2e_tonnes,
+    EmissionResultDBModel.created_at,
+)
 
 
 class EmissionResultRepository(BaseRepository[EmissionResultDBModel]):
@@ -37,13 +62,9 @@ class EmissionResultRepository(BaseRepository[EmissionResultDBModel]):
         Returns:
             Most recent emission result for the activity, or None
         """
-        stmt = (
-            select(self.model)
-            .where(self.model.activity_id == activity_id)
-            .order_by(self.model.created_at.desc())
-            .limit(1)
+        result = await self.session.execute(
+            _LATEST_BY_ACTIVITY, {"activity_id": activity_id}
         )
-        result = await self.session.execute(stmt)
         return result.scalars().first()
 
     async def get_all_by_activity_id(
@@ -58,21 +79,16 @@ class EmissionResultRepository(BaseRepository[EmissionResultDBModel]):
         Returns:
             List of emission results ordered by created_at descending
         """
-        stmt = (
-            select(self.model)
-            .where(self.model.activity_id == activity_id)
-            .order_by(self.model.created_at.desc())
+        result = await self.session.execute(
+            _ALL_BY_ACTIVITY, {"activity_id": activity_id}
         )
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_by_activity_ids(
         self, activity_ids: list[UUID]
     ) -> list[EmissionResultDBModel]:
         """
-        Get emission results for multiple activities.
-
-        Returns the most recent result for each activity.
+        Get all emission results for multiple activities (including historical).
 
         Args:
             activity_ids: List of activity UUIDs
@@ -82,29 +98,109 @@ class EmissionResultRepository(BaseRepository[EmissionResultDBModel]):
         """
         stmt = select(self.model).where(self.model.activity_id.in_(activity_ids))
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
-    async def get_all_results(
-        self, skip: int = 0, limit: int = 100
+    async def get_latest_by_activity_ids(
+        self, activity_ids: list[UUID]
     ) -> list[EmissionResultDBModel]:
         """
-        Get all emission results with pagination.
+        Get the most recent emission result of each of several activities.
+
+        One query with DISTINCT ON (activity_id) instead of a
+        get_by_activity_id call per activity.
 
         Args:
-            skip: Number of records to skip
-            limit: Maximum number of records to return
+            activity_ids: List of activity UUIDs
 
         Returns:
-            List of emission results
+            At most one result per activity, in no particular order
         """
         stmt = (
             select(self.model)
-            .order_by(self.model.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+            .where(self.model.activity_id.in_(activity_ids))
+            .distinct(self.model.activity_id)
+            .order_by(self.model.activity_id, self.model.created_at.desc())
         )
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
+
+    def _seek(
+        self,
+        stmt,
+        after_created_at: datetime | None,
+        after_id: UUID | None,
+        limit: int,
+    ):
+        """
+        Page a statement newest first, starting after a keyset cursor.
+
+        Seeking past the previous page's last (created_at, id) reads straight
+        from ix_emission_results_created_id, so every page costs the same
+        however deep it is, unlike an offset that scans and discards rows.
+
+        Args:
+            stmt: Select of results to page
+            after_created_at: created_at of the previous page's last result
+            after_id: id of the previous page's last result
+            limit: Maximum number of records to return
+
+        Returns:
+            Statement for the page
+        """
+        if after_created_at is not None and after_id is not None:
+            stmt = stmt.where(
+                tuple_(self.model.created_at, self.model.id)
+                < tuple_(after_created_at, after_id)
+            )
+        # id makes the order total, so pages neither repeat nor skip results
+        # created at the same instant
+        return stmt.order_by(
+            self.model.created_at.desc(), self.model.id.desc()
+        ).limit(limit)
+
+    async def get_all_results(
+        self,
+        after_created_at: datetime | None = None,
+        after_id: UUID | None = None,
+        limit: int = 100,
+    ) -> list[EmissionResultDBModel]:
+        """
+        Get all emission results, newest first, one page at a time.
+
+        Pass the last result's created_at and id to get the next page.
+
+        Args:
+            after_created_at: created_at of the previous page's last result
+            after_id: id of the previous page's last result
+            limit: Maximum number of records to return
+
+        Returns:
+            List of emission results
+        """
+        stmt = self._seek(select(self.model), after_created_at, after_id, limit)
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def get_all_result_rows(
+        self,
+        after_created_at: datetime | None = None,
+        after_id: UUID | None = None,
+        limit: int = 100,
+    ) -> list[Row]:
+        """
+        Like get_all_results, but returning plain rows instead of results.
+
+        Args:
+            after_created_at: created_at of the previous page's last result
+            after_id: id of the previous page's last result
+            limit: Maximum number of records to return
+
+        Returns:
+            Rows of id, activity_id, co2e_tonnes and created_at
+        """
+        stmt = self._seek(_RESULT_ROWS, after_created_at, after_id, limit)
+        result = await self.session.execute(stmt)
+        return result.all()
 
     async def delete_by_activity_id(self, activity_id: UUID) -> int:
         """
@@ -118,49 +214,95 @@ class EmissionResultRepository(BaseRepository[EmissionResultDBModel]):
         Returns:
             Number of results deleted
         """
-        from sqlalchemy import delete
-
         stmt = delete(self.model).where(self.model.activity_id == activity_id)
         result = await self.session.execute(stmt)
-        await self.session.flush()
+        return result.rowcount
+
+    async def delete_by_activity_ids(self, activity_ids: list[UUID]) -> int:
+        """
+        Delete all emission results for several activities in one statement.
+
+        Args:
+            activity_ids: Activity UUIDs
+
+        Returns:
+            Number of results deleted
+        """
+        stmt = delete(self.model).where(self.model.activity_id.in_(activity_ids))
+        result = await self.session.execute(stmt)
         return result.rowcount
 
     async def get_results_by_date_range(
-        self, start_date: datetime, end_date: datetime, skip: int = 0, limit: int = 100
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        after_created_at: datetime | None = None,
+        after_id: UUID | None = None,
+        limit: int = 100,
     ) -> list[EmissionResultDBModel]:
         """
-        Get emission results created within a date range.
+        Get emission results created within a date range, newest first.
+
+        Pass the last result's created_at and id to get the next page.
 
         Args:
             start_date: Start datetime (inclusive)
             end_date: End datetime (inclusive)
-            skip: Number of records to skip
+            after_created_at: created_at of the previous page's last result
+            after_id: id of the previous page's last result
             limit: Maximum number of records to return
 
         Returns:
             List of emission results
         """
-        stmt = (
-            select(self.model)
-            .where(
-                self.model.created_at >= start_date,
-                self.model.created_at <= end_date,
-            )
-            .order_by(self.model.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+        stmt = select(self.model).where(
+            self.model.created_at >= start_date,
+            self.model.created_at <= end_date,
+        )
+        stmt = self._seek(stmt, after_created_at, after_id, limit)
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def get_result_rows_by_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        after_created_at: datetime | None = None,
+        after_id: UUID | None = None,
+        limit: int = 100,
+    ) -> list[Row]:
+        """
+        Like get_results_by_date_range, but returning plain rows.
+
+        Args:
+            start_date: Start datetime (inclusive)
+            end_date: End datetime (inclusive)
+            after_created_at: created_at of the previous page's last result
+            after_id: id of the previous page's last result
+            limit: Maximum number of records to return
+
+        Returns:
+            Rows of id, activity_id, co2e_tonnes and created_at
+        """
+        stmt = _RESULT_ROWS.where(
+            self.model.created_at >= start_date,
+            self.model.created_at <= end_date,
         )
+        stmt = self._seek(stmt, after_created_at, after_id, limit)
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.all()
 
     async def get_total_emissions(self) -> float:
         """
         Calculate total CO2e emissions across all results.
 
+        Read from the trigger-maintained rollups, a few dozen rows, rather
+        than summing every result.
+
         Returns:
             Total CO2e in tonnes
         """
-        stmt = select(func.sum(self.model.co2e_tonnes))
+        stmt = select(func.sum(EmissionRollupDBModel.total_co2e_tonnes))
         result = await self.session.execute(stmt)
         total = result.scalar()
         return float(total) if total else 0.0
@@ -169,12 +311,20 @@ class EmissionResultRepository(BaseRepository[EmissionResultDBModel]):
         """
         Get total emissions grouped by scope.
 
+        Read from the trigger-maintained rollups, like get_total_emissions.
+
         Returns:
             Dict with scope totals: {'scope_2': float, 'scope_3': float}
         """
-        # This requires joining with EmissionFactor to get scope information
-        # For now, return empty dict (can be enhanced later)
-        return {"scope_2": 0.0, "scope_3": 0.0}
+        stmt = select(
+            EmissionRollupDBModel.scope,
+            func.sum(EmissionRollupDBModel.total_co2e_tonnes),
+        ).group_by(EmissionRollupDBModel.scope)
+        result = await self.session.execute(stmt)
+        totals = {"scope_2": 0.0, "scope_3": 0.0}
+        for scope, total in result.all():
+            totals[f"scope_{scope}"] = float(total)
+        return totals
 
     async def count_results_for_activity(self, activity_id: UUID) -> int:
         """
@@ -186,10 +336,28 @@ class EmissionResultRepository(BaseRepository[EmissionResultDBModel]):
         Returns:
             Number of results
         """
-        stmt = select(func.count()).where(self.model.activity_id == activity_id)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(
+            _COUNT_BY_ACTIVITY, {"activity_id": activity_id}
+        )
         return result.scalar() or 0
 
+    async def has_results_for_activity(self, activity_id: UUID) -> bool:
+        """
+        Check whether an activity has any emission results.
+
+        Stops at the first matching index entry instead of counting them all.
+
+        Args:
+            activity_id: Activity UUID
+
+        Returns:
+            True if at least one result exists
+        """
+        result = await self.session.execute(
+            _ANY_BY_ACTIVITY, {"activity_id": activity_id}
+        )
+        return result.scalar()
+
     async def get_latest_results(self, limit: int = 10) -> list[EmissionResultDBModel]:
         """
         Get the most recently calculated emission results.
@@ -202,7 +370,21 @@ class EmissionResultRepository(BaseRepository[EmissionResultDBModel]):
         """
         stmt = select(self.model).order_by(self.model.created_at.desc()).limit(limit)
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
+
+    async def get_latest_result_rows(self, limit: int = 10) -> list[Row]:
+        """
+        Like get_latest_results, but returning plain rows.
+
+        Args:
+            limit: Maximum number of results to return
+
+        Returns:
+            Rows of id, activity_id, co2e_tonnes and created_at
+        """
+        stmt = _RESULT_ROWS.order_by(self.model.created_at.desc()).limit(limit)
+        result = await self.session.execute(stmt)
+        return result.all()
 
     async def update_result(
         self, result_id: UUID, **data
@@ -235,12 +417,15 @@ class EmissionResultRepository(BaseRepository[EmissionResultDBModel]):
         Returns:
             List of low-confidence emission results
         """
+        stmt = select(self.model).where(self.model.confidence_score < threshold)
+        if threshold <= 1:
+            # Implied by the threshold, but a bound parameter alone does not
+            # let the planner match the partial index
+            stmt = stmt.where(LOW_CONFIDENCE)
         stmt = (
-            select(self.model)
-            .where(self.model.confidence_score < threshold)
-            .order_by(self.model.confidence_score.asc())
+            stmt.order_by(self.model.confidence_score.asc(), self.model.id.asc())
             .offset(skip)
             .limit(limit)
         )
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
@@ -0,0 +1,60 @@
+"""
+EmissionRollup Repository.
+
+Repository for reading the running emission totals kept by the
+emission_results trigger.
+"""
+
+from typing import Optional
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.repositories.base import BaseRepository
+from app.database.schemas.emission_rollup import EmissionRollupDBModel
+
+
+class EmissionRollupRepository(BaseRepository[EmissionRollupDBModel]):
+    """Repository for emission rollup operations."""
+
+    def __init__(self, session: AsyncSession):
+        super().__init__(EmissionRollupDBModel, session)
+
+    async def get_totals(
+        self,
+        scope: Optional[int] = None,
+        category: Optional[int] = None,
+        activity_type: Optional[str] = None,
+    ) -> list[Row]:
+        """
+        Get the running totals of the groups matching the filters.
+
+        Groups whose results have all been deleted are skipped.
+
+        Args:
+            scope: Optional scope filter (2 or 3)
+            category: Optional category filter (1 or 6)
+            activity_type: Optional activity type filter
+
+        Returns:
+            Rows of scope, category, activity_type, co2e_tonnes and
+            activity_count, one per group
+        """
+        stmt = select(
+            EmissionRollupDBModel.scope,
+            EmissionRollupDBModel.category,
+            EmissionRollupDBModel.activity_type,
+            EmissionRollupDBModel.total_co2e_tonnes.label("co2e_tonnes"),
+            EmissionRollupDBModel.activity_count,
+        ).where(EmissionRollupDBModel.activity_count > 0)
+
+        # Apply filters
+        if scope is not None:
+            stmt = stmt.where(EmissionRollupDBModel.scope == scope)
+        if category is not None:
+            stmt = stmt.where(EmissionRollupDBModel.category == category)
+        if activity_type is not None:
+            stmt = stmt.where(EmissionRollupDBModel.activity_type == activity_type)
+
+        result = await self.session.execute(stmt)
+        return result.all()
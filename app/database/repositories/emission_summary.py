@@ -4,20 +4,57 @@ EmissionSummary Repository.
 Repository for querying pre-aggregated emission summaries.
 """
 
+from calendar import monthrange
 from datetime import date
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import and_, select
+from sqlalchemy import Row, and_, func, select
+from sqlalchemy.dialects.postgresql import Range
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.repositories.base import BaseRepository
-from app.database.schemas.emission_summary import EmissionSummaryDBModel
+from app.database.schemas.emission_summary import (
+    SUMMARY_PERIOD,
+    SUMMARY_PERIOD_KEY,
+    EmissionSummaryDBModel,
+)
+from app.utils.constants import SummaryType
+
+
+def _month_bounds(year: int, month: int) -> tuple[date, date]:
+    """Return the first and last day of a month."""
+    return date(year, month, 1), date(year, month, monthrange(year, month)[1])
+
+
+def _date_range_filters(
+    from_date: date,
+    to_date: date,
+    scope: Optional[int] = None,
+    category: Optional[int] = None,
+    activity_type: Optional[str] = None,
+) -> list:
+    """Build the WHERE clauses selecting summaries within a date range."""
+    filters = [SUMMARY_PERIOD.contained_by(Range(from_date, to_date, bounds="[]"))]
+    if scope is not None:
+        filters.append(EmissionSummaryDBModel.scope == scope)
+    if category is not None:
+        filters.append(EmissionSummaryDBModel.category == category)
+    if activity_type is not None:
+        filters.append(EmissionSummaryDBModel.activity_type == activity_type)
+    return filters
 
 
 class EmissionSummaryRepository(BaseRepository[EmissionSummaryDBModel]):
     """Repository for emission summary operations."""
 
+    # Dimensions summaries can be totalled by in sum_by_dimension
+    DIMENSIONS = {
+        "scope": EmissionSummaryDBModel.scope,
+        "category": EmissionSummaryDBModel.category,
+        "activity": EmissionSummaryDBModel.activity_type,
+    }
+
     def __init__(self, session: AsyncSession):
         super().__init__(EmissionSummaryDBModel, session)
 
@@ -43,22 +80,73 @@ class EmissionSummaryRepository(BaseRepository[EmissionSummaryDBModel]):
             List of emission summaries matching the criteria
         """
         stmt = select(EmissionSummaryDBModel).where(
-            and_(
-                EmissionSummaryDBModel.from_date >= from_date,
-                EmissionSummaryDBModel.to_date <= to_date,
-            )
+            *_date_range_filters(from_date, to_date, scope, category, activity_type)
         )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
 
-        # Apply filters
-        if scope is not None:
-            stmt = stmt.where(EmissionSummaryDBModel.scope == scope)
-        if category is not None:
-            stmt = stmt.where(EmissionSummaryDBModel.category == category)
-        if activity_type is not None:
-            stmt = stmt.where(EmissionSummaryDBModel.activity_type == activity_type)
+    async def sum_by_date_range(
+        self,
+        from_date: date,
+        to_date: date,
+        scope: Optional[int] = None,
+        category: Optional[int] = None,
+        activity_type: Optional[str] = None,
+    ) -> Row:
+        """
+        Total the summaries get_by_date_range would return, in the database.
 
+        Args:
+            from_date: Start date (inclusive)
+            to_date: End date (inclusive)
+            scope: Optional scope filter (2 or 3)
+            category: Optional category filter (1 or 6)
+            activity_type: Optional activity type filter
+
+        Returns:
+            Row of total_co2e_tonnes, activity_count and summary_count
+        """
+        stmt = select(
+            func.coalesce(func.sum(EmissionSummaryDBModel.total_co2e_tonnes), 0).label(
+                "total_co2e_tonnes"
+            ),
+            func.coalesce(func.sum(EmissionSummaryDBModel.activity_count), 0).label(
+                "activity_count"
+            ),
+            func.count().label("summary_count"),
+        ).where(*_date_range_filters(from_date, to_date, scope, category, activity_type))
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return result.one()
+
+    async def sum_by_dimension(
+        self, from_date: date, to_date: date, dimension: str
+    ) -> list[Row]:
+        """
+        Total the summaries within a date range per value of one dimension.
+
+        Args:
+            from_date: Start date (inclusive)
+            to_date: End date (inclusive)
+            dimension: One of DIMENSIONS ('scope', 'category' or 'activity')
+
+        Returns:
+            Rows of value, total_co2e_tonnes and activity_count; value is
+            NULL for summaries spanning all values of the dimension
+        """
+        column = self.DIMENSIONS[dimension]
+        stmt = (
+            select(
+                column.label("value"),
+                func.sum(EmissionSummaryDBModel.total_co2e_tonnes).label(
+                    "total_co2e_tonnes"
+                ),
+                func.sum(EmissionSummaryDBModel.activity_count).label("activity_count"),
+            )
+            .where(*_date_range_filters(from_date, to_date))
+            .group_by(column)
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
 
     async def get_latest_summary(
         self,
@@ -115,13 +203,7 @@ class EmissionSummaryRepository(BaseRepository[EmissionSummaryDBModel]):
         Returns:
             List of emission summaries for the month
         """
-        # Calculate month boundaries
-        from_date = date(year, month, 1)
-        if month == 12:
-            to_date = date(year, 12, 31)
-        else:
-            to_date = date(year, month + 1, 1)
-
+        from_date, to_date = _month_bounds(year, month)
         return await self.get_by_date_range(
             from_date=from_date,
             to_date=to_date,
@@ -130,6 +212,46 @@ class EmissionSummaryRepository(BaseRepository[EmissionSummaryDBModel]):
             activity_type=activity_type,
         )
 
+    async def get_monthly_rollup(
+        self,
+        year: int,
+        month: int,
+        scope: Optional[int] = None,
+        category: Optional[int] = None,
+        activity_type: Optional[str] = None,
+    ) -> Optional[EmissionSummaryDBModel]:
+        """
+        Get the monthly summary covering exactly one month.
+
+        Matches the expressions of ix_emission_summaries_unique_period, so
+        the lookup is a single index probe. None dimensions select the
+        summary spanning all values of that dimension.
+
+        Args:
+            year: Year
+            month: Month (1-12)
+            scope: Exact scope value (or None)
+            category: Exact category value (or None)
+            activity_type: Exact activity type (or None)
+
+        Returns:
+            Monthly summary or None
+        """
+        from_date, to_date = _month_bounds(year, month)
+        key = (
+            from_date,
+            to_date,
+            scope or 0,
+            category or 0,
+            activity_type or "",
+            SummaryType.MONTHLY,
+        )
+        stmt = select(EmissionSummaryDBModel).where(
+            *(column == value for column, value in zip(SUMMARY_PERIOD_KEY, key))
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def get_summary_by_filters(
         self,
         from_date: date,
@@ -6,15 +6,19 @@ from app.database.schemas.activity_data import (
     ElectricityActivityDBModel,
     GoodsServicesActivityDBModel,
 )
+from app.database.schemas.aggregation_job import AggregationJobDBModel
 from app.database.schemas.emission_factor import EmissionFactorDBModel
 from app.database.schemas.emission_result import EmissionResultDBModel
+from app.database.schemas.emission_rollup import EmissionRollupDBModel
 from app.database.schemas.emission_summary import EmissionSummaryDBModel
 
 __all__ = [
+    "AggregationJobDBModel",
     "AirTravelActivityDBModel",
     "ElectricityActivityDBModel",
     "EmissionFactorDBModel",
     "EmissionResultDBModel",
+    "EmissionRollupDBModel",
     "EmissionSummaryDBModel",
     "GoodsServicesActivityDBModel",
 ]
@@ -4,13 +4,36 @@ Activity data SQLAlchemy models.
 Converted from Django ORM to SQLAlchemy async following kkb_fastapi pattern.
 """
 
-import uuid
-from datetime import datetime
-
-from sqlalchemy import JSON, Boolean, Column, Date, DateTime, Index, Numeric, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    FetchedValue,
+    Float,
+    Index,
+    Numeric,
+    String,
+    event,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ENUM, JSONB, UUID
+from sqlalchemy.orm import Session, with_loader_criteria
 
 from app.database import Base
+from app.utils.constants import ActivityType
+from app.utils.uuid7 import uuid7
+
+# Native Postgres enum shared by every table with an activity_type column:
+# stored in 4 bytes and compared as an integer instead of a repeated label.
+activity_type_enum = ENUM(
+    ActivityType.ELECTRICITY,
+    ActivityType.AIR_TRAVEL,
+    ActivityType.GOODS_SERVICES,
+    name="activity_type",
+)
 
 
 class BaseActivityMixin:
@@ -20,17 +43,21 @@ class BaseActivityMixin:
     Provides common fields for timestamps and soft delete.
     """
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Time-ordered ids keep primary key inserts at the right edge of the index
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
+    # Activity tables are range-partitioned by month on date, which must
+    # therefore be part of the primary key. Date range scans are served by
+    # each table's composite (date, ...) index.
     date = Column(
         Date,
+        primary_key=True,
         nullable=False,
-        index=True,
         comment="Date when the activity occurred",
     )
 
     activity_type = Column(
-        String(100),
+        activity_type_enum,
         nullable=False,
         comment="Type of activity",
     )
@@ -42,7 +69,7 @@ class BaseActivityMixin:
     )
 
     raw_data = Column(
-        JSON,
+        JSONB,
         nullable=True,
         default=dict,
         comment="Original CSV row data for audit trail",
@@ -50,12 +77,99 @@ class BaseActivityMixin:
 
     # Soft delete
     is_deleted = Column(Boolean, default=False, nullable=False)
-    deleted_at = Column(DateTime, nullable=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
 
-    # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Timestamps, set by the database (see add_updated_at_trigger)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),
+        nullable=False,
+    )
+
+    # Read updated_at back in the UPDATE's RETURNING clause
+    __mapper_args__ = {"eager_defaults": True}
+
+
+# Predicate of the partial activity indexes. Written as `= false` rather
+# than `IS false` so the planner matches queries to those indexes.
+LIVE_ROWS = text("is_deleted = false")
+
+
+@event.listens_for(Session, "do_orm_execute")
+def exclude_deleted_activities(orm_execute_state) -> None:
+    """
+    Leave soft-deleted activities out of every ORM SELECT.
+
+    Adds `is_deleted = false` for each activity model the statement reads,
+    joins and aliases included, so date range scans only see live rows and
+    can use the partial indexes. Refreshes of already-loaded instances are
+    not filtered, and UPDATEs are not either, so soft_delete() and restore()
+    still find their row. Pass the execution option include_deleted=True to
+    read tombstones.
+    """
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+        and not orm_execute_state.execution_options.get("include_deleted", False)
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            with_loader_criteria(
+                BaseActivityMixin,
+                lambda cls: cls.is_deleted == False,
+                include_aliases=True,
+            )
+        )
+
+
+# Keeps updated_at current on every UPDATE, whichever client or trigger
+# issues it. Created before the tables so their triggers can use it.
+SET_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at := now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+event.listen(Base.metadata, "before_create", DDL(SET_UPDATED_AT_FUNCTION))
+
+
+def add_updated_at_trigger(table) -> None:
+    """
+    Install the set_updated_at trigger whenever a table is created.
+
+    Migrations install it too; the listener covers tables built with
+    metadata.create_all (e.g. in tests). On partitioned tables the trigger
+    is cloned to every partition.
+    """
+    event.listen(
+        table,
+        "after_create",
+        DDL(
+            "CREATE TRIGGER %(table)s_set_updated_at BEFORE UPDATE ON %(table)s "
+            "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        ),
+    )
+
+
+def add_default_partition(table) -> None:
+    """
+    Create a DEFAULT partition whenever a partitioned table is created.
+
+    Migrations create monthly partitions ahead of time; the default partition
+    catches rows outside them (and is the only partition for tables built
+    with metadata.create_all, e.g. in tests).
+    """
+    event.listen(
+        table,
+        "after_create",
+        DDL("CREATE TABLE %(table)s_default PARTITION OF %(table)s DEFAULT"),
     )
 
 
@@ -69,9 +183,16 @@ class ElectricityActivityDBModel(Base, BaseActivityMixin):
     __tablename__ = "electricity_activities"
 
     __table_args__ = (
-        Index("ix_electricity_activities_date_country", "date", "country"),
-        Index("ix_electricity_activities_date_desc", "date"),
-        {"comment": "Electricity consumption activity data (Scope 2)"},
+        Index(
+            "ix_electricity_activities_date_country_live",
+            "date",
+            "country",
+            postgresql_where=LIVE_ROWS,
+        ),
+        {
+            "comment": "Electricity consumption activity data (Scope 2)",
+            "postgresql_partition_by": "RANGE (date)",
+        },
     )
 
     country = Column(
@@ -81,8 +202,10 @@ class ElectricityActivityDBModel(Base, BaseActivityMixin):
         comment="Country where electricity was consumed",
     )
 
+    # Double precision (see emission_results.co2e_tonnes), read back as
+    # Decimal rounded to 4 places
     usage_kwh = Column(
-        Numeric(12, 4),
+        Float(precision=53, asdecimal=True, decimal_return_scale=4),
         nullable=False,
         comment="Electricity consumption in kilowatt-hours",
     )
@@ -102,10 +225,15 @@ class GoodsServicesActivityDBModel(Base, BaseActivityMixin):
 
     __table_args__ = (
         Index(
-            "ix_goods_services_activities_date_category", "date", "supplier_category"
+            "ix_goods_services_activities_date_category_live",
+            "date",
+            "supplier_category",
+            postgresql_where=LIVE_ROWS,
         ),
-        Index("ix_goods_services_activities_date_desc", "date"),
-        {"comment": "Purchased goods and services activity data (Scope 3, Category 1)"},
+        {
+            "comment": "Purchased goods and services activity data (Scope 3, Category 1)",
+            "postgresql_partition_by": "RANGE (date)",
+        },
     )
 
     supplier_category = Column(
@@ -144,9 +272,16 @@ class AirTravelActivityDBModel(Base, BaseActivityMixin):
     __tablename__ = "air_travel_activities"
 
     __table_args__ = (
-        Index("ix_air_travel_activities_date_range", "date", "flight_range"),
-        Index("ix_air_travel_activities_date_desc", "date"),
-        {"comment": "Air travel activity data (Scope 3, Category 6)"},
+        Index(
+            "ix_air_travel_activities_date_range_live",
+            "date",
+            "flight_range",
+            postgresql_where=LIVE_ROWS,
+        ),
+        {
+            "comment": "Air travel activity data (Scope 3, Category 6)",
+            "postgresql_partition_by": "RANGE (date)",
+        },
     )
 
     distance_miles = Column(
@@ -179,3 +314,21 @@ class AirTravelActivityDBModel(Base, BaseActivityMixin):
             f"<AirTravelActivityDBModel: {self.flight_range} - "
             f"{self.passenger_class} ({self.distance_km} km) on {self.date}>"
         )
+
+
+for _model in (
+    ElectricityActivityDBModel,
+    GoodsServicesActivityDBModel,
+    AirTravelActivityDBModel,
+):
+    add_default_partition(_model.__table__)
+    add_updated_at_trigger(_model.__table__)
+
+    # Newest-first listing of live rows (keyset pagination); soft-deleted
+    # rows are left out of the index entirely.
+    Index(
+        f"ix_{_model.__tablename__}_active_date",
+        _model.date.desc(),
+        _model.id.desc(),
+        postgresql_where=LIVE_ROWS,
+    )
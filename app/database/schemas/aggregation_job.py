@@ -0,0 +1,87 @@
+"""
+AggregationJob SQLAlchemy model.
+
+Tracks aggregation runs that execute after their HTTP request has returned,
+so clients can poll for the outcome.
+"""
+
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    FetchedValue,
+    Integer,
+    String,
+    Text,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+from app.database.schemas.activity_data import add_updated_at_trigger
+from app.utils.constants import JobStatus
+from app.utils.uuid7 import uuid7
+
+
+class AggregationJobDBModel(Base):
+    """
+    A background aggregation run (e.g. a backfill).
+
+    Design:
+    - Created as pending when the request is accepted
+    - Moved to running, then succeeded or failed, by the background task
+    """
+
+    __tablename__ = "aggregation_jobs"
+
+    __table_args__ = ({"comment": "Background aggregation jobs and their outcome"},)
+
+    # Read updated_at (set by trigger) back in the UPDATE's RETURNING clause
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+
+    aggregation_type = Column(
+        String(20),
+        nullable=False,
+        comment="Type of aggregation: daily or monthly",
+    )
+
+    from_date = Column(Date, nullable=False, comment="Start of the range (inclusive)")
+
+    to_date = Column(Date, nullable=False, comment="End of the range (inclusive)")
+
+    status = Column(
+        String(20),
+        nullable=False,
+        default=JobStatus.PENDING,
+        comment="Job state: pending, running, succeeded, failed",
+    )
+
+    summaries_created = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of summaries created or updated by the job",
+    )
+
+    error = Column(Text, nullable=True, comment="Failure message, if the job failed")
+
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),
+        nullable=False,
+    )
+
+    def __repr__(self):
+        return (
+            f"<AggregationJobDBModel: {self.aggregation_type} {self.from_date} to "
+            f"{self.to_date}, status={self.status}>"
+        )
+
+
+add_updated_at_trigger(AggregationJobDBModel.__table__)
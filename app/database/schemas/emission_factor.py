@@ -4,13 +4,25 @@ EmissionFactor SQLAlchemy model.
 Converted from Django ORM to SQLAlchemy async following kkb_fastapi pattern.
 """
 
-import uuid
-from datetime import datetime
-
-from sqlalchemy import Column, DateTime, Index, Integer, Numeric, String
+from sqlalchemy import (
+    Column,
+    DateTime,
+    FetchedValue,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.database import Base
+from app.database.schemas.activity_data import (
+    activity_type_enum,
+    add_updated_at_trigger,
+)
+from app.utils.uuid7 import uuid7
 
 
 class EmissionFactorDBModel(Base):
@@ -28,14 +40,28 @@ class EmissionFactorDBModel(Base):
         Index(
             "ix_emission_factors_activity_lookup", "activity_type", "lookup_identifier"
         ),
-        Index("ix_emission_factors_scope_category", "scope", "category"),
+        # Covers the factor side of result filters on scope/category
+        Index(
+            "ix_emission_factors_scope_category_include_id",
+            "scope",
+            "category",
+            postgresql_include=["id", "activity_type"],
+        ),
+        # Case-insensitive prefix searches (lower(...) LIKE 'abc%')
+        Index(
+            "ix_emission_factors_lookup_lower_pattern",
+            text("lower(lookup_identifier) text_pattern_ops"),
+        ),
         {"comment": "Emission factor lookup table for CO2e calculations"},
     )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Read updated_at (set by trigger) back in the UPDATE's RETURNING clause
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     activity_type = Column(
-        String(100),
+        activity_type_enum,
         nullable=False,
         index=True,
         comment="Type of activity this emission factor applies to",
@@ -88,9 +114,14 @@ class EmissionFactorDBModel(Base):
     )
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),
+        nullable=False,
     )
 
     def __repr__(self):
@@ -98,3 +129,6 @@ class EmissionFactorDBModel(Base):
             f"<EmissionFactorDBModel: {self.activity_type} - "
             f"{self.lookup_identifier}>"
         )
+
+
+add_updated_at_trigger(EmissionFactorDBModel.__table__)
@@ -5,15 +5,39 @@ Converted from Django ORM to SQLAlchemy async following kkb_fastapi pattern.
 Note: Django's GenericForeignKey is replaced with activity_type and activity_id fields.
 """
 
-import uuid
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import JSON, Column, Date, DateTime, ForeignKey, Index, Numeric, String
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    CheckConstraint,
+    Column,
+    Date,
+    DateTime,
+    FetchedValue,
+    Float,
+    ForeignKey,
+    Index,
+    Numeric,
+    SmallInteger,
+    func,
+    literal_column,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import backref, relationship
 
 from app.database import Base
+from app.database.schemas.activity_data import (
+    activity_type_enum,
+    add_default_partition,
+    add_updated_at_trigger,
+)
+from app.utils.constants import ACTIVITY_KIND_BY_TYPE
+from app.utils.uuid7 import uuid7
+
+
+def _activity_kind_default(context) -> int:
+    """Derive activity_kind from the activity_type being inserted."""
+    return ACTIVITY_KIND_BY_TYPE[context.get_current_parameters()["activity_type"]]
 
 
 class EmissionResultDBModel(Base):
@@ -27,25 +51,75 @@ class EmissionResultDBModel(Base):
     __tablename__ = "emission_results"
 
     __table_args__ = (
-        Index("ix_emission_results_activity", "activity_type", "activity_id"),
-        Index("ix_emission_results_created_desc", "created_at"),
-        Index("ix_emission_results_calculation_date", "calculation_date"),
+        # Narrow (smallint, uuid) key; INCLUDE lets per-activity lookups of the
+        # emitted amount and factor be answered from the index alone.
+        Index(
+            "ix_emission_results_activity_kind",
+            "activity_kind",
+            "activity_id",
+            postgresql_include=["co2e_tonnes", "emission_factor_id"],
+        ),
+        CheckConstraint(
+            "activity_kind BETWEEN 1 AND 3", name="ck_emission_results_activity_kind"
+        ),
+        # Date-range pages sorted newest first (id breaks ties) read straight
+        # off this index with a backward scan.
+        Index("ix_emission_results_created_id", "created_at", "id"),
+        # calculation_date and created_at grow with insertion order, so block
+        # range (BRIN) indexes serve range scans at a fraction of a B-tree's size.
+        Index(
+            "ix_emission_results_calculation_date_brin",
+            "calculation_date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_emission_results_created_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         Index("ix_emission_results_co2e_tonnes", "co2e_tonnes"),
-        Index("ix_emission_results_emission_factor_id", "emission_factor_id"),
+        # Report pages filtered by activity type and sorted by CO2e (id breaks
+        # ties) read straight off this index, in either direction.
+        Index(
+            "ix_emission_results_kind_co2e",
+            "activity_kind",
+            "co2e_tonnes",
+            "id",
+        ),
+        # Serves factor joins and "emissions by factor/type" sums without heap visits
+        Index(
+            "ix_emission_results_ef_include_co2e_type",
+            "emission_factor_id",
+            postgresql_include=["co2e_tonnes", "activity_type"],
+        ),
         {
-            "comment": "Calculated emission results linking activities to emission factors"
+            "comment": "Calculated emission results linking activities to emission factors",
+            "postgresql_partition_by": "RANGE (calculation_date)",
         },
     )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Time-ordered ids keep primary key inserts at the right edge of the index
+    # Read updated_at (set by trigger) back in the UPDATE's RETURNING clause
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Reference to activity data (replaces Django GenericForeignKey)
     activity_type = Column(
-        String(100),
+        activity_type_enum,
         nullable=False,
         comment="Type of activity data (Electricity, Air Travel, Purchased Goods and Services)",
     )
 
+    activity_kind = Column(
+        SmallInteger,
+        nullable=False,
+        default=_activity_kind_default,
+        comment="Activity type code (see ActivityKind), set from activity_type",
+    )
+
     activity_id = Column(
         UUID(as_uuid=True),
         nullable=False,
@@ -60,14 +134,22 @@ class EmissionResultDBModel(Base):
         comment="Emission factor used in the calculation",
     )
 
-    emission_factor = relationship("EmissionFactorDBModel", backref="emission_results")
+    # Never loaded implicitly: a lazy load per row would be an N+1 (and fails
+    # under asyncio anyway). Queries that need the factor must eager-load it,
+    # e.g. .options(selectinload(EmissionResultDBModel.emission_factor)).
+    emission_factor = relationship(
+        "EmissionFactorDBModel",
+        backref=backref("emission_results", lazy="raise"),
+        lazy="raise",
+    )
 
     # Calculated emissions
-    # Note: decimal_places=7 to preserve precision from emission factors
-    # Some factors have 5-6 decimal places (e.g., 0.15573 kgCO2e/km)
-    # and calculations can produce 7 decimal place results
+    # Stored as double precision so SUM() over millions of rows runs in
+    # hardware instead of numeric arithmetic. Values are read back as Decimal
+    # rounded to 7 places, the precision factors with 5-6 decimal places
+    # (e.g., 0.15573 kgCO2e/km) can produce.
     co2e_tonnes = Column(
-        Numeric(15, 7),
+        Float(precision=53, asdecimal=True, decimal_return_scale=7),
         nullable=False,
         comment="Calculated CO2e emissions in tonnes",
     )
@@ -82,23 +164,30 @@ class EmissionResultDBModel(Base):
 
     # Calculation metadata
     calculation_metadata = Column(
-        JSON,
+        JSONB,
         nullable=True,
         default=dict,
         comment="Additional calculation details (method, intermediate values, etc.)",
     )
 
+    # Partition key (monthly ranges), hence part of the primary key
     calculation_date = Column(
         Date,
+        primary_key=True,
         nullable=False,
         default=date.today,
         comment="Date when the emission was calculated",
     )
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),
+        nullable=False,
     )
 
     def __repr__(self):
@@ -111,3 +200,27 @@ class EmissionResultDBModel(Base):
     def co2e_kg(self) -> Decimal:
         """Get emissions in kilograms."""
         return self.co2e_tonnes * Decimal("1000")
+
+
+# Most results match with full confidence; the review queue only reads the
+# rest, so only the rest are indexed. Queries must repeat this predicate with
+# the literal bound for the planner to use the index.
+LOW_CONFIDENCE = EmissionResultDBModel.confidence_score < literal_column("1.0")
+
+# Latest result(s) per activity: a seek to the activity lands on its newest
+# result, and DISTINCT ON (activity_id) ... created_at DESC reads in order.
+Index(
+    "ix_emission_results_activity_id_created",
+    EmissionResultDBModel.activity_id,
+    EmissionResultDBModel.created_at.desc(),
+)
+
+Index(
+    "ix_emission_results_low_confidence",
+    EmissionResultDBModel.confidence_score,
+    EmissionResultDBModel.id,
+    postgresql_where=LOW_CONFIDENCE,
+)
+
+add_default_partition(EmissionResultDBModel.__table__)
+add_updated_at_trigger(EmissionResultDBModel.__table__)
@@ -0,0 +1,166 @@
+"""
+EmissionRollup SQLAlchemy model.
+
+Running emission totals per (scope, category, activity type), kept current
+by a trigger on emission_results so reports read a few dozen rows instead of
+scanning every result.
+"""
+
+from sqlalchemy import (
+    DDL,
+    Column,
+    DateTime,
+    FetchedValue,
+    Float,
+    Index,
+    Integer,
+    event,
+    func,
+    literal_column,
+)
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+from app.database.schemas.activity_data import (
+    activity_type_enum,
+    add_updated_at_trigger,
+)
+from app.utils.uuid7 import uuid7
+
+
+class EmissionRollupDBModel(Base):
+    """
+    Running totals of emission results.
+
+    Design:
+    - One row per (scope, category, activity type) that has results
+    - Maintained on write by the emission_results_maintain_rollups trigger,
+      which adds inserted results and subtracts deleted ones
+    - Groups whose results were all deleted keep a row with activity_count 0
+    """
+
+    __tablename__ = "emission_rollups"
+
+    __table_args__ = (
+        {"comment": "Running emission totals per scope, category and activity type"},
+    )
+
+    # Read updated_at (set by trigger) back in the UPDATE's RETURNING clause
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+
+    scope = Column(
+        Integer,
+        nullable=False,
+        comment="GHG Protocol scope of the emission factors (2 or 3)",
+    )
+
+    category = Column(
+        Integer,
+        nullable=True,
+        comment="Scope 3 category of the emission factors (1 or 6) - NULL for none",
+    )
+
+    activity_type = Column(
+        activity_type_enum,
+        nullable=False,
+        comment="Activity type of the results",
+    )
+
+    # Same storage as emission_results.co2e_tonnes
+    total_co2e_tonnes = Column(
+        Float(precision=53, asdecimal=True, decimal_return_scale=7),
+        nullable=False,
+        default=0,
+        comment="Total CO2e emissions in tonnes",
+    )
+
+    activity_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of emission results included",
+    )
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),
+        nullable=False,
+    )
+
+    def __repr__(self):
+        return (
+            f"<EmissionRollupDBModel: scope={self.scope}, category={self.category}, "
+            f"activity={self.activity_type}, CO2e={self.total_co2e_tonnes}>"
+        )
+
+
+# Conflict target for the trigger's UPSERTs; scope 2 factors have no category
+ROLLUP_KEY = (
+    EmissionRollupDBModel.scope,
+    func.coalesce(EmissionRollupDBModel.category, literal_column("0")),
+    EmissionRollupDBModel.activity_type,
+)
+
+Index("ix_emission_rollups_key", *ROLLUP_KEY, unique=True)
+
+# Adds (or, with negative values, removes) one emission result to its group.
+# The activity type is passed as text so the function does not depend on the
+# activity_type enum. updated_at is left to its default and trigger.
+APPLY_ROLLUP_FUNCTION = """
+CREATE OR REPLACE FUNCTION emission_rollups_apply_result(
+    p_emission_factor_id uuid,
+    p_activity_type varchar,
+    p_co2e_tonnes double precision,
+    p_activity_count integer
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO emission_rollups AS r (
+        id, scope, category, activity_type, total_co2e_tonnes, activity_count
+    )
+    SELECT
+        gen_random_uuid(), f.scope, f.category, p_activity_type::activity_type,
+        p_co2e_tonnes, p_activity_count
+    FROM emission_factors f
+    WHERE f.id = p_emission_factor_id
+    ON CONFLICT (scope, COALESCE(category, 0), activity_type) DO UPDATE SET
+        total_co2e_tonnes = r.total_co2e_tonnes + EXCLUDED.total_co2e_tonnes,
+        activity_count = r.activity_count + EXCLUDED.activity_count;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+ROLLUP_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION emission_results_maintain_rollups() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM emission_rollups_apply_result(
+            OLD.emission_factor_id, OLD.activity_type::varchar, -OLD.co2e_tonnes, -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM emission_rollups_apply_result(
+            NEW.emission_factor_id, NEW.activity_type::varchar, NEW.co2e_tonnes, 1
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+ROLLUP_TRIGGER = (
+    "CREATE TRIGGER emission_results_maintain_rollups "
+    "AFTER INSERT OR DELETE OR UPDATE OF co2e_tonnes, emission_factor_id, "
+    "activity_type ON emission_results "
+    "FOR EACH ROW EXECUTE FUNCTION emission_results_maintain_rollups()"
+)
+
+# Migrations install these too; the listeners cover tables built with
+# metadata.create_all (e.g. in tests). One statement per DDL, as asyncpg
+# prepares each one.
+for _statement in (APPLY_ROLLUP_FUNCTION, ROLLUP_TRIGGER_FUNCTION, ROLLUP_TRIGGER):
+    event.listen(Base.metadata, "after_create", DDL(_statement))
+
+add_updated_at_trigger(EmissionRollupDBModel.__table__)
@@ -5,14 +5,38 @@ Pre-aggregated emission summaries for efficient querying.
 Supports filtering by date range, scope, category, and activity type.
 """
 
-import uuid
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import Column, Date, DateTime, Index, Integer, Numeric, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    DDL,
+    Column,
+    Date,
+    DateTime,
+    FetchedValue,
+    Float,
+    Index,
+    Integer,
+    String,
+    event,
+    func,
+    literal_column,
+)
+from sqlalchemy.dialects.postgresql import DATERANGE, ENUM, UUID
 
 from app.database import Base
+from app.database.schemas.activity_data import add_updated_at_trigger
+from app.utils.constants import SummaryType
+from app.utils.uuid7 import uuid7
+
+summary_type_enum = ENUM(
+    SummaryType.DAILY,
+    SummaryType.WEEKLY,
+    SummaryType.MONTHLY,
+    SummaryType.YEARLY,
+    SummaryType.CUSTOM,
+    name="summary_type",
+)
 
 
 class EmissionSummaryDBModel(Base):
@@ -24,7 +48,8 @@ class EmissionSummaryDBModel(Base):
     real-time joins on millions of emission results.
 
     Design:
-    - Summaries are calculated periodically (daily/monthly)
+    - Daily and monthly summaries are kept current by a trigger on emission_results
+    - Summaries can also be recalculated by the aggregation jobs (UPSERT)
     - Supports filtering by date range, scope, category, activity type
     - Indexed for fast lookups
     - Handles 1M+ activities per month efficiently
@@ -53,36 +78,26 @@ class EmissionSummaryDBModel(Base):
             "category",
             "activity_type",
         ),
-        # Unique constraint to prevent duplicate summaries
-        Index(
-            "ix_emission_summaries_unique_period",
-            "from_date",
-            "to_date",
-            "scope",
-            "category",
-            "activity_type",
-            unique=True,
-            postgresql_where="activity_type IS NOT NULL",
-        ),
         {
             "comment": "Pre-aggregated emission summaries for efficient querying"
         },
     )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Read updated_at (set by trigger) back in the UPDATE's RETURNING clause
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
-    # Date range for this summary
+    # Date range for this summary, indexed as a daterange (see SUMMARY_PERIOD)
     from_date = Column(
         Date,
         nullable=False,
-        index=True,
         comment="Start date of the summary period (inclusive)",
     )
 
     to_date = Column(
         Date,
         nullable=False,
-        index=True,
         comment="End date of the summary period (inclusive)",
     )
 
@@ -101,6 +116,8 @@ class EmissionSummaryDBModel(Base):
         comment="Scope 3 category (1 or 6) - NULL for all categories",
     )
 
+    # Kept as text: NULL means "all" and is coalesced to '' in the unique
+    # period key, which an enum column cannot hold.
     activity_type = Column(
         String(100),
         nullable=True,
@@ -108,9 +125,10 @@ class EmissionSummaryDBModel(Base):
         comment="Activity type - NULL for all activity types",
     )
 
-    # Aggregated metrics
+    # Aggregated metrics. Same storage as emission_results.co2e_tonnes, so
+    # range totals over summaries SUM double precision values too.
     total_co2e_tonnes = Column(
-        Numeric(15, 7),
+        Float(precision=53, asdecimal=True, decimal_return_scale=7),
         nullable=False,
         default=Decimal("0"),
         comment="Total CO2e emissions in tonnes for this summary",
@@ -125,9 +143,9 @@ class EmissionSummaryDBModel(Base):
 
     # Summary metadata
     summary_type = Column(
-        String(50),
+        summary_type_enum,
         nullable=False,
-        default="daily",
+        default=SummaryType.DAILY,
         comment="Type of summary: daily, weekly, monthly, yearly, custom",
     )
 
@@ -138,9 +156,14 @@ class EmissionSummaryDBModel(Base):
     )
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        server_onupdate=FetchedValue(),
+        nullable=False,
     )
 
     def __repr__(self):
@@ -149,3 +172,117 @@ class EmissionSummaryDBModel(Base):
             f"scope={self.scope}, category={self.category}, "
             f"activity={self.activity_type}, CO2e={self.total_co2e_tonnes}>"
         )
+
+
+# Conflict target for UPSERTs into emission_summaries. NULL dimensions mean
+# "all", so they are coalesced for the uniqueness check. The literals are
+# rendered inline because ON CONFLICT inference must match the index
+# expressions exactly.
+SUMMARY_PERIOD_KEY = (
+    EmissionSummaryDBModel.from_date,
+    EmissionSummaryDBModel.to_date,
+    func.coalesce(EmissionSummaryDBModel.scope, literal_column("0")),
+    func.coalesce(EmissionSummaryDBModel.category, literal_column("0")),
+    func.coalesce(EmissionSummaryDBModel.activity_type, literal_column("''")),
+    EmissionSummaryDBModel.summary_type,
+)
+
+# Unique constraint to prevent duplicate summaries
+Index("ix_emission_summaries_unique_period", *SUMMARY_PERIOD_KEY, unique=True)
+
+# Summary period as an inclusive daterange. A single GiST index over it serves
+# "contained in" / "contains" / "overlaps" lookups on both endpoints at once.
+SUMMARY_PERIOD = func.daterange(
+    EmissionSummaryDBModel.from_date,
+    EmissionSummaryDBModel.to_date,
+    literal_column("'[]'"),
+    type_=DATERANGE,
+)
+
+Index("ix_emission_summaries_range", SUMMARY_PERIOD, postgresql_using="gist")
+
+# Adds (or, with negative values, removes) one emission result to every daily
+# and monthly bucket it belongs to, mirroring the breakdowns written by
+# EmissionAggregator. Timestamps are left to their defaults and trigger.
+APPLY_SUMMARY_FUNCTION = """
+CREATE OR REPLACE FUNCTION emission_summaries_apply_result(
+    p_emission_factor_id uuid,
+    p_activity_type varchar,
+    p_day date,
+    p_co2e_tonnes numeric,
+    p_activity_count integer
+) RETURNS void AS $$
+DECLARE
+    v_scope integer;
+    v_category integer;
+    v_month_start date := date_trunc('month', p_day)::date;
+    v_month_end date := (date_trunc('month', p_day) + interval '1 month - 1 day')::date;
+BEGIN
+    SELECT scope, category INTO v_scope, v_category
+    FROM emission_factors
+    WHERE id = p_emission_factor_id;
+
+    INSERT INTO emission_summaries AS s (
+        id, from_date, to_date, scope, category, activity_type,
+        total_co2e_tonnes, activity_count, summary_type
+    )
+    SELECT
+        gen_random_uuid(), b.from_date, b.to_date, b.scope, b.category, b.activity_type,
+        p_co2e_tonnes, p_activity_count, b.summary_type::summary_type
+    FROM (
+        SELECT DISTINCT * FROM (VALUES
+            (p_day, p_day, NULL::integer, NULL::integer, NULL::varchar, 'daily'),
+            (p_day, p_day, v_scope, NULL, NULL, 'daily'),
+            (p_day, p_day, v_scope, v_category, NULL, 'daily'),
+            (p_day, p_day, NULL, NULL, p_activity_type, 'daily'),
+            (p_day, p_day, v_scope, NULL, p_activity_type, 'daily'),
+            (v_month_start, v_month_end, NULL, NULL, NULL, 'monthly'),
+            (v_month_start, v_month_end, v_scope, NULL, NULL, 'monthly'),
+            (v_month_start, v_month_end, v_scope, v_category, NULL, 'monthly'),
+            (v_month_start, v_month_end, NULL, NULL, p_activity_type, 'monthly')
+        ) AS v(from_date, to_date, scope, category, activity_type, summary_type)
+    ) AS b
+    ON CONFLICT (
+        from_date, to_date, COALESCE(scope, 0), COALESCE(category, 0),
+        COALESCE(activity_type, ''), summary_type
+    ) DO UPDATE SET
+        total_co2e_tonnes = s.total_co2e_tonnes + EXCLUDED.total_co2e_tonnes,
+        activity_count = s.activity_count + EXCLUDED.activity_count;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+SUMMARY_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION emission_results_maintain_summaries() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM emission_summaries_apply_result(
+            OLD.emission_factor_id, OLD.activity_type::varchar, OLD.calculation_date,
+            -OLD.co2e_tonnes::numeric, -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM emission_summaries_apply_result(
+            NEW.emission_factor_id, NEW.activity_type::varchar, NEW.calculation_date,
+            NEW.co2e_tonnes::numeric, 1
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+SUMMARY_TRIGGER = (
+    "CREATE TRIGGER emission_results_maintain_summaries "
+    "AFTER INSERT OR DELETE OR UPDATE OF co2e_tonnes, emission_factor_id, "
+    "activity_type, calculation_date ON emission_results "
+    "FOR EACH ROW EXECUTE FUNCTION emission_results_maintain_summaries()"
+)
+
+# Migrations install these too; the listeners cover tables built with
+# metadata.create_all (e.g. in tests). One statement per DDL, as asyncpg
+# prepares each one.
+for _statement in (APPLY_SUMMARY_FUNCTION, SUMMARY_TRIGGER_FUNCTION, SUMMARY_TRIGGER):
+    event.listen(Base.metadata, "after_create", DDL(_statement))
+
+add_updated_at_trigger(EmissionSummaryDBModel.__table__)
@@ -3,17 +3,65 @@ Database session manager following kkb_fastapi pattern.
 
 Provides async context manager for database sessions.
 """
+import asyncio
 import logging
+import time
 
+from sqlalchemy import event, text
 from sqlalchemy.engine.url import URL
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+# Connections idle in the pool for longer than this are pinged when checked
+# out; connections in steady use skip the extra round trip
+PRE_PING_IDLE_SECONDS = 30
+
+
+def ping_idle_connections(
+    engine: AsyncEngine, idle_seconds: float = PRE_PING_IDLE_SECONDS
+) -> None:
+    """
+    Ping pooled connections on checkout only after they have sat idle.
+
+    A cheaper pool_pre_ping: it catches connections the server or network
+    dropped while idle without a SELECT 1 ahead of every checkout. A failed
+    ping makes the pool discard the connection and check out another.
+
+    Args:
+        engine: Engine whose pool to watch
+        idle_seconds: Idle time after which a connection is pinged
+    """
+    dialect = engine.sync_engine.dialect
+
+    @event.listens_for(engine.sync_engine.pool, "checkin")
+    def _record_checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(engine.sync_engine.pool, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        # New connections have no checkin time and need no ping
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            raise DisconnectionError() from e
 
 
 class Database:
     """
     Database session manager with context manager support.
 
+    One engine, and so one connection pool, is created by init() and shared
+    by every session; entering Database() checks a pooled connection out
+    rather than opening a new one.
+
     Usage:
         Database.init(db_url, engine_kw=engine_kw)
 
@@ -22,7 +70,8 @@ class Database:
             result = await session.execute(select(Model))
     """
 
-    _async_session_maker: sessionmaker | None = None
+    _async_engine: AsyncEngine | None = None
+    _async_session_maker: async_sessionmaker[AsyncSession] | None = None
 
     @classmethod
     def init(cls, async_db_url: URL, engine_kw: dict = None):
@@ -36,15 +85,53 @@ class Database:
         if engine_kw is None:
             engine_kw = {}
 
-        async_engine = create_async_engine(
+        cls._async_engine = create_async_engine(
             async_db_url,
             **engine_kw,
         )
-        cls._async_session_maker = sessionmaker(
-            bind=async_engine, expire_on_commit=False, class_=AsyncSession
+        if not engine_kw.get("pool_pre_ping"):
+            ping_idle_connections(cls._async_engine)
+        # No autoflush: repositories write with explicit statements and
+        # flush() where they add instances
+        cls._async_session_maker = async_sessionmaker(
+            bind=cls._async_engine, expire_on_commit=False, autoflush=False
         )
         logging.info("Database session maker initialized")
 
+    @classmethod
+    async def warm_up(cls, connections: int):
+        """
+        Open pooled connections ahead of the first requests.
+
+        Connecting (TCP, TLS, auth) otherwise happens on the first checkouts,
+        adding latency to the first burst of requests after startup. The
+        connections are opened concurrently and returned to the pool.
+
+        Args:
+            connections: Number of connections to open, capped at the pool size
+        """
+        connections = min(connections, cls._async_engine.pool.size())
+
+        async def connect():
+            async with cls._async_engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+
+        await asyncio.gather(*(connect() for _ in range(connections)))
+        logging.info(f"Opened {connections} pooled database connections")
+
+    @classmethod
+    async def dispose(cls):
+        """
+        Close all pooled connections.
+
+        Call on shutdown; init() must be called again before further use.
+        """
+        if cls._async_engine is not None:
+            await cls._async_engine.dispose()
+        cls._async_engine = None
+        cls._async_session_maker = None
+        logging.info("Database connection pool disposed")
+
     def __init__(self):
         if self._async_session_maker is None:
             raise RuntimeError(
@@ -3,6 +3,7 @@ Main FastAPI application entry point.
 
 Following kkb_fastapi pattern.
 """
+import asyncio
 import logging
 import os
 
@@ -12,6 +13,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
 from app.create_app import get_app
+from app.database.base import apply_db_migration
 from app.utils.constants import ConfigFile
 
 logging.basicConfig(level=logging.DEBUG)
@@ -67,6 +69,12 @@ async def health_check():
 
 
 if __name__ == "__main__":
+    # MIGRATION_MODE=sync applies pending migrations before the server starts
+    # listening, so no request sees a half-migrated schema. The default,
+    # skip, leaves migrations to `alembic upgrade head`.
+    if os.environ.get("MIGRATION_MODE", "skip") == "sync":
+        asyncio.run(apply_db_migration(app.state.config))
+
     try:
         uvicorn.run(
             app,
@@ -10,6 +10,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.utils.constants import ActivityTypeEnum
+
 
 # Electricity Activity Models
 class ElectricityActivityBase(BaseModel):
@@ -36,7 +38,7 @@ class ElectricityActivityPydModel(ElectricityActivityBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
-    activity_type: str
+    activity_type: ActivityTypeEnum
     is_deleted: bool
     created_at: datetime
     updated_at: datetime
@@ -68,7 +70,7 @@ class GoodsServicesActivityPydModel(GoodsServicesActivityBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
-    activity_type: str
+    activity_type: ActivityTypeEnum
     is_deleted: bool
     created_at: datetime
     updated_at: datetime
@@ -112,7 +114,15 @@ class AirTravelActivityPydModel(AirTravelActivityBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
-    activity_type: str
+    activity_type: ActivityTypeEnum
     is_deleted: bool
     created_at: datetime
     updated_at: datetime
+
+
+# Bulk ingestion
+class BulkCreateResponse(BaseModel):
+    """Model for bulk activity creation response."""
+
+    created: int = Field(..., description="Number of activities created")
+    ids: list[UUID] = Field(..., description="Ids of the created activities")
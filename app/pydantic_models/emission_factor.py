@@ -8,11 +8,13 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.utils.constants import ActivityTypeEnum
+
 
 class EmissionFactorBase(BaseModel):
     """Base emission factor model."""
 
-    activity_type: str = Field(..., max_length=100, description="Type of activity")
+    activity_type: ActivityTypeEnum = Field(..., description="Type of activity")
     lookup_identifier: str = Field(
         ..., max_length=200, description="Lookup identifier for matching"
     )
@@ -33,7 +35,7 @@ class EmissionFactorCreate(EmissionFactorBase):
 class EmissionFactorUpdate(BaseModel):
     """Model for updating emission factor."""
 
-    activity_type: str | None = Field(None, max_length=100)
+    activity_type: ActivityTypeEnum | None = None
     lookup_identifier: str | None = Field(None, max_length=200)
     unit: str | None = Field(None, max_length=50)
     co2e_factor: Decimal | None = None
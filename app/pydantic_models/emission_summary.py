@@ -108,6 +108,21 @@ class AggregationRequest(BaseModel):
         description="End date for custom range aggregation",
         examples=["2025-11-30"]
     )
+    scope: Optional[int] = Field(
+        None,
+        description="Restrict custom range aggregation to a GHG Protocol scope",
+        examples=[2]
+    )
+    category: Optional[int] = Field(
+        None,
+        description="Restrict custom range aggregation to a Scope 3 category",
+        examples=[1]
+    )
+    activity_type: Optional[str] = Field(
+        None,
+        description="Restrict custom range aggregation to an activity type",
+        examples=["Electricity"]
+    )
 
 
 class AggregationResponse(BaseModel):
@@ -123,3 +138,38 @@ class AggregationResponse(BaseModel):
         ...,
         description="List of created/updated summaries"
     )
+
+
+class AggregationJobPydModel(BaseModel):
+    """Model for background aggregation job status."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    aggregation_type: str = Field(
+        ...,
+        description="Type of aggregation: daily or monthly",
+        examples=["monthly"]
+    )
+    from_date: DateType = Field(
+        ...,
+        description="Start date of the aggregated range (inclusive)",
+        examples=["2025-01-01"]
+    )
+    to_date: DateType = Field(
+        ...,
+        description="End date of the aggregated range (inclusive)",
+        examples=["2025-11-30"]
+    )
+    status: str = Field(
+        ...,
+        description="Job state: pending, running, succeeded, failed",
+        examples=["succeeded"]
+    )
+    summaries_created: int = Field(
+        ...,
+        description="Number of summaries created or updated by the job"
+    )
+    error: Optional[str] = Field(None, description="Failure message, if the job failed")
+    created_at: datetime
+    updated_at: datetime
@@ -10,7 +10,8 @@ from datetime import date, timedelta
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Date, and_, cast, func, literal, or_, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.schemas import (
@@ -18,9 +19,31 @@ from app.database.schemas import (
     EmissionResultDBModel,
     EmissionSummaryDBModel,
 )
+from app.database.schemas.emission_summary import SUMMARY_PERIOD_KEY, summary_type_enum
+from app.utils.constants import ACTIVITY_KIND_BY_TYPE, ActivityType, SummaryType
 
 logger = logging.getLogger(__name__)
 
+ACTIVITY_TYPES = (
+    ActivityType.ELECTRICITY,
+    ActivityType.AIR_TRAVEL,
+    ActivityType.GOODS_SERVICES,
+)
+
+# Period totals over results joined to their factors, built once at import;
+# each call only adds its date range and filters.
+_PERIOD_TOTALS = (
+    select(
+        func.sum(EmissionResultDBModel.co2e_tonnes).label("total_co2e"),
+        func.count(EmissionResultDBModel.id).label("activity_count"),
+    )
+    .select_from(EmissionResultDBModel)
+    .join(
+        EmissionFactorDBModel,
+        EmissionResultDBModel.emission_factor_id == EmissionFactorDBModel.id,
+    )
+)
+
 
 class EmissionAggregator:
     """
@@ -87,8 +110,7 @@ class EmissionAggregator:
                 summaries.append(scope_cat_summary)
 
         # 4. Summary by activity type
-        activity_types = ["Electricity", "Air Travel", "Purchased Goods and Services"]
-        for activity_type in activity_types:
+        for activity_type in ACTIVITY_TYPES:
             activity_summary = await self._aggregate_period(
                 from_date=target_date,
                 to_date=target_date,
@@ -100,7 +122,7 @@ class EmissionAggregator:
 
         # 5. Summary by scope + activity type
         for scope in [2, 3]:
-            for activity_type in activity_types:
+            for activity_type in ACTIVITY_TYPES:
                 scope_activity_summary = await self._aggregate_period(
                     from_date=target_date,
                     to_date=target_date,
@@ -168,8 +190,7 @@ class EmissionAggregator:
                 summaries.append(scope_cat_summary)
 
         # By activity type
-        activity_types = ["Electricity", "Air Travel", "Purchased Goods and Services"]
-        for activity_type in activity_types:
+        for activity_type in ACTIVITY_TYPES:
             activity_summary = await self._aggregate_period(
                 from_date=from_date,
                 to_date=to_date,
@@ -182,26 +203,43 @@ class EmissionAggregator:
         logger.info(f"Created {len(summaries)} monthly summaries for {year}-{month:02d}")
         return summaries
 
-    async def _aggregate_period(
+    async def backfill_monthly_set_based(
         self,
         from_date: date,
         to_date: date,
-        scope: Optional[int] = None,
-        category: Optional[int] = None,
-        activity_type: Optional[str] = None,
-        summary_type: str = "daily",
-    ) -> Optional[EmissionSummaryDBModel]:
+    ) -> list[EmissionSummaryDBModel]:
         """
-        Aggregate emissions for a specific period and filter combination.
+        Aggregate every month overlapping a date range in one statement.
+
+        Produces the same breakdown as aggregate_monthly_summaries (overall,
+        by scope, by scope + category, by activity type) for all months at
+        once: a single INSERT ... SELECT grouping by month with GROUPING
+        SETS, upserted on ix_emission_summaries_unique_period. Whole months
+        are aggregated, including days outside the range.
 
         Returns:
-            EmissionSummaryDBModel if data exists, None otherwise
+            The stored EmissionSummaryDBModel rows, ordered by month
         """
-        # Build query to aggregate emission results
-        stmt = (
+        month_start = cast(
+            func.date_trunc("month", EmissionResultDBModel.calculation_date), Date
+        )
+        month_end = cast(month_start + text("interval '1 month - 1 day'"), Date)
+        first_month = from_date.replace(day=1)
+
+        totals = (
             select(
-                func.sum(EmissionResultDBModel.co2e_tonnes).label("total_co2e"),
-                func.count(EmissionResultDBModel.id).label("activity_count"),
+                func.gen_random_uuid(),
+                month_start,
+                month_end,
+                EmissionFactorDBModel.scope,
+                EmissionFactorDBModel.category,
+                cast(
+                    EmissionResultDBModel.activity_type,
+                    EmissionSummaryDBModel.activity_type.type,
+                ),
+                func.sum(EmissionResultDBModel.co2e_tonnes),
+                func.count(EmissionResultDBModel.id),
+                literal(SummaryType.MONTHLY, summary_type_enum),
             )
             .select_from(EmissionResultDBModel)
             .join(
@@ -209,20 +247,97 @@ class EmissionAggregator:
                 EmissionResultDBModel.emission_factor_id == EmissionFactorDBModel.id,
             )
             .where(
-                and_(
-                    EmissionResultDBModel.calculation_date >= from_date,
-                    EmissionResultDBModel.calculation_date <= to_date,
+                EmissionResultDBModel.calculation_date >= first_month,
+                EmissionResultDBModel.calculation_date
+                < cast(
+                    func.date_trunc("month", literal(to_date, Date)) + text("interval '1 month'"),
+                    Date,
+                ),
+            )
+            .group_by(
+                month_start,
+                func.grouping_sets(
+                    text("()"),
+                    EmissionFactorDBModel.scope,
+                    tuple_(EmissionFactorDBModel.scope, EmissionFactorDBModel.category),
+                    EmissionResultDBModel.activity_type,
+                ),
+            )
+            # Scope 2 factors have no category; that group would duplicate
+            # the plain scope 2 summary under the period key.
+            .having(
+                or_(
+                    func.grouping(EmissionFactorDBModel.category) == 1,
+                    EmissionFactorDBModel.category.is_not(None),
                 )
             )
         )
 
+        stmt = insert(EmissionSummaryDBModel).from_select(
+            [
+                "id",
+                "from_date",
+                "to_date",
+                "scope",
+                "category",
+                "activity_type",
+                "total_co2e_tonnes",
+                "activity_count",
+                "summary_type",
+            ],
+            totals,
+        )
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=SUMMARY_PERIOD_KEY,
+                set_={
+                    "total_co2e_tonnes": stmt.excluded.total_co2e_tonnes,
+                    "activity_count": stmt.excluded.activity_count,
+                },
+            )
+            .returning(EmissionSummaryDBModel)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        summaries = sorted(result.scalars().all(), key=lambda summary: summary.from_date)
+
+        logger.info(
+            "Created %d monthly summaries for %s to %s", len(summaries), from_date, to_date
+        )
+        return summaries
+
+    async def _aggregate_period(
+        self,
+        from_date: date,
+        to_date: date,
+        scope: Optional[int] = None,
+        category: Optional[int] = None,
+        activity_type: Optional[str] = None,
+        summary_type: str = "daily",
+    ) -> Optional[EmissionSummaryDBModel]:
+        """
+        Aggregate emissions for a specific period and filter combination.
+
+        Returns:
+            EmissionSummaryDBModel if data exists, None otherwise
+        """
+        # Build query to aggregate emission results
+        stmt = _PERIOD_TOTALS.where(
+            and_(
+                EmissionResultDBModel.calculation_date >= from_date,
+                EmissionResultDBModel.calculation_date <= to_date,
+            )
+        )
+
         # Apply filters
         if scope is not None:
             stmt = stmt.where(EmissionFactorDBModel.scope == scope)
         if category is not None:
             stmt = stmt.where(EmissionFactorDBModel.category == category)
         if activity_type is not None:
-            stmt = stmt.where(EmissionResultDBModel.activity_type == activity_type)
+            stmt = stmt.where(
+                EmissionResultDBModel.activity_kind == ACTIVITY_KIND_BY_TYPE.get(activity_type)
+            )
 
         result = await self.session.execute(stmt)
         row = result.one()
@@ -231,41 +346,62 @@ class EmissionAggregator:
         if row.total_co2e is None or row.activity_count == 0:
             return None
 
-        # Check if summary already exists
-        existing_stmt = select(EmissionSummaryDBModel).where(
-            and_(
-                EmissionSummaryDBModel.from_date == from_date,
-                EmissionSummaryDBModel.to_date == to_date,
-                EmissionSummaryDBModel.scope == scope,
-                EmissionSummaryDBModel.category == category,
-                EmissionSummaryDBModel.activity_type == activity_type,
-                EmissionSummaryDBModel.summary_type == summary_type,
-            )
+        summary = await self._upsert_summary(
+            from_date=from_date,
+            to_date=to_date,
+            scope=scope,
+            category=category,
+            activity_type=activity_type,
+            total_co2e_tonnes=row.total_co2e,
+            activity_count=row.activity_count,
+            summary_type=summary_type,
         )
-        existing_result = await self.session.execute(existing_stmt)
-        existing_summary = existing_result.scalar_one_or_none()
-
-        if existing_summary:
-            # Update existing summary
-            existing_summary.total_co2e_tonnes = row.total_co2e
-            existing_summary.activity_count = row.activity_count
-            logger.debug(f"Updated existing summary: {existing_summary}")
-            return existing_summary
-        else:
-            # Create new summary
-            summary = EmissionSummaryDBModel(
-                from_date=from_date,
-                to_date=to_date,
-                scope=scope,
-                category=category,
-                activity_type=activity_type,
-                total_co2e_tonnes=row.total_co2e,
-                activity_count=row.activity_count,
-                summary_type=summary_type,
+        logger.debug(f"Upserted summary: {summary}")
+        return summary
+
+    async def _upsert_summary(
+        self,
+        from_date: date,
+        to_date: date,
+        scope: Optional[int],
+        category: Optional[int],
+        activity_type: Optional[str],
+        total_co2e_tonnes: Decimal,
+        activity_count: int,
+        summary_type: str,
+    ) -> EmissionSummaryDBModel:
+        """
+        Insert a summary or overwrite the totals of the existing one.
+
+        Uses INSERT ... ON CONFLICT on ix_emission_summaries_unique_period, so
+        there is a single round trip and no race between lookup and insert.
+
+        Returns:
+            The stored EmissionSummaryDBModel
+        """
+        stmt = insert(EmissionSummaryDBModel).values(
+            from_date=from_date,
+            to_date=to_date,
+            scope=scope,
+            category=category,
+            activity_type=activity_type,
+            total_co2e_tonnes=total_co2e_tonnes,
+            activity_count=activity_count,
+            summary_type=summary_type,
+        )
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=SUMMARY_PERIOD_KEY,
+                set_={
+                    "total_co2e_tonnes": stmt.excluded.total_co2e_tonnes,
+                    "activity_count": stmt.excluded.activity_count,
+                },
             )
-            self.session.add(summary)
-            logger.debug(f"Created new summary: {summary}")
-            return summary
+            .returning(EmissionSummaryDBModel)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
 
     async def aggregate_custom_range(
         self,
@@ -295,8 +431,8 @@ class EmissionAggregator:
         )
 
         if not summary:
-            # Return empty summary if no data
-            summary = EmissionSummaryDBModel(
+            # Store an empty summary if no data
+            summary = await self._upsert_summary(
                 from_date=from_date,
                 to_date=to_date,
                 scope=scope,
@@ -306,7 +442,6 @@ class EmissionAggregator:
                 activity_count=0,
                 summary_type="custom",
             )
-            self.session.add(summary)
 
         await self.session.commit()
         return summary
@@ -9,7 +9,11 @@ from decimal import Decimal
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.schemas import ElectricityActivityDBModel, EmissionResultDBModel
+from app.database.schemas import (
+    ElectricityActivityDBModel,
+    EmissionFactorDBModel,
+    EmissionResultDBModel,
+)
 from app.services.calculators.factor_matcher import FactorMatcher
 from app.services.calculators.unit_converter import UnitConverter
 from app.utils.constants import ActivityType
@@ -56,8 +60,9 @@ class ElectricityCalculator:
             >>> print(f"Emissions: {result.co2e_tonnes} tonnes")
         """
         logger.info(
-            f"Calculating electricity emissions for {activity.usage_kwh} kWh "
-            f"in {activity.country}"
+            "Calculating electricity emissions for %s kWh in %s",
+            activity.usage_kwh,
+            activity.country,
         )
 
         # Match emission factor
@@ -68,41 +73,66 @@ class ElectricityCalculator:
         )
 
         if match_result is None:
-            logger.error(f"No emission factor found for electricity in {activity.country}")
+            logger.error("No emission factor found for electricity in %s", activity.country)
             return None
 
         emission_factor, confidence = match_result
 
         # Calculate emissions
         # Formula: kWh * kgCO2e/kWh / 1000 = tonnes CO2e
-        usage = UnitConverter.normalize_number(activity.usage_kwh)
-        factor = emission_factor.co2e_factor
-
-        co2e_tonnes = (usage * factor) / Decimal("1000")
+        usage = self.quantity(activity)
+        co2e_tonnes = (usage * emission_factor.co2e_factor) / Decimal("1000")
 
         # Create emission result
-        result = EmissionResultDBModel(
+        result = self.build_result(activity, emission_factor, confidence, co2e_tonnes)
+
+        self.session.add(result)
+        await self.session.flush()
+
+        logger.info(
+            "Calculated %s tonnes CO2e for electricity activity (confidence: %s)",
+            co2e_tonnes,
+            confidence,
+        )
+
+        return result
+
+    def match_in(
+        self,
+        factors: list[EmissionFactorDBModel],
+        activity: ElectricityActivityDBModel,
+        fuzzy_threshold: int = 80,
+    ) -> tuple[EmissionFactorDBModel, Decimal] | None:
+        """Match the activity's country against already-loaded electricity factors."""
+        return self.factor_matcher.match_in(
+            factors, ActivityType.ELECTRICITY, activity.country, fuzzy_threshold
+        )
+
+    @staticmethod
+    def quantity(activity: ElectricityActivityDBModel) -> Decimal:
+        """Amount the emission factor applies to: usage in kWh."""
+        return UnitConverter.normalize_number(activity.usage_kwh)
+
+    @staticmethod
+    def build_result(
+        activity: ElectricityActivityDBModel,
+        emission_factor: EmissionFactorDBModel,
+        confidence: Decimal,
+        co2e_tonnes: Decimal,
+    ) -> EmissionResultDBModel:
+        """Build the (unsaved) emission result for a calculated activity."""
+        return EmissionResultDBModel(
             activity_type=ActivityType.ELECTRICITY,
             activity_id=activity.id,
             emission_factor_id=emission_factor.id,
             co2e_tonnes=co2e_tonnes,
             confidence_score=confidence,
             calculation_metadata={
-                "usage_kwh": str(usage),
+                "usage_kwh": str(ElectricityCalculator.quantity(activity)),
                 "country": activity.country,
                 "matched_country": emission_factor.lookup_identifier,
-                "emission_factor_value": str(factor),
+                "emission_factor_value": str(emission_factor.co2e_factor),
                 "unit": emission_factor.unit,
                 "calculation_method": "exact" if confidence == Decimal("1.0") else "fuzzy",
             },
         )
-
-        self.session.add(result)
-        await self.session.flush()
-
-        logger.info(
-            f"Calculated {co2e_tonnes} tonnes CO2e for electricity activity "
-            f"(confidence: {confidence})"
-        )
-
-        return result
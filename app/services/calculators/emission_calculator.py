@@ -10,12 +10,14 @@ from decimal import Decimal
 from typing import Any, Union
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_config
 from app.database.repositories import (
     AirTravelActivityRepository,
     ElectricityActivityRepository,
+    EmissionFactorRepository,
     EmissionResultRepository,
     GoodsServicesActivityRepository,
 )
@@ -50,9 +52,7 @@ def get_fuzzy_threshold_from_config() -> int:
         )
         return int(threshold)
     except Exception as e:
-        logger.warning(
-            f"Failed to read fuzzy_match_threshold from config: {e}. Using default 80"
-        )
+        logger.warning("Failed to read fuzzy_match_threshold from config: %s. Using default 80", e)
         return 80
 
 
@@ -121,7 +121,15 @@ class EmissionCalculationService:
         self.electricity_calculator = ElectricityCalculator(session)
         self.goods_services_calculator = GoodsServicesCalculator(session)
         self.travel_calculator = TravelCalculator(session)
-        logger.info(f"Initialized EmissionCalculationService with fuzzy_threshold={self.fuzzy_threshold}")
+        self.calculators = {
+            ActivityType.ELECTRICITY: self.electricity_calculator,
+            ActivityType.GOODS_SERVICES: self.goods_services_calculator,
+            ActivityType.AIR_TRAVEL: self.travel_calculator,
+        }
+        logger.info(
+            "Initialized EmissionCalculationService with fuzzy_threshold=%s",
+            self.fuzzy_threshold,
+        )
 
     async def calculate_single(
         self,
@@ -165,12 +173,13 @@ class EmissionCalculationService:
             existing_result = await result_repo.get_by_activity_id(activity.id)
             if existing_result:
                 logger.info(
-                    f"Emission result already exists for {activity_type} activity {activity.id}, "
-                    f"returning existing result"
+                    "Emission result already exists for %s activity %s, returning existing result",
+                    activity_type,
+                    activity.id,
                 )
                 return existing_result
 
-        logger.info(f"Calculating emissions for {activity_type} activity {activity.id}")
+        logger.info("Calculating emissions for %s activity %s", activity_type, activity.id)
 
         try:
             # Route to appropriate calculator
@@ -209,7 +218,10 @@ class EmissionCalculationService:
         except Exception as e:
             # Unexpected exception during calculation
             logger.error(
-                f"Failed to calculate emissions for {activity_type} activity {activity.id}: {e}",
+                "Failed to calculate emissions for %s activity %s: %s",
+                activity_type,
+                activity.id,
+                e,
                 exc_info=True,
             )
             if raise_on_error:
@@ -220,6 +232,123 @@ class EmissionCalculationService:
                 ) from e
             return None
 
+    async def calculate_many(
+        self,
+        activities: list[ActivityInstance],
+        fuzzy_threshold: int | None = None,
+        skip_duplicate_check: bool = False,
+    ) -> list[EmissionResultDBModel]:
+        """
+        Calculate emissions for many activities with a handful of queries.
+
+        Same results as calling calculate_single for each activity, but
+        existing results are looked up in one query, factors are loaded once
+        per activity type and matched in memory, the CO2e multiplications run
+        as one vectorized operation, and all new results are inserted in a
+        single flush.
+
+        Args:
+            activities: Activity instances (can be mixed types)
+            fuzzy_threshold: Minimum fuzzy match threshold (0-100)
+            skip_duplicate_check: If True, skip check for existing results (for recalculation)
+
+        Returns:
+            One result per activity, in input order. Activities that could not
+            be calculated (e.g. no matching factor) are logged and left out.
+        """
+        # Use instance threshold if not explicitly provided
+        if fuzzy_threshold is None:
+            fuzzy_threshold = self.fuzzy_threshold
+
+        # Most recent existing result per activity
+        existing = {}
+        if activities and not skip_duplicate_check:
+            result_repo = EmissionResultRepository(self.session)
+            activity_ids = [activity.id for activity in activities]
+            existing = {
+                result.activity_id: result
+                for result in await result_repo.get_latest_by_activity_ids(
+                    activity_ids
+                )
+            }
+
+        factor_repo = EmissionFactorRepository(self.session)
+        factors_by_type = {}
+        matched = {}
+        for activity in activities:
+            if activity.id in existing or activity.id in matched:
+                continue
+
+            activity_type = activity.activity_type
+            calculator = self.calculators.get(activity_type)
+            if calculator is None:
+                logger.error("No calculator found for activity type: %s", activity_type)
+                continue
+
+            # Air travel may first need distance_km derived from miles
+            if activity_type == ActivityType.AIR_TRAVEL:
+                if not calculator.ensure_distance_km(activity):
+                    continue
+
+            if activity_type not in factors_by_type:
+                factors_by_type[activity_type] = await factor_repo.get_by_activity_type(
+                    activity_type, limit=None
+                )
+
+            match_result = calculator.match_in(
+                factors_by_type[activity_type], activity, fuzzy_threshold
+            )
+            if match_result is None:
+                logger.error(
+                    "No emission factor found for %s activity %s",
+                    activity_type,
+                    activity.id,
+                )
+                continue
+
+            matched[activity.id] = (activity, calculator, *match_result)
+
+        new_results = {}
+        if matched:
+            # Formula: quantity * kgCO2e/unit / 1000 = tonnes CO2e. co2e_tonnes
+            # is stored as double precision, so float64 loses nothing.
+            rows = list(matched.values())
+            quantities = np.fromiter(
+                (float(calculator.quantity(activity)) for activity, calculator, _, _ in rows),
+                dtype=np.float64,
+                count=len(rows),
+            )
+            factor_values = np.fromiter(
+                (float(emission_factor.co2e_factor) for _, _, emission_factor, _ in rows),
+                dtype=np.float64,
+                count=len(rows),
+            )
+            co2e_values = (quantities * factor_values / 1000).tolist()
+
+            for (activity, calculator, emission_factor, confidence), co2e in zip(
+                rows, co2e_values
+            ):
+                new_results[activity.id] = calculator.build_result(
+                    activity, emission_factor, confidence, Decimal(repr(co2e))
+                )
+
+            # The unit of work batches these into multi-row INSERTs
+            self.session.add_all(new_results.values())
+            await self.session.flush()
+
+        logger.info(
+            "Calculated emissions for %s activities (%s already calculated)",
+            len(new_results),
+            len(existing),
+        )
+
+        results = []
+        for activity in activities:
+            result = existing.get(activity.id) or new_results.get(activity.id)
+            if result is not None:
+                results.append(result)
+        return results
+
     async def calculate_batch(
         self,
         activities: list[ActivityInstance],
@@ -246,7 +375,7 @@ class EmissionCalculationService:
         if fuzzy_threshold is None:
             fuzzy_threshold = self.fuzzy_threshold
 
-        logger.info(f"Starting batch calculation for {len(activities)} activities")
+        logger.info("Starting batch calculation for %s activities", len(activities))
 
         results = []
         errors = []
@@ -304,10 +433,7 @@ class EmissionCalculationService:
                         )
 
                 except Exception as e:
-                    logger.error(
-                        f"Error processing activity {activity.id}: {e}",
-                        exc_info=True,
-                    )
+                    logger.error("Error processing activity %s: %s", activity.id, e, exc_info=True)
                     errors.append(
                         {
                             "activity_id": str(activity.id),
@@ -340,8 +466,10 @@ class EmissionCalculationService:
         }
 
         logger.info(
-            f"Batch calculation complete: {len(results)}/{len(activities)} successful, "
-            f"{total_co2e} tonnes CO2e total"
+            "Batch calculation complete: %s/%s successful, %s tonnes CO2e total",
+            len(results),
+            len(activities),
+            total_co2e,
         )
 
         return summary
@@ -402,7 +530,8 @@ class EmissionCalculationService:
         Trade-off: Slightly slower due to per-record EXISTS checks, but scales to unlimited records.
         """
         logger.info(
-            f"Starting TRUE streaming calculation (batch_size={batch_size}, constant memory)"
+            "Starting TRUE streaming calculation (batch_size=%s, constant memory)",
+            batch_size,
         )
 
         # Only track aggregate statistics, NOT full result objects
@@ -422,7 +551,7 @@ class EmissionCalculationService:
             offset = 0
             processed_this_type = 0
 
-            logger.info(f"Processing {activity_type_name} activities in batches...")
+            logger.info("Processing %s activities in batches...", activity_type_name)
 
             while True:
                 # Fetch batch of activities
@@ -469,7 +598,9 @@ class EmissionCalculationService:
                     except Exception as e:
                         total_errors += 1
                         logger.error(
-                            f"Error processing activity {activity.id}: {e}",
+                            "Error processing activity %s: %s",
+                            activity.id,
+                            e,
                             exc_info=True,
                         )
                         if len(error_samples) < MAX_ERROR_SAMPLES:
@@ -490,13 +621,17 @@ class EmissionCalculationService:
                 self.session.expunge_all()
 
                 logger.info(
-                    f"Processed batch at offset {offset}, "
-                    f"{processed_this_type} {activity_type_name} activities calculated so far"
+                    "Processed batch at offset %s, %s %s activities calculated so far",
+                    offset,
+                    processed_this_type,
+                    activity_type_name,
                 )
                 offset += batch_size
 
             logger.info(
-                f"Completed {activity_type_name}: {processed_this_type} activities calculated"
+                "Completed %s: %s activities calculated",
+                activity_type_name,
+                processed_this_type,
             )
 
         # Calculate overall statistics
@@ -524,8 +659,11 @@ class EmissionCalculationService:
         }
 
         logger.info(
-            f"TRUE streaming complete: {total_processed}/{total_activities} successful, "
-            f"{total_co2e} tonnes CO2e total (constant memory used)"
+            "TRUE streaming complete: %s/%s successful, "
+            "%s tonnes CO2e total (constant memory used)",
+            total_processed,
+            total_activities,
+            total_co2e,
         )
 
         return summary
@@ -548,10 +686,10 @@ class EmissionCalculationService:
 
         # Get IDs of activities that already have results (no pagination limit)
         result_repo = EmissionResultRepository(self.session)
-        existing_results = await result_repo.get_all_results(skip=0, limit=10000)
+        existing_results = await result_repo.get_all_result_rows(limit=10000)
         existing_ids = {r.activity_id for r in existing_results}
 
-        logger.info(f"Found {len(existing_ids)} existing emission results")
+        logger.info("Found %s existing emission results", len(existing_ids))
 
         # Get pending activities (those without results) - no pagination limit
         pending_activities = []
@@ -577,7 +715,7 @@ class EmissionCalculationService:
             if activity.id not in existing_ids:
                 pending_activities.append(activity)
 
-        logger.info(f"Found {len(pending_activities)} pending activities")
+        logger.info("Found %s pending activities", len(pending_activities))
 
         if not pending_activities:
             return {
@@ -625,7 +763,9 @@ class EmissionCalculationService:
             fuzzy_threshold = self.fuzzy_threshold
 
         logger.info(
-            f"Recalculating emissions for {activity.activity_type} activity {activity.id}"
+            "Recalculating emissions for %s activity %s",
+            activity.activity_type,
+            activity.id,
         )
 
         # Delete existing results for this activity
@@ -633,7 +773,7 @@ class EmissionCalculationService:
         deleted_count = await result_repo.delete_by_activity_id(activity.id)
 
         if deleted_count > 0:
-            logger.info(f"Deleted {deleted_count} existing result(s)")
+            logger.info("Deleted %s existing result(s)", deleted_count)
 
         # Calculate new result - skip duplicate check since we just deleted it
         return await self.calculate_single(
@@ -682,11 +822,11 @@ class EmissionCalculationService:
             repo = AirTravelActivityRepository(self.session)
             activity = await repo.get_by_id_active(activity_id)
         else:
-            logger.error(f"Unknown activity type: {activity_type}")
+            logger.error("Unknown activity type: %s", activity_type)
             return None
 
         if not activity:
-            logger.error(f"Activity not found: {activity_type} {activity_id}")
+            logger.error("Activity not found: %s %s", activity_type, activity_id)
             return None
 
         if recalculate:
@@ -54,22 +54,22 @@ class FactorMatcher:
             EmissionFactorDBModel if found, None otherwise
         """
         try:
-            # Search by activity type and identifier
+            # An exact match is also a prefix match, which the index serves
             factors = await self.factor_repo.search_by_identifier(
-                lookup_identifier, activity_type=activity_type
+                lookup_identifier, activity_type=activity_type, prefix=True
             )
 
             # Look for exact match (case-insensitive)
             for factor in factors:
                 if factor.lookup_identifier.lower() == lookup_identifier.lower():
-                    logger.debug(f"Exact match found for {activity_type}: {lookup_identifier}")
+                    logger.debug("Exact match found for %s: %s", activity_type, lookup_identifier)
                     return factor
 
-            logger.debug(f"No exact match for {activity_type}: {lookup_identifier}")
+            logger.debug("No exact match for %s: %s", activity_type, lookup_identifier)
             return None
 
         except Exception as e:
-            logger.error(f"Error in exact_match: {e}")
+            logger.error("Error in exact_match: %s", e)
             return None
 
     async def fuzzy_match(
@@ -93,9 +93,18 @@ class FactorMatcher:
         """
         # Get all factors for this activity type
         factors = await self.factor_repo.get_by_activity_type(activity_type)
+        return self._fuzzy_match_in(factors, activity_type, lookup_identifier, threshold)
 
+    @staticmethod
+    def _fuzzy_match_in(
+        factors: list[EmissionFactorDBModel],
+        activity_type: str,
+        lookup_identifier: str,
+        threshold: int,
+    ) -> tuple[EmissionFactorDBModel, Decimal] | None:
+        """Fuzzy match against already-loaded factors of one activity type."""
         if not factors:
-            logger.warning(f"No emission factors found for {activity_type}")
+            logger.warning("No emission factors found for %s", activity_type)
             return None
 
         # Build dict of identifier -> factor
@@ -109,15 +118,18 @@ class FactorMatcher:
         )
 
         if result is None:
-            logger.warning(f"No fuzzy match found for {activity_type}: {lookup_identifier}")
+            logger.warning("No fuzzy match found for %s: %s", activity_type, lookup_identifier)
             return None
 
         matched_identifier, score, _ = result
 
         if score < threshold:
             logger.info(
-                f"Fuzzy match score {score} below threshold {threshold} "
-                f"for {activity_type}: {lookup_identifier}"
+                "Fuzzy match score %s below threshold %s for %s: %s",
+                score,
+                threshold,
+                activity_type,
+                lookup_identifier,
             )
             return None
 
@@ -128,8 +140,11 @@ class FactorMatcher:
         confidence = Decimal(str(score)) / Decimal("100")
 
         logger.info(
-            f"Fuzzy matched '{lookup_identifier}' to '{matched_identifier}' "
-            f"with {score}% confidence for {activity_type}"
+            "Fuzzy matched '%s' to '%s' with %s%% confidence for %s",
+            lookup_identifier,
+            matched_identifier,
+            score,
+            activity_type,
         )
 
         return factor, confidence
@@ -154,16 +169,22 @@ class FactorMatcher:
         # Try exact match first
         factor = await self.exact_match(activity_type, lookup_identifier)
         if factor:
-            logger.debug(f"Exact match found for {activity_type}: {lookup_identifier}")
+            logger.debug("Exact match found for %s: %s", activity_type, lookup_identifier)
             return factor, Decimal("1.0")
 
         # Fall back to fuzzy matching
-        logger.debug(f"No exact match, trying fuzzy match for {activity_type}: {lookup_identifier}")
+        logger.debug(
+            "No exact match, trying fuzzy match for %s: %s",
+            activity_type,
+            lookup_identifier,
+        )
         result = await self.fuzzy_match(activity_type, lookup_identifier, threshold)
 
         if result is None:
             logger.error(
-                f"No match found (exact or fuzzy) for {activity_type}: {lookup_identifier}"
+                "No match found (exact or fuzzy) for %s: %s",
+                activity_type,
+                lookup_identifier,
             )
             return None
 
@@ -206,7 +227,17 @@ class FactorMatcher:
 
         # Try partial matches if exact combination fails
         factors = await self.factor_repo.get_by_activity_type(ActivityType.AIR_TRAVEL)
+        return self._partial_air_travel_match_in(
+            factors, flight_range, passenger_class_normalized
+        )
 
+    @staticmethod
+    def _partial_air_travel_match_in(
+        factors: list[EmissionFactorDBModel],
+        flight_range: str,
+        passenger_class_normalized: str,
+    ) -> tuple[EmissionFactorDBModel, Decimal] | None:
+        """Find a factor whose identifier mentions both flight range and class."""
         for factor in factors:
             identifier = factor.lookup_identifier.lower()
             if (
@@ -214,10 +245,77 @@ class FactorMatcher:
                 and passenger_class_normalized.lower() in identifier
             ):
                 logger.info(
-                    f"Partial match found: {factor.lookup_identifier} "
-                    f"for {flight_range}, {passenger_class_normalized}"
+                    "Partial match found: %s for %s, %s",
+                    factor.lookup_identifier,
+                    flight_range,
+                    passenger_class_normalized,
                 )
                 return factor, Decimal("0.9")
 
-        logger.error(f"No match found for air travel: {flight_range}, {passenger_class_normalized}")
+        logger.error(
+            "No match found for air travel: %s, %s",
+            flight_range,
+            passenger_class_normalized,
+        )
         return None
+
+    def match_in(
+        self,
+        factors: list[EmissionFactorDBModel],
+        activity_type: str,
+        lookup_identifier: str,
+        threshold: int = DEFAULT_THRESHOLD,
+    ) -> tuple[EmissionFactorDBModel, Decimal] | None:
+        """
+        Match against already-loaded factors: exact match first, then fuzzy.
+
+        Same rules as match_with_fallback, without a query per lookup, for
+        batch calculations that load each activity type's factors once.
+
+        Args:
+            factors: All emission factors of the activity type
+            activity_type: Type of activity
+            lookup_identifier: Identifier to match
+            threshold: Minimum fuzzy match threshold
+
+        Returns:
+            Tuple of (EmissionFactorDBModel, confidence_score), or None
+        """
+        lookup_lower = lookup_identifier.lower()
+        for factor in factors:
+            if factor.lookup_identifier.lower() == lookup_lower:
+                return factor, Decimal("1.0")
+
+        return self._fuzzy_match_in(factors, activity_type, lookup_identifier, threshold)
+
+    def match_air_travel_in(
+        self,
+        factors: list[EmissionFactorDBModel],
+        flight_range: str,
+        passenger_class: str,
+        threshold: int = DEFAULT_THRESHOLD,
+    ) -> tuple[EmissionFactorDBModel, Decimal] | None:
+        """
+        Match air travel against already-loaded factors.
+
+        Same rules as match_air_travel.
+
+        Args:
+            factors: All air travel emission factors
+            flight_range: Flight range (e.g., "Short-haul", "Long-haul")
+            passenger_class: Passenger class (e.g., "Economy", "Business class")
+            threshold: Minimum fuzzy match threshold
+
+        Returns:
+            Tuple of (EmissionFactorDBModel, confidence_score), or None
+        """
+        passenger_class_normalized = passenger_class.strip()
+        lookup_key = f"{flight_range}, {passenger_class_normalized}"
+
+        result = self.match_in(factors, ActivityType.AIR_TRAVEL, lookup_key, threshold)
+        if result:
+            return result
+
+        return self._partial_air_travel_match_in(
+            factors, flight_range, passenger_class_normalized
+        )
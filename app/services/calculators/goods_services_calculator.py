@@ -9,7 +9,11 @@ from decimal import Decimal
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.schemas import EmissionResultDBModel, GoodsServicesActivityDBModel
+from app.database.schemas import (
+    EmissionFactorDBModel,
+    EmissionResultDBModel,
+    GoodsServicesActivityDBModel,
+)
 from app.services.calculators.factor_matcher import FactorMatcher
 from app.services.calculators.unit_converter import UnitConverter
 from app.utils.constants import ActivityType
@@ -56,8 +60,9 @@ class GoodsServicesCalculator:
             >>> print(f"Emissions: {result.co2e_tonnes} tonnes")
         """
         logger.info(
-            f"Calculating goods/services emissions for £{activity.spend_gbp} "
-            f"in {activity.supplier_category}"
+            "Calculating goods/services emissions for £%s in %s",
+            activity.spend_gbp,
+            activity.supplier_category,
         )
 
         # Match emission factor
@@ -69,8 +74,8 @@ class GoodsServicesCalculator:
 
         if match_result is None:
             logger.error(
-                f"No emission factor found for goods/services category: "
-                f"{activity.supplier_category}"
+                "No emission factor found for goods/services category: %s",
+                activity.supplier_category,
             )
             return None
 
@@ -78,34 +83,62 @@ class GoodsServicesCalculator:
 
         # Calculate emissions
         # Formula: GBP * kgCO2e/GBP / 1000 = tonnes CO2e
-        spend = UnitConverter.normalize_number(activity.spend_gbp)
-        factor = emission_factor.co2e_factor
-
-        co2e_tonnes = (spend * factor) / Decimal("1000")
+        spend = self.quantity(activity)
+        co2e_tonnes = (spend * emission_factor.co2e_factor) / Decimal("1000")
 
         # Create emission result
-        result = EmissionResultDBModel(
+        result = self.build_result(activity, emission_factor, confidence, co2e_tonnes)
+
+        self.session.add(result)
+        await self.session.flush()
+
+        logger.info(
+            "Calculated %s tonnes CO2e for goods/services activity (confidence: %s)",
+            co2e_tonnes,
+            confidence,
+        )
+
+        return result
+
+    def match_in(
+        self,
+        factors: list[EmissionFactorDBModel],
+        activity: GoodsServicesActivityDBModel,
+        fuzzy_threshold: int = 80,
+    ) -> tuple[EmissionFactorDBModel, Decimal] | None:
+        """Match the supplier category against already-loaded goods/services factors."""
+        return self.factor_matcher.match_in(
+            factors,
+            ActivityType.GOODS_SERVICES,
+            activity.supplier_category,
+            fuzzy_threshold,
+        )
+
+    @staticmethod
+    def quantity(activity: GoodsServicesActivityDBModel) -> Decimal:
+        """Amount the emission factor applies to: spend in GBP."""
+        return UnitConverter.normalize_number(activity.spend_gbp)
+
+    @staticmethod
+    def build_result(
+        activity: GoodsServicesActivityDBModel,
+        emission_factor: EmissionFactorDBModel,
+        confidence: Decimal,
+        co2e_tonnes: Decimal,
+    ) -> EmissionResultDBModel:
+        """Build the (unsaved) emission result for a calculated activity."""
+        return EmissionResultDBModel(
             activity_type=ActivityType.GOODS_SERVICES,
             activity_id=activity.id,
             emission_factor_id=emission_factor.id,
             co2e_tonnes=co2e_tonnes,
             confidence_score=confidence,
             calculation_metadata={
-                "spend_gbp": str(spend),
+                "spend_gbp": str(GoodsServicesCalculator.quantity(activity)),
                 "supplier_category": activity.supplier_category,
                 "matched_category": emission_factor.lookup_identifier,
-                "emission_factor_value": str(factor),
+                "emission_factor_value": str(emission_factor.co2e_factor),
                 "unit": emission_factor.unit,
                 "calculation_method": "exact" if confidence == Decimal("1.0") else "fuzzy",
             },
         )
-
-        self.session.add(result)
-        await self.session.flush()
-
-        logger.info(
-            f"Calculated {co2e_tonnes} tonnes CO2e for goods/services activity "
-            f"(confidence: {confidence})"
-        )
-
-        return result
@@ -9,7 +9,11 @@ from decimal import Decimal
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.schemas import AirTravelActivityDBModel, EmissionResultDBModel
+from app.database.schemas import (
+    AirTravelActivityDBModel,
+    EmissionFactorDBModel,
+    EmissionResultDBModel,
+)
 from app.services.calculators.factor_matcher import FactorMatcher
 from app.services.calculators.unit_converter import UnitConverter
 from app.utils.constants import ActivityType
@@ -57,10 +61,65 @@ class TravelCalculator:
             >>> print(f"Emissions: {result.co2e_tonnes} tonnes")
         """
         logger.info(
-            f"Calculating air travel emissions for {activity.distance_km} km "
-            f"({activity.flight_range}, {activity.passenger_class})"
+            "Calculating air travel emissions for %s km (%s, %s)",
+            activity.distance_km,
+            activity.flight_range,
+            activity.passenger_class,
+        )
+
+        if not self.ensure_distance_km(activity):
+            return None
+        await self.session.flush()
+
+        # Match emission factor using specialized air travel matcher
+        match_result = await self.factor_matcher.match_air_travel(
+            activity.flight_range,
+            activity.passenger_class,
+            threshold=fuzzy_threshold,
         )
 
+        if match_result is None:
+            logger.error(
+                "No emission factor found for air travel: %s, %s",
+                activity.flight_range,
+                activity.passenger_class,
+            )
+            return None
+
+        emission_factor, confidence = match_result
+
+        # Calculate emissions
+        # Formula: km * kgCO2e/km / 1000 = tonnes CO2e
+        distance = self.quantity(activity)
+        co2e_tonnes = (distance * emission_factor.co2e_factor) / Decimal("1000")
+
+        # Create emission result
+        result = self.build_result(activity, emission_factor, confidence, co2e_tonnes)
+
+        self.session.add(result)
+        await self.session.flush()
+
+        logger.info(
+            "Calculated %s tonnes CO2e for air travel activity (confidence: %s)",
+            co2e_tonnes,
+            confidence,
+        )
+
+        return result
+
+    @staticmethod
+    def ensure_distance_km(activity: AirTravelActivityDBModel) -> bool:
+        """
+        Populate distance_km from distance_miles when it is missing.
+
+        Changes are left for the session to flush.
+
+        Args:
+            activity: AirTravelActivityDBModel instance
+
+        Returns:
+            False if the activity has no distance at all, True otherwise
+        """
         # Ensure distance_km is populated (convert from miles if needed)
         if (
             (activity.distance_km is None or activity.distance_km == 0)
@@ -68,56 +127,58 @@ class TravelCalculator:
             and activity.distance_miles > 0
         ):
             activity.distance_km = UnitConverter.miles_to_km(activity.distance_miles)
-            await self.session.flush()
 
         # Only reject if BOTH distances are None or missing
         if activity.distance_km is None and activity.distance_miles is None:
             logger.error(
-                f"No distance information available for air travel activity {activity.id}"
+                "No distance information available for air travel activity %s",
+                activity.id,
             )
-            return None
+            return False
 
         # If we have a zero distance, proceed with 0 emissions
         if activity.distance_km == 0 or activity.distance_km is None:
             logger.info(
-                f"Zero-distance flight for activity {activity.id} - calculating 0 emissions"
+                "Zero-distance flight for activity %s - calculating 0 emissions",
+                activity.id,
             )
             if activity.distance_km is None:
                 activity.distance_km = Decimal("0")
-                await self.session.flush()
-
-        # Match emission factor using specialized air travel matcher
-        match_result = await self.factor_matcher.match_air_travel(
-            activity.flight_range,
-            activity.passenger_class,
-            threshold=fuzzy_threshold,
-        )
 
-        if match_result is None:
-            logger.error(
-                f"No emission factor found for air travel: "
-                f"{activity.flight_range}, {activity.passenger_class}"
-            )
-            return None
+        return True
 
-        emission_factor, confidence = match_result
-
-        # Calculate emissions
-        # Formula: km * kgCO2e/km / 1000 = tonnes CO2e
-        distance = UnitConverter.normalize_number(activity.distance_km)
-        factor = emission_factor.co2e_factor
+    def match_in(
+        self,
+        factors: list[EmissionFactorDBModel],
+        activity: AirTravelActivityDBModel,
+        fuzzy_threshold: int = 80,
+    ) -> tuple[EmissionFactorDBModel, Decimal] | None:
+        """Match flight range and class against already-loaded air travel factors."""
+        return self.factor_matcher.match_air_travel_in(
+            factors, activity.flight_range, activity.passenger_class, fuzzy_threshold
+        )
 
-        co2e_tonnes = (distance * factor) / Decimal("1000")
+    @staticmethod
+    def quantity(activity: AirTravelActivityDBModel) -> Decimal:
+        """Amount the emission factor applies to: distance in km."""
+        return UnitConverter.normalize_number(activity.distance_km)
 
-        # Create emission result
-        result = EmissionResultDBModel(
+    @staticmethod
+    def build_result(
+        activity: AirTravelActivityDBModel,
+        emission_factor: EmissionFactorDBModel,
+        confidence: Decimal,
+        co2e_tonnes: Decimal,
+    ) -> EmissionResultDBModel:
+        """Build the (unsaved) emission result for a calculated activity."""
+        return EmissionResultDBModel(
             activity_type=ActivityType.AIR_TRAVEL,
             activity_id=activity.id,
             emission_factor_id=emission_factor.id,
             co2e_tonnes=co2e_tonnes,
             confidence_score=confidence,
             calculation_metadata={
-                "distance_km": str(distance),
+                "distance_km": str(TravelCalculator.quantity(activity)),
                 "distance_miles": (
                     str(activity.distance_miles)
                     if activity.distance_miles is not None
@@ -126,20 +187,10 @@ class TravelCalculator:
                 "flight_range": activity.flight_range,
                 "passenger_class": activity.passenger_class,
                 "matched_identifier": emission_factor.lookup_identifier,
-                "emission_factor_value": str(factor),
+                "emission_factor_value": str(emission_factor.co2e_factor),
                 "unit": emission_factor.unit,
                 "calculation_method": (
                     "exact" if confidence == Decimal("1.0") else "fuzzy"
                 ),
             },
         )
-
-        self.session.add(result)
-        await self.session.flush()
-
-        logger.info(
-            f"Calculated {co2e_tonnes} tonnes CO2e for air travel activity "
-            f"(confidence: {confidence})"
-        )
-
-        return result
@@ -8,12 +8,16 @@ import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import ConfigFile, get_config
+from app.api.factors import FACTOR_CACHE
+from app.api.reports import REPORT_CACHE
+from app.api.summaries import LATEST_SUMMARY_CACHE
 from app.create_app import get_app
 from app.database import Base
 from app.database.base import get_db_url
+from app.database.repositories.emission_factor import LOOKUP_CACHE
 from app.database.session_manager.db_session import Database
 
 logging.basicConfig(
@@ -57,7 +61,7 @@ async def test_async_engine(test_config):
         "pool_size": 90,
         "max_overflow": 110,
         "pool_timeout": 30,
-        "poolclass": QueuePool,
+        "poolclass": AsyncAdaptedQueuePool,
     }
 
     test_engine = create_async_engine(async_db_url, **engine_kw)
@@ -80,6 +84,12 @@ async def db_cleanup(test_async_engine):
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
 
+    # Cached responses would outlive the tables they came from
+    FACTOR_CACHE.clear()
+    LOOKUP_CACHE.clear()
+    REPORT_CACHE.clear()
+    LATEST_SUMMARY_CACHE.clear()
+
     yield
 
     # Drop all tables after test
@@ -110,6 +120,8 @@ async def initialize_db_session(test_config, test_async_engine):
 
     yield
 
+    await Database.dispose()
+
 
 @pytest_asyncio.fixture(scope="function")
 async def test_app(test_config):
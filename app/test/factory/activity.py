@@ -2,7 +2,7 @@
 Factory for Activity models following kkb_fastapi pattern.
 """
 import uuid
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal
 
 import factory
@@ -34,8 +34,6 @@ class ElectricityActivityFactory(AsyncSQLAlchemyFactory):
     source_file = None
     raw_data = {}
     is_deleted = False
-    created_at = factory.LazyFunction(datetime.utcnow)
-    updated_at = factory.LazyFunction(datetime.utcnow)
 
 
 class AirTravelActivityFactory(AsyncSQLAlchemyFactory):
@@ -58,8 +56,6 @@ class AirTravelActivityFactory(AsyncSQLAlchemyFactory):
     source_file = None
     raw_data = {}
     is_deleted = False
-    created_at = factory.LazyFunction(datetime.utcnow)
-    updated_at = factory.LazyFunction(datetime.utcnow)
 
 
 class LongHaulBusinessTravelFactory(AirTravelActivityFactory):
@@ -90,5 +86,3 @@ class GoodsServicesActivityFactory(AsyncSQLAlchemyFactory):
     source_file = None
     raw_data = {}
     is_deleted = False
-    created_at = factory.LazyFunction(datetime.utcnow)
-    updated_at = factory.LazyFunction(datetime.utcnow)
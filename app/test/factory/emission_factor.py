@@ -2,7 +2,6 @@
 Factory for EmissionFactor models following kkb_fastapi pattern.
 """
 import uuid
-from datetime import datetime
 from decimal import Decimal
 
 import factory
@@ -30,8 +29,6 @@ class EmissionFactorFactory(AsyncSQLAlchemyFactory):
     category = None
     source = "Test Data"
     notes = factory.Sequence(lambda n: f"Test emission factor {n}")
-    created_at = factory.LazyFunction(datetime.utcnow)
-    updated_at = factory.LazyFunction(datetime.utcnow)
 
 
 class ElectricityEmissionFactorFactory(EmissionFactorFactory):
@@ -2,7 +2,7 @@
 Factory for EmissionResult models following kkb_fastapi pattern.
 """
 import uuid
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal
 
 import factory
@@ -36,8 +36,6 @@ class EmissionResultFactory(AsyncSQLAlchemyFactory):
         "calculation_method": "exact",
     }
     calculation_date = factory.LazyFunction(date.today)
-    created_at = factory.LazyFunction(datetime.utcnow)
-    updated_at = factory.LazyFunction(datetime.utcnow)
 
 
 class ElectricityEmissionResultFactory(EmissionResultFactory):
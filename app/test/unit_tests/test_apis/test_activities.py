@@ -2,8 +2,14 @@
 API tests for activities endpoints following kkb_fastapi pattern.
 """
 
+import json
+from datetime import date
+
 import pytest
+from sqlalchemy import select
 
+from app.database.repositories import ElectricityActivityRepository
+from app.database.schemas import ElectricityActivityDBModel
 from app.test.factory.activity import (
     AirTravelActivityFactory,
     ElectricityActivityFactory,
@@ -70,6 +76,18 @@ async def test_get_electricity_activity_by_id(test_async_client):
     assert data["country"] == activity.country
 
 
+@pytest.mark.asyncio
+async def test_get_activity_by_id_not_found(test_async_client):
+    """Test retrieving an unknown or malformed activity id."""
+    response = await test_async_client.get(
+        "/api/v1/activities/air-travel/00000000-0000-0000-0000-000000000000"
+    )
+    assert response.status_code == 404
+
+    response = await test_async_client.get("/api/v1/activities/goods-services/not-a-uuid")
+    assert response.status_code == 422
+
+
 @pytest.mark.asyncio
 async def test_pagination_electricity_activities(test_async_client):
     """Test pagination for electricity activities."""
@@ -88,3 +106,129 @@ async def test_pagination_electricity_activities(test_async_client):
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 5
+
+
+@pytest.mark.asyncio
+async def test_keyset_pagination_electricity_activities(test_async_client):
+    """Test keyset pagination (before_date/before_id) for electricity activities."""
+    for day in range(1, 16):
+        await ElectricityActivityFactory(date=date(2025, 1, day))
+
+    response = await test_async_client.get("/api/v1/activities/electricity?limit=10")
+    assert response.status_code == 200
+    first_page = response.json()
+    assert len(first_page) == 10
+    assert first_page[0]["date"] == "2025-01-15"
+
+    last = first_page[-1]
+    response = await test_async_client.get(
+        "/api/v1/activities/electricity",
+        params={"limit": 10, "before_date": last["date"], "before_id": last["id"]},
+    )
+    assert response.status_code == 200
+    second_page = response.json()
+    assert len(second_page) == 5
+    assert second_page[0]["date"] == "2025-01-05"
+    assert not {a["id"] for a in first_page} & {a["id"] for a in second_page}
+
+
+@pytest.mark.asyncio
+async def test_export_goods_services_activities(test_async_client):
+    """Test exporting active activities as newline-delimited JSON, newest first."""
+    activities = [
+        await GoodsServicesActivityFactory(date=date(2025, month, 1))
+        for month in (1, 2, 3)
+    ]
+    await GoodsServicesActivityFactory(date=date(2025, 4, 1), is_deleted=True)
+
+    response = await test_async_client.get("/api/v1/activities/goods-services/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    exported = [json.loads(line) for line in response.text.splitlines()]
+    assert [a["id"] for a in exported] == [str(a.id) for a in reversed(activities)]
+
+
+@pytest.mark.asyncio
+async def test_soft_deleted_activities_excluded_from_queries(test_db_session):
+    """Test that soft-deleted activities are left out of every query."""
+    live = await ElectricityActivityFactory()
+    deleted = await ElectricityActivityFactory()
+
+    repo = ElectricityActivityRepository(test_db_session)
+    await repo.soft_delete(deleted.id)
+
+    assert await repo.get_by_id(deleted.id) is None
+    assert [a.id for a in await repo.get_all()] == [live.id]
+    assert await repo.count() == 1
+
+    stmt = select(ElectricityActivityDBModel.id).execution_options(
+        include_deleted=True
+    )
+    result = await test_db_session.execute(stmt)
+    assert set(result.scalars().all()) == {live.id, deleted.id}
+
+    restored = await repo.restore(deleted.id)
+    assert restored.is_deleted is False
+    assert await repo.count() == 2
+
+
+@pytest.mark.asyncio
+async def test_create_electricity_activity(test_async_client):
+    """Test creating an electricity activity."""
+    payload = {"date": "2025-01-15", "country": "United Kingdom", "usage_kwh": "1250.5"}
+
+    response = await test_async_client.post("/api/v1/activities/electricity", json=payload)
+    assert response.status_code == 201
+
+    data = response.json()
+    assert data["country"] == "United Kingdom"
+    assert data["activity_type"] == ActivityType.ELECTRICITY
+    assert data["is_deleted"] is False
+
+    response = await test_async_client.get("/api/v1/activities/electricity")
+    assert [a["id"] for a in response.json()] == [data["id"]]
+
+
+@pytest.mark.asyncio
+async def test_create_air_travel_activity_converts_distance(test_async_client):
+    """Test creating an air travel activity derives distance_km."""
+    payload = {
+        "date": "2025-01-15",
+        "distance_miles": "100",
+        "flight_range": "Short-haul",
+        "passenger_class": "Economy class",
+    }
+
+    response = await test_async_client.post("/api/v1/activities/air-travel", json=payload)
+    assert response.status_code == 201
+    assert float(response.json()["distance_km"]) == 160.93
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_electricity_activities(test_async_client):
+    """Test bulk creating electricity activities."""
+    payload = [
+        {"date": "2025-01-15", "country": "United Kingdom", "usage_kwh": "1250.5"},
+        {
+            "date": "2025-02-15",
+            "country": "France",
+            "usage_kwh": "980",
+            "raw_data": {"row": 2},
+        },
+    ]
+
+    response = await test_async_client.post(
+        "/api/v1/activities/electricity/bulk", json=payload
+    )
+    assert response.status_code == 201
+
+    data = response.json()
+    assert data["created"] == 2
+    assert len(data["ids"]) == 2
+
+    response = await test_async_client.get("/api/v1/activities/electricity")
+    activities = {a["id"]: a for a in response.json()}
+    assert set(activities) == set(data["ids"])
+    assert activities[data["ids"][1]]["raw_data"] == {"row": 2}
+    assert activities[data["ids"][0]]["activity_type"] == ActivityType.ELECTRICITY
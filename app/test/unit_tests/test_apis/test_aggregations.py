@@ -0,0 +1,141 @@
+"""
+API tests for aggregations endpoint following kkb_fastapi pattern.
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import select
+
+from app.database.schemas import EmissionSummaryDBModel
+from app.test.factory.emission_factor import ElectricityEmissionFactorFactory
+from app.test.factory.emission_result import ElectricityEmissionResultFactory
+
+
+@pytest.mark.asyncio
+async def test_aggregate_daily(test_async_client):
+    """Test daily aggregation returns the created summaries."""
+    factor = await ElectricityEmissionFactorFactory()
+    await ElectricityEmissionResultFactory(
+        emission_factor_id=factor.id, calculation_date=date(2025, 1, 15)
+    )
+
+    response = await test_async_client.post(
+        "/api/v1/aggregations/daily", params={"target_date": "2025-01-15"}
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["success"] is True
+    assert data["summaries_created"] == len(data["summaries"]) > 0
+    assert all(s["summary_type"] == "daily" for s in data["summaries"])
+    assert all(s["from_date"] == "2025-01-15" for s in data["summaries"])
+
+
+async def _backfilled_summaries(response, test_async_client, session):
+    """Check the accepted backfill job succeeded and return the stored summaries."""
+    assert response.status_code == 202
+    job = response.json()
+
+    # ASGITransport returns once background tasks have run
+    response = await test_async_client.get(f"/api/v1/aggregations/jobs/{job['id']}")
+    assert response.status_code == 200
+    job = response.json()
+    assert job["status"] == "succeeded"
+
+    summaries = (await session.scalars(select(EmissionSummaryDBModel))).all()
+    assert job["summaries_created"] == len(summaries)
+    return summaries
+
+
+@pytest.mark.asyncio
+async def test_backfill_daily_summaries(test_async_client, test_db_session):
+    """Test backfilling daily summaries over a date range."""
+    factor = await ElectricityEmissionFactorFactory()
+    for day in (1, 3):
+        await ElectricityEmissionResultFactory(
+            emission_factor_id=factor.id, calculation_date=date(2025, 1, day)
+        )
+
+    response = await test_async_client.post(
+        "/api/v1/aggregations/backfill",
+        params={"from_date": "2025-01-01", "to_date": "2025-01-03"},
+    )
+    summaries = await _backfilled_summaries(response, test_async_client, test_db_session)
+
+    assert {s.from_date for s in summaries} == {date(2025, 1, 1), date(2025, 1, 3)}
+
+
+@pytest.mark.asyncio
+async def test_backfill_monthly_summaries(test_async_client, test_db_session):
+    """Test backfilling monthly summaries across a year boundary."""
+    factor = await ElectricityEmissionFactorFactory()
+    for calculation_date in (date(2024, 12, 10), date(2025, 2, 10)):
+        await ElectricityEmissionResultFactory(
+            emission_factor_id=factor.id, calculation_date=calculation_date
+        )
+
+    response = await test_async_client.post(
+        "/api/v1/aggregations/backfill",
+        params={
+            "from_date": "2024-12-01",
+            "to_date": "2025-02-28",
+            "aggregation_type": "monthly",
+        },
+    )
+    summaries = await _backfilled_summaries(response, test_async_client, test_db_session)
+
+    assert {s.from_date for s in summaries} == {date(2024, 12, 1), date(2025, 2, 1)}
+    assert {s.to_date for s in summaries} == {date(2024, 12, 31), date(2025, 2, 28)}
+    # Overall, scope 2 and electricity summaries for each month
+    assert len(summaries) == 6
+    assert {(s.scope, s.activity_type) for s in summaries} == {
+        (None, None),
+        (2, None),
+        (None, "Electricity"),
+    }
+
+
+@pytest.mark.asyncio
+async def test_backfill_invalid_aggregation_type(test_async_client):
+    """Test backfill rejects unknown aggregation types."""
+    response = await test_async_client.post(
+        "/api/v1/aggregations/backfill",
+        params={
+            "from_date": "2025-01-01",
+            "to_date": "2025-01-31",
+            "aggregation_type": "weekly",
+        },
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_aggregation_job_not_found(test_async_client):
+    """Test polling an unknown aggregation job returns 404."""
+    response = await test_async_client.get(
+        "/api/v1/aggregations/jobs/00000000-0000-0000-0000-000000000000"
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_aggregate_custom_range_with_filters(test_async_client):
+    """Test custom aggregation applies the requested scope filter."""
+    factor = await ElectricityEmissionFactorFactory()
+    await ElectricityEmissionResultFactory(
+        emission_factor_id=factor.id, calculation_date=date(2025, 1, 15)
+    )
+
+    payload = {
+        "aggregation_type": "custom",
+        "from_date": "2025-01-01",
+        "to_date": "2025-01-31",
+        "scope": 3,
+    }
+    response = await test_async_client.post("/api/v1/aggregations/custom", json=payload)
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["scope"] == 3
+    assert data["activity_count"] == 0
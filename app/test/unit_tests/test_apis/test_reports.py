@@ -2,6 +2,8 @@
 API tests for reports endpoint following kkb_fastapi pattern.
 """
 
+import json
+
 import pytest
 
 from app.test.factory.activity import (
@@ -130,6 +132,27 @@ async def test_report_scope_2_emissions(test_async_client):
     assert float(summary["scope_3_tonnes"]) == 0
 
 
+@pytest.mark.asyncio
+async def test_report_scope_2_with_category_is_empty(test_async_client):
+    """Test that a Scope 3 category filter on Scope 2 returns an empty report."""
+    await ElectricityEmissionFactorFactory(
+        lookup_identifier="Test Country 0", co2e_factor=0.3
+    )
+    activity = await ElectricityActivityFactory(usage_kwh=1000.0)
+    payload = {"activity_ids": [str(activity.id)], "recalculate": False}
+    await test_async_client.post("/api/v1/calculations/calculate", json=payload)
+
+    response = await test_async_client.get(
+        "/api/v1/reports/emissions", params={"scope": 2, "category": 1}
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["results"] == []
+    assert float(data["summary"]["total_co2e_tonnes"]) == 0
+    assert data["summary"]["total_activities"] == 0
+
+
 @pytest.mark.asyncio
 async def test_report_scope_3_emissions(test_async_client):
     """Test that report correctly aggregates Scope 3 emissions."""
@@ -231,3 +254,150 @@ async def test_report_includes_calculation_date(test_async_client):
 
     data = response.json()
     assert "calculation_date" in data["summary"]
+
+
+@pytest.mark.asyncio
+async def test_report_results_are_paginated(test_async_client):
+    """Test paging through report results."""
+    await ElectricityEmissionFactorFactory(
+        lookup_identifier="United Kingdom", co2e_factor=0.3
+    )
+    activities = [
+        await ElectricityActivityFactory(country="United Kingdom", usage_kwh=kwh)
+        for kwh in (100.0, 200.0, 300.0)
+    ]
+
+    payload = {
+        "activity_ids": [str(activity.id) for activity in activities],
+        "recalculate": False,
+    }
+    await test_async_client.post("/api/v1/calculations/calculate", json=payload)
+
+    response = await test_async_client.get(
+        "/api/v1/reports/emissions/results?sort_by_co2e=desc&skip=1&limit=1"
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert len(data) == 1
+    assert float(data[0]["co2e_tonnes"]) == pytest.approx(0.06)
+
+    # The report itself only carries the requested page of results
+    response = await test_async_client.get("/api/v1/reports/emissions?limit=2")
+    data = response.json()
+    assert len(data["results"]) == 2
+    assert data["summary"]["total_activities"] == 3
+
+
+@pytest.mark.asyncio
+async def test_report_totals_follow_recalculation(test_async_client):
+    """Test that report totals stay correct when results are replaced."""
+    await ElectricityEmissionFactorFactory(
+        lookup_identifier="United Kingdom", co2e_factor=0.3
+    )
+    await GoodsServicesEmissionFactorFactory(
+        lookup_identifier="Office Supplies", co2e_factor=0.5
+    )
+    activity1 = await ElectricityActivityFactory(
+        country="United Kingdom", usage_kwh=1000.0
+    )
+    activity2 = await GoodsServicesActivityFactory(
+        supplier_category="Office Supplies", spend_gbp=1000.0
+    )
+
+    payload = {
+        "activity_ids": [str(activity1.id), str(activity2.id)],
+        "recalculate": False,
+    }
+    await test_async_client.post("/api/v1/calculations/calculate", json=payload)
+    payload["recalculate"] = True
+    await test_async_client.post("/api/v1/calculations/calculate", json=payload)
+
+    response = await test_async_client.get("/api/v1/reports/emissions")
+    summary = response.json()["summary"]
+    assert summary["total_activities"] == 2
+    assert float(summary["total_co2e_tonnes"]) == pytest.approx(0.8)
+
+    response = await test_async_client.get(
+        "/api/v1/reports/emissions?activity=Purchased Goods and Services"
+    )
+    data = response.json()
+    assert data["summary"]["total_activities"] == 1
+    assert float(data["summary"]["scope_3_category_1_tonnes"]) == pytest.approx(0.5)
+    assert list(data["breakdown_by_activity_type"]) == ["goods_services"]
+
+
+@pytest.mark.asyncio
+async def test_report_response_is_compressed(test_async_client):
+    """Test large reports are gzip-encoded and marked cacheable."""
+    await ElectricityEmissionFactorFactory(
+        lookup_identifier="United Kingdom", co2e_factor=0.3
+    )
+    activities = [
+        await ElectricityActivityFactory(country="United Kingdom", usage_kwh=kwh)
+        for kwh in (100.0, 200.0, 300.0, 400.0, 500.0)
+    ]
+
+    payload = {
+        "activity_ids": [str(activity.id) for activity in activities],
+        "recalculate": False,
+    }
+    await test_async_client.post("/api/v1/calculations/calculate", json=payload)
+
+    response = await test_async_client.get(
+        "/api/v1/reports/emissions", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["cache-control"] == "private, max-age=30"
+    assert len(response.json()["results"]) == 5
+
+
+@pytest.mark.asyncio
+async def test_export_report_results(test_async_client):
+    """Test exporting all report results as newline-delimited JSON."""
+    await ElectricityEmissionFactorFactory(
+        lookup_identifier="United Kingdom", co2e_factor=0.3
+    )
+    activities = [
+        await ElectricityActivityFactory(country="United Kingdom", usage_kwh=kwh)
+        for kwh in (100.0, 200.0, 300.0)
+    ]
+
+    payload = {
+        "activity_ids": [str(activity.id) for activity in activities],
+        "recalculate": False,
+    }
+    await test_async_client.post("/api/v1/calculations/calculate", json=payload)
+
+    response = await test_async_client.get(
+        "/api/v1/reports/emissions/results/export?sort_by_co2e=asc"
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert [float(r["co2e_tonnes"]) for r in results] == pytest.approx([0.03, 0.06, 0.09])
+    assert {r["activity_id"] for r in results} == {str(a.id) for a in activities}
+
+
+@pytest.mark.asyncio
+async def test_report_cache_is_cleared_by_calculations(test_async_client):
+    """Test a cached report is replaced once new results are calculated."""
+    await ElectricityEmissionFactorFactory(
+        lookup_identifier="United Kingdom", co2e_factor=0.3
+    )
+    activity = await ElectricityActivityFactory(
+        country="United Kingdom", usage_kwh=1000.0
+    )
+
+    response = await test_async_client.get("/api/v1/reports/emissions")
+    assert response.json()["summary"]["total_activities"] == 0
+
+    payload = {"activity_ids": [str(activity.id)], "recalculate": False}
+    await test_async_client.post("/api/v1/calculations/calculate", json=payload)
+
+    response = await test_async_client.get("/api/v1/reports/emissions")
+    summary = response.json()["summary"]
+    assert summary["total_activities"] == 1
+    assert float(summary["total_co2e_tonnes"]) == pytest.approx(0.3)
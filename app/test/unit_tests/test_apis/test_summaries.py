@@ -0,0 +1,59 @@
+"""
+API tests for summaries endpoint following kkb_fastapi pattern.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.database.schemas import EmissionSummaryDBModel
+from app.utils.constants import SummaryType
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path", ["/", "/total", "/breakdown?breakdown_by=scope"])
+async def test_summaries_reject_inverted_date_range(test_async_client, path):
+    """Test every date-range endpoint rejects from_date after to_date."""
+    separator = "&" if "?" in path else "?"
+    response = await test_async_client.get(
+        f"/api/v1/summaries{path}{separator}from_date=2025-02-01&to_date=2025-01-01"
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "from_date must be before or equal to to_date"
+
+
+@pytest.mark.asyncio
+async def test_total_emissions_without_summaries(test_async_client):
+    """Test totals over a range without summaries are zero."""
+    response = await test_async_client.get(
+        "/api/v1/summaries/total?from_date=2025-01-01&to_date=2025-01-31"
+    )
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["from_date"] == "2025-01-01"
+    assert data["total_activities"] == 0
+    assert data["summaries_aggregated"] == 0
+
+
+@pytest.mark.asyncio
+async def test_monthly_summaries_stay_within_month(test_async_client, test_db_session):
+    """Test a month's summaries exclude the first day of the next month."""
+    test_db_session.add_all(
+        [
+            EmissionSummaryDBModel(
+                from_date=day,
+                to_date=day,
+                total_co2e_tonnes=Decimal("1"),
+                activity_count=1,
+                summary_type=SummaryType.DAILY,
+            )
+            for day in (date(2025, 1, 31), date(2025, 2, 1))
+        ]
+    )
+    await test_db_session.commit()
+
+    response = await test_async_client.get("/api/v1/summaries/monthly/2025/1")
+    assert response.status_code == 200
+    assert [summary["to_date"] for summary in response.json()] == ["2025-01-31"]
@@ -0,0 +1,96 @@
+"""
+Service tests for the emission aggregator following kkb_fastapi pattern.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+
+from app.database.repositories.emission_summary import EmissionSummaryRepository
+from app.database.schemas import EmissionSummaryDBModel
+from app.services.aggregators.emission_aggregator import EmissionAggregator
+from app.test.factory.emission_factor import ElectricityEmissionFactorFactory
+from app.test.factory.emission_result import ElectricityEmissionResultFactory
+
+
+@pytest.mark.asyncio
+async def test_aggregate_daily_summaries_upserts(test_db_session):
+    """Re-running an aggregation updates summaries instead of duplicating them."""
+    target_date = date(2025, 1, 15)
+    factor = await ElectricityEmissionFactorFactory()
+    await ElectricityEmissionResultFactory(
+        emission_factor_id=factor.id, calculation_date=target_date
+    )
+
+    aggregator = EmissionAggregator(test_db_session)
+    first = await aggregator.aggregate_daily_summaries(target_date)
+
+    await ElectricityEmissionResultFactory(
+        emission_factor_id=factor.id, calculation_date=target_date
+    )
+    second = await aggregator.aggregate_daily_summaries(target_date)
+
+    assert len(first) == len(second)
+
+    count = await test_db_session.scalar(
+        select(func.count()).select_from(EmissionSummaryDBModel)
+    )
+    assert count == len(second)
+
+    overall = next(
+        s for s in second if s.scope is None and s.category is None and s.activity_type is None
+    )
+    assert overall.total_co2e_tonnes == Decimal("0.6")
+    assert overall.activity_count == 2
+
+
+@pytest.mark.asyncio
+async def test_summaries_by_date_range_returns_contained_periods(test_db_session):
+    """Only summaries whose whole period lies inside the range are returned."""
+    factor = await ElectricityEmissionFactorFactory()
+    await ElectricityEmissionResultFactory(
+        emission_factor_id=factor.id, calculation_date=date(2025, 1, 15)
+    )
+
+    aggregator = EmissionAggregator(test_db_session)
+    daily = await aggregator.aggregate_daily_summaries(date(2025, 1, 15))
+    await aggregator.aggregate_monthly_summaries(2025, 1)
+
+    repo = EmissionSummaryRepository(test_db_session)
+    within_week = await repo.get_by_date_range(date(2025, 1, 13), date(2025, 1, 19))
+    assert {s.id for s in within_week} == {s.id for s in daily}
+
+    whole_month = await repo.get_by_date_range(date(2025, 1, 1), date(2025, 1, 31))
+    assert {s.summary_type for s in whole_month} == {"daily", "monthly"}
+
+
+@pytest.mark.asyncio
+async def test_summary_sums_match_loaded_summaries(test_db_session):
+    """Database-side totals agree with summing the summaries in Python."""
+    factor = await ElectricityEmissionFactorFactory()
+    for day in (15, 16):
+        await ElectricityEmissionResultFactory(
+            emission_factor_id=factor.id, calculation_date=date(2025, 1, day)
+        )
+
+    aggregator = EmissionAggregator(test_db_session)
+    for day in (15, 16):
+        await aggregator.aggregate_daily_summaries(date(2025, 1, day))
+
+    repo = EmissionSummaryRepository(test_db_session)
+    summaries = await repo.get_by_date_range(date(2025, 1, 1), date(2025, 1, 31), scope=2)
+    totals = await repo.sum_by_date_range(date(2025, 1, 1), date(2025, 1, 31), scope=2)
+    assert totals.total_co2e_tonnes == sum(s.total_co2e_tonnes for s in summaries)
+    assert totals.activity_count == sum(s.activity_count for s in summaries)
+    assert totals.summary_count == len(summaries) > 0
+
+    by_scope = await repo.sum_by_dimension(date(2025, 1, 1), date(2025, 1, 31), "scope")
+    expected = {}
+    for summary in await repo.get_by_date_range(date(2025, 1, 1), date(2025, 1, 31)):
+        expected[summary.scope] = expected.get(summary.scope, 0) + summary.activity_count
+    assert {row.value: row.activity_count for row in by_scope} == expected
+
+    empty = await repo.sum_by_date_range(date(2024, 1, 1), date(2024, 1, 31))
+    assert (empty.total_co2e_tonnes, empty.activity_count, empty.summary_count) == (0, 0, 0)
@@ -2,10 +2,12 @@
 Service tests for emission calculators following kkb_fastapi pattern.
 """
 
+from datetime import datetime, timezone
 from decimal import Decimal
 
 import pytest
 
+from app.database.repositories import EmissionResultRepository
 from app.services.calculators.electricity_calculator import ElectricityCalculator
 from app.services.calculators.emission_calculator import EmissionCalculationService
 from app.services.calculators.goods_services_calculator import GoodsServicesCalculator
@@ -20,6 +22,7 @@ from app.test.factory.emission_factor import (
     ElectricityEmissionFactorFactory,
     GoodsServicesEmissionFactorFactory,
 )
+from app.test.factory.emission_result import ElectricityEmissionResultFactory
 
 
 @pytest.mark.asyncio
@@ -125,6 +128,170 @@ async def test_emission_calculation_service_batch(test_db_session):
     assert len(summary["results"]) == 2
 
 
+@pytest.mark.asyncio
+async def test_emission_calculation_service_many(test_db_session):
+    """Test EmissionCalculationService calculate_many method."""
+    # Create factors
+    await ElectricityEmissionFactorFactory(
+        lookup_identifier="United Kingdom", co2e_factor=0.3
+    )
+    await GoodsServicesEmissionFactorFactory(
+        lookup_identifier="Office Supplies", co2e_factor=0.5
+    )
+
+    # Create activities, one without a matching factor
+    activity1 = await ElectricityActivityFactory(
+        country="United Kingdom", usage_kwh=1000.0
+    )
+    activity2 = await GoodsServicesActivityFactory(
+        supplier_category="Office Supplies", spend_gbp=1000.0
+    )
+    activity3 = await ElectricityActivityFactory(country="Nonexistent Country")
+
+    service = EmissionCalculationService(test_db_session)
+    results = await service.calculate_many([activity1, activity2, activity3])
+
+    assert [result.activity_id for result in results] == [activity1.id, activity2.id]
+    assert results[0].co2e_tonnes == Decimal("0.3")
+    assert results[1].co2e_tonnes == Decimal("0.5")
+    assert results[0].calculation_metadata["matched_country"] == "United Kingdom"
+
+    # Existing results are returned instead of calculated again
+    again = await service.calculate_many([activity2, activity1])
+    assert [result.id for result in again] == [results[1].id, results[0].id]
+
+
+@pytest.mark.asyncio
+async def test_result_totals_by_scope(test_db_session):
+    """Test that result totals read from the rollups match the calculations."""
+    await ElectricityEmissionFactorFactory(
+        lookup_identifier="United Kingdom", co2e_factor=0.3
+    )
+    await GoodsServicesEmissionFactorFactory(
+        lookup_identifier="Office Supplies", co2e_factor=0.5
+    )
+    activities = [
+        await ElectricityActivityFactory(country="United Kingdom", usage_kwh=1000.0),
+        await GoodsServicesActivityFactory(
+            supplier_category="Office Supplies", spend_gbp=1000.0
+        ),
+    ]
+
+    service = EmissionCalculationService(test_db_session)
+    await service.calculate_many(activities)
+
+    repo = EmissionResultRepository(test_db_session)
+    assert await repo.get_total_emissions() == pytest.approx(0.8)
+    assert await repo.get_emissions_by_scope() == pytest.approx(
+        {"scope_2": 0.3, "scope_3": 0.5}
+    )
+
+
+@pytest.mark.asyncio
+async def test_results_for_activity(test_db_session):
+    """Test counting and checking results for a single activity."""
+    await ElectricityEmissionFactorFactory(
+        lookup_identifier="United Kingdom", co2e_factor=0.3
+    )
+    activity = await ElectricityActivityFactory(country="United Kingdom")
+    other = await ElectricityActivityFactory(country="United Kingdom")
+
+    service = EmissionCalculationService(test_db_session)
+    await service.calculate_many([activity])
+
+    repo = EmissionResultRepository(test_db_session)
+    assert await repo.count_results_for_activity(activity.id) == 1
+    assert await repo.has_results_for_activity(activity.id) is True
+    assert await repo.count_results_for_activity(other.id) == 0
+    assert await repo.has_results_for_activity(other.id) is False
+
+
+@pytest.mark.asyncio
+async def test_calculate_many_returns_latest_existing_result(test_db_session):
+    """Test that calculate_many returns each activity's most recent result."""
+    factor = await ElectricityEmissionFactorFactory(
+        lookup_identifier="United Kingdom", co2e_factor=0.3
+    )
+    activity = await ElectricityActivityFactory(country="United Kingdom")
+    older = await ElectricityEmissionResultFactory(
+        activity_id=activity.id,
+        emission_factor_id=factor.id,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+    newer = await ElectricityEmissionResultFactory(
+        activity_id=activity.id,
+        emission_factor_id=factor.id,
+        created_at=datetime(2025, 6, 1, tzinfo=timezone.utc),
+    )
+
+    service = EmissionCalculationService(test_db_session)
+    results = await service.calculate_many([activity])
+
+    assert [result.id for result in results] == [newer.id]
+    assert older.id != newer.id
+
+
+@pytest.mark.asyncio
+async def test_results_keyset_pages(test_db_session):
+    """Test that keyset pages cover every result once, ties included."""
+    factor = await ElectricityEmissionFactorFactory(
+        lookup_identifier="United Kingdom", co2e_factor=0.3
+    )
+    activity = await ElectricityActivityFactory(country="United Kingdom")
+    created = [
+        await ElectricityEmissionResultFactory(
+            activity_id=activity.id,
+            emission_factor_id=factor.id,
+            created_at=datetime(2025, 1, 1 + index // 2, tzinfo=timezone.utc),
+        )
+        for index in range(5)
+    ]
+
+    repo = EmissionResultRepository(test_db_session)
+    seen = []
+    page = await repo.get_all_results(limit=2)
+    while page:
+        seen.extend(page)
+        page = await repo.get_all_results(
+            after_created_at=page[-1].created_at, after_id=page[-1].id, limit=2
+        )
+
+    assert sorted(result.id for result in seen) == sorted(r.id for r in created)
+    assert [r.created_at for r in seen] == sorted(
+        (r.created_at for r in created), reverse=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_result_rows_by_date_range(test_db_session):
+    """Test reading results within a date range as plain rows."""
+    factor = await ElectricityEmissionFactorFactory(
+        lookup_identifier="United Kingdom", co2e_factor=0.3
+    )
+    activity = await ElectricityActivityFactory(country="United Kingdom")
+    results = [
+        await ElectricityEmissionResultFactory(
+            activity_id=activity.id,
+            emission_factor_id=factor.id,
+            created_at=datetime(2025, month, 1, tzinfo=timezone.utc),
+        )
+        for month in (1, 2, 3)
+    ]
+
+    repo = EmissionResultRepository(test_db_session)
+    rows = await repo.get_result_rows_by_date_range(
+        datetime(2025, 2, 1, tzinfo=timezone.utc),
+        datetime(2025, 3, 31, tzinfo=timezone.utc),
+    )
+
+    assert [row.id for row in rows] == [results[2].id, results[1].id]
+    assert rows[0].activity_id == activity.id
+    assert rows[0].co2e_tonnes == results[2].co2e_tonnes
+    assert [row.id for row in await repo.get_latest_result_rows(limit=1)] == [
+        results[2].id
+    ]
+
+
 @pytest.mark.asyncio
 async def test_calculator_no_matching_factor(test_db_session):
     """Test calculator behavior when no matching emission factor exists."""
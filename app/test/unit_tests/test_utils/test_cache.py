@@ -0,0 +1,40 @@
+"""
+Tests for the in-process TTL cache following kkb_fastapi pattern.
+"""
+
+from app.utils import cache as cache_module
+from app.utils.cache import TTLCache
+
+
+def test_ttl_cache_returns_stored_value():
+    """Stored values are returned until they expire."""
+    cache = TTLCache(ttl=60)
+    cache.set("key", [1, 2])
+
+    assert cache.get("key") == [1, 2]
+    assert cache.get("missing") is None
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    """Entries older than the TTL are dropped."""
+    now = 1000.0
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now)
+    cache = TTLCache(ttl=5)
+    cache.set("key", "value")
+
+    now = 1006.0
+
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_oldest_when_full():
+    """The least recently stored entry is evicted beyond maxsize."""
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
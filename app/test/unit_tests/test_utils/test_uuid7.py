@@ -0,0 +1,25 @@
+"""
+Tests for UUIDv7 generation following kkb_fastapi pattern.
+"""
+
+import time
+import uuid
+
+from app.utils.uuid7 import uuid7
+
+
+def test_uuid7_version_and_variant():
+    """Generated ids are RFC 9562 version 7 UUIDs."""
+    value = uuid7()
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_is_time_ordered():
+    """Ids generated in later milliseconds sort after earlier ones."""
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+
+    assert first < second
@@ -0,0 +1,75 @@
+"""
+In-process TTL cache.
+
+For slowly-changing reference data read on hot paths: a hit is a dict
+lookup instead of a database round trip. Entries live in the worker process,
+so each worker caches independently and sees external writes once the TTL
+has passed.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded mapping whose entries expire after a fixed time-to-live.
+
+    When full, the least recently stored entry is evicted. Not thread-safe;
+    meant to be used from a single event loop.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Seconds an entry stays valid
+            maxsize: Maximum number of entries kept
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Returned when the key is missing or expired
+
+        Returns:
+            Cached value, or default
+        """
+        expires_at, value = self._entries.get(key, (0.0, _MISSING))
+        if value is _MISSING:
+            return default
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value for the cache's TTL.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
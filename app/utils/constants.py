@@ -18,6 +18,37 @@ class ActivityType:
     GOODS_SERVICES = "Purchased Goods and Services"
 
 
+class ActivityKind:
+    """Compact activity type codes stored in emission_results.activity_kind."""
+    ELECTRICITY = 1
+    AIR_TRAVEL = 2
+    GOODS_SERVICES = 3
+
+
+ACTIVITY_KIND_BY_TYPE = {
+    ActivityType.ELECTRICITY: ActivityKind.ELECTRICITY,
+    ActivityType.AIR_TRAVEL: ActivityKind.AIR_TRAVEL,
+    ActivityType.GOODS_SERVICES: ActivityKind.GOODS_SERVICES,
+}
+
+
+class SummaryType:
+    """Emission summary period types."""
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+    YEARLY = "yearly"
+    CUSTOM = "custom"
+
+
+class JobStatus:
+    """Aggregation job states."""
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
 class ActivityTypeEnum(str, Enum):
     """Activity type enum for API parameters."""
     ELECTRICITY = "Electricity"